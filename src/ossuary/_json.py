@@ -0,0 +1,42 @@
+"""JSON encoding and decoding, with ``orjson`` for decoding when installed.
+
+``orjson`` comes with the ``batch`` extra and is resolved once, at
+import. :func:`loads` uses it when present and returns the same values
+as ``json.loads`` either way. :func:`dumps` always uses ``json``:
+``orjson``'s encoder handles ``NaN``, non-``str`` keys and ``datetime``
+differently, and the output is persisted.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def loads(data: bytes | str):
+    """Decode one JSON document.
+
+    ``orjson`` rejects the ``NaN`` / ``Infinity`` tokens that
+    ``json.dumps`` writes by default; such documents fall back to
+    ``json.loads``. ``orjson.JSONDecodeError`` subclasses
+    ``json.JSONDecodeError``, so callers catch one exception type.
+    """
+    if orjson is None:
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def dumps(value) -> str:
+    """Encode ``value`` as a JSON string.
+
+    Always the standard ``json`` encoder. ``orjson`` writes ``NaN`` as
+    ``null`` and accepts values ``json`` rejects (``datetime``, for
+    one); what this returns is persisted, so it must not depend on which
+    extras are installed.
+    """
+    return json.dumps(value)
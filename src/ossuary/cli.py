@@ -1,8 +1,10 @@
 """Command-line interface for ossuary."""
 
 import asyncio
+import functools
 import json
 import os
+import re
 import sys
 from datetime import datetime
 from typing import Optional
@@ -10,6 +12,7 @@ from typing import Optional
 from dotenv import load_dotenv
 load_dotenv()
 
+import httpx
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -17,6 +20,7 @@ from rich.table import Table
 
 from ossuary import __version__
 from ossuary._compat import utcnow_naive
+from ossuary._json import loads as json_loads
 from ossuary.db.session import init_db
 from ossuary.scoring.factors import RiskLevel
 
@@ -1348,6 +1352,7 @@ def deps(
     max_depth: int = typer.Option(6, "--depth", help="Max dependency depth"),
     max_packages: int = typer.Option(80, "--max", help="Max packages to include"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Refetch dependency manifests instead of using cached ones"),
 ):
     """Show the dependency tree of a package with risk scores.
 
@@ -1359,7 +1364,7 @@ def deps(
         raise typer.Exit(1)
 
     console.print(f"[bold]Fetching dependency tree for {package} ({ecosystem})...[/bold]")
-    adj = _fetch_dep_tree(package, ecosystem, max_depth, max_packages)
+    adj = _fetch_dep_tree(package, ecosystem, max_depth, max_packages, use_cache=not no_cache)
     if not adj:
         console.print(f"[red]Could not fetch dependencies for {package}[/red]")
         raise typer.Exit(1)
@@ -1477,6 +1482,7 @@ def score_deps(
     ecosystem: str = typer.Option("npm", "-e", "--ecosystem", help="Package ecosystem (npm or pypi)"),
     max_depth: int = typer.Option(6, "--depth", help="Max dependency depth"),
     max_packages: int = typer.Option(80, "--max", help="Max packages to include"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Refetch dependency manifests instead of using cached ones"),
 ):
     """Score all packages in a dependency tree.
 
@@ -1492,7 +1498,7 @@ def score_deps(
         console.print("[yellow]Set it: export GITHUB_TOKEN=ghp_your_token[/yellow]\n")
 
     console.print(f"[bold]Fetching dependency tree for {package} ({ecosystem})...[/bold]")
-    adj = _fetch_dep_tree(package, ecosystem, max_depth, max_packages)
+    adj = _fetch_dep_tree(package, ecosystem, max_depth, max_packages, use_cache=not no_cache)
     if not adj:
         console.print(f"[red]Could not fetch dependencies for {package}[/red]")
         raise typer.Exit(1)
@@ -2055,6 +2061,7 @@ def xkcd_tree(
     tower: bool = typer.Option(False, "--tower", help="Render as Jenga tower instead of tree graph"),
     title: Optional[str] = typer.Option(None, "-t", "--title"),
     max_width: int = typer.Option(1200, "--width", help="SVG width in pixels"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Refetch dependency manifests instead of using cached ones"),
 ):
     """Generate a dependency tree diagram (xkcd-2347 style).
 
@@ -2071,7 +2078,7 @@ def xkcd_tree(
 
     console.print(f"[bold]Fetching dependency tree for {package} ({ecosystem})...[/bold]")
 
-    adj = _fetch_dep_tree(package, ecosystem, max_depth, max_packages)
+    adj = _fetch_dep_tree(package, ecosystem, max_depth, max_packages, use_cache=not no_cache)
     if not adj:
         console.print(f"[red]Could not fetch dependencies for {package}[/red]")
         raise typer.Exit(1)
@@ -2090,93 +2097,130 @@ def xkcd_tree(
 
 _DEP_ECOSYSTEMS = ("npm", "pypi", "cargo", "rubygems", "go", "packagist", "nuget", "github")
 
+# PyPI ``requires_dist`` entries: the leading distribution name, and the
+# ``extra ==`` marker that makes an entry extras-only.
+_REQUIRES_DIST_NAME_RE = re.compile(r'^([A-Za-z0-9]([A-Za-z0-9._-]*[A-Za-z0-9])?)')
+_REQUIRES_DIST_EXTRA_RE = re.compile(r'extra ?==')
 
-def _fetch_dep_tree(package, ecosystem, max_depth, max_packages):
-    """Fetch dependency tree from package registry (BFS, concurrent)."""
-    import re
+
+# Go module proxy: uppercase letters in module paths are escaped as
+# ``!`` + lowercase.
+_GO_UPPER_RE = re.compile(r'[A-Z]')
+
+
+@functools.lru_cache(maxsize=2048)
+def _requires_dist_name(entry: str) -> Optional[str]:
+    """Distribution name of a ``requires_dist`` entry, or ``None``.
+
+    ``None`` for extras-only entries and entries without a parseable
+    name. Cached: the same entries recur across many packages in a
+    dependency tree.
+    """
+    if _REQUIRES_DIST_EXTRA_RE.search(entry):
+        return None
+    m = _REQUIRES_DIST_NAME_RE.match(entry)
+    return m.group(1) if m else None
+
+
+def _dep_tree_client() -> httpx.Client:
+    """HTTP client shared by the dep-tree fetch threads.
+
+    One keep-alive pool per run, so requests to the same registry reuse
+    connections instead of paying a TCP + TLS handshake per package.
+    Sized to the fetch thread pool.
+    """
+    return httpx.Client(
+        timeout=10,
+        follow_redirects=True,
+        headers={"User-Agent": "ossuary-risk/0.6 (https://github.com/anicka-net/ossuary-risk)"},
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    )
+
+
+def _fetch_dep_tree(package, ecosystem, max_depth, max_packages, use_cache=False):
+    """Fetch dependency tree from package registry (BFS, concurrent).
+
+    With ``use_cache`` dependency lists fetched within
+    ``MANIFEST_FRESHNESS_MINUTES`` are read from the database instead of
+    the registry, and fresh fetches are written back. The cache is best-effort: without a usable
+    database every package is fetched.
+
+    Each fetcher returns ``(name, deps)``, with ``deps=None`` when the
+    fetch failed; such packages become leaves and are not cached.
+    """
     import urllib.parse
-    import urllib.request
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    ua = "ossuary-risk/0.6 (https://github.com/anicka-net/ossuary-risk)"
-
     adj = {}
     to_fetch = {package: 0}
+    client = _dep_tree_client()
+    json_headers = {"Accept": "application/json"}
+
+    def get(url, headers=None, timeout=10):
+        resp = client.get(url, headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return resp.content
+
+    def get_json(url, headers=json_headers, timeout=10):
+        return json_loads(get(url, headers, timeout))
 
     def fetch_npm(name):
         try:
             url = f"https://registry.npmjs.org/{urllib.parse.quote(name, safe='@/')}/latest"
-            req = urllib.request.Request(url, headers={"Accept": "application/json", "User-Agent": ua})
-            resp = urllib.request.urlopen(req, timeout=10)
-            data = json.loads(resp.read())
+            data = get_json(url)
             return name, list(data.get("dependencies", {}).keys())
         except Exception:
-            return name, []
+            return name, None
 
     def fetch_pypi(name):
         try:
             url = f"https://pypi.org/pypi/{urllib.parse.quote(name, safe='')}/json"
-            req = urllib.request.Request(url, headers={"Accept": "application/json", "User-Agent": ua})
-            resp = urllib.request.urlopen(req, timeout=10)
-            data = json.loads(resp.read())
+            data = get_json(url)
             requires = data.get("info", {}).get("requires_dist") or []
-            deps = []
-            for r in requires:
-                # Skip extras-only dependencies
-                if "extra ==" in r or "extra==" in r:
-                    continue
-                m = re.match(r'^([A-Za-z0-9]([A-Za-z0-9._-]*[A-Za-z0-9])?)', r)
-                if m:
-                    deps.append(m.group(1))
+            deps = [dep for dep in map(_requires_dist_name, requires) if dep]
             return name, deps
         except Exception:
-            return name, []
+            return name, None
 
     def fetch_cargo(name):
         try:
             # First get latest version
             url = f"https://crates.io/api/v1/crates/{urllib.parse.quote(name, safe='')}"
-            req = urllib.request.Request(url, headers={"User-Agent": ua, "Accept": "application/json"})
-            data = json.loads(urllib.request.urlopen(req, timeout=10).read())
+            data = get_json(url)
             ver = data["crate"]["newest_version"]
             # Then get deps for that version
             url2 = f"https://crates.io/api/v1/crates/{urllib.parse.quote(name, safe='')}/{ver}/dependencies"
-            req2 = urllib.request.Request(url2, headers={"User-Agent": ua, "Accept": "application/json"})
-            data2 = json.loads(urllib.request.urlopen(req2, timeout=10).read())
+            data2 = get_json(url2)
             deps = [d["crate_id"] for d in data2.get("dependencies", [])
                     if d.get("kind") == "normal" and not d.get("optional")]
             return name, deps
         except Exception:
-            return name, []
+            return name, None
 
     def fetch_rubygems(name):
         try:
             # Get latest version
             url = f"https://rubygems.org/api/v1/gems/{urllib.parse.quote(name, safe='')}.json"
-            req = urllib.request.Request(url, headers={"User-Agent": ua, "Accept": "application/json"})
-            data = json.loads(urllib.request.urlopen(req, timeout=10).read())
+            data = get_json(url)
             ver = data.get("version", "")
             # Get deps for that version
             url2 = f"https://rubygems.org/api/v2/rubygems/{urllib.parse.quote(name, safe='')}/versions/{ver}.json"
-            req2 = urllib.request.Request(url2, headers={"User-Agent": ua, "Accept": "application/json"})
-            data2 = json.loads(urllib.request.urlopen(req2, timeout=10).read())
+            data2 = get_json(url2)
             deps = [d["name"] for d in data2.get("dependencies", {}).get("runtime", [])]
             return name, deps
         except Exception:
-            return name, []
+            return name, None
 
     def fetch_go(name):
         try:
             # Escape uppercase letters per Go proxy convention
-            escaped = re.sub(r'[A-Z]', lambda m: '!' + m.group().lower(), name)
+            escaped = _GO_UPPER_RE.sub(lambda m: '!' + m.group().lower(), name)
             url = f"https://proxy.golang.org/{escaped}/@latest"
-            req = urllib.request.Request(url, headers={"User-Agent": ua})
-            data = json.loads(urllib.request.urlopen(req, timeout=10).read())
+            data = get_json(url, None)
             ver = data["Version"]
             # Fetch go.mod
             mod_url = f"https://proxy.golang.org/{escaped}/@v/{ver}.mod"
-            req2 = urllib.request.Request(mod_url, headers={"User-Agent": ua})
-            content = urllib.request.urlopen(req2, timeout=10).read().decode()
+            content = get(mod_url).decode()
             # Parse require block and single-line requires
             deps = []
             in_block = False
@@ -2188,23 +2232,22 @@ def _fetch_dep_tree(package, ecosystem, max_depth, max_packages):
                 if in_block and stripped == ")":
                     in_block = False
                     continue
+                # ``module version [// comment]`` inside a block,
+                # ``require module version`` on a single line.
+                parts = stripped.split()
                 if in_block:
-                    m = re.match(r'^(\S+)\s+\S+', stripped)
-                    if m:
-                        deps.append(m.group(1))
-                elif stripped.startswith("require "):
-                    m = re.match(r'^require\s+(\S+)\s+\S+', stripped)
-                    if m:
-                        deps.append(m.group(1))
+                    if len(parts) >= 2:
+                        deps.append(parts[0])
+                elif stripped.startswith("require ") and len(parts) >= 3:
+                    deps.append(parts[1])
             return name, deps
         except Exception:
-            return name, []
+            return name, None
 
     def fetch_packagist(name):
         try:
             url = f"https://repo.packagist.org/p2/{name.lower()}.json"
-            req = urllib.request.Request(url, headers={"User-Agent": ua, "Accept": "application/json"})
-            data = json.loads(urllib.request.urlopen(req, timeout=10).read())
+            data = get_json(url)
             versions = data.get("packages", {}).get(name.lower(), [])
             if not versions:
                 return name, []
@@ -2212,41 +2255,40 @@ def _fetch_dep_tree(package, ecosystem, max_depth, max_packages):
             deps = [k for k in latest.get("require", {}).keys() if "/" in k]
             return name, deps
         except Exception:
-            return name, []
+            return name, None
 
     def fetch_nuget(name):
         try:
             url = f"https://api.nuget.org/v3/registration5/{name.lower()}/index.json"
-            req = urllib.request.Request(url, headers={"User-Agent": ua, "Accept": "application/json"})
-            data = json.loads(urllib.request.urlopen(req, timeout=10).read())
+            data = get_json(url)
             # Get the last page (latest versions)
             last_page = data["items"][-1]
             items = last_page.get("items")
             if items is None:
-                page_req = urllib.request.Request(last_page["@id"], headers={"User-Agent": ua})
-                page_data = json.loads(urllib.request.urlopen(page_req, timeout=10).read())
+                page_data = get_json(last_page["@id"], None)
                 items = page_data["items"]
             # Get latest version's deps
             latest = items[-1]["catalogEntry"]
-            deps = set()
+            # Deduplicate across target frameworks, keeping first-seen order
+            # so the tree is the same from run to run.
+            deps = {}
             for group in latest.get("dependencyGroups", []):
                 for dep in group.get("dependencies", []):
-                    deps.add(dep["id"])
+                    deps[dep["id"]] = None
             return name, list(deps)
         except Exception:
-            return name, []
+            return name, None
 
     def fetch_github(name):
         """Fetch deps via GitHub SBOM API. Name must be owner/repo."""
         try:
             token = os.environ.get("GITHUB_TOKEN", "")
-            headers = {"User-Agent": ua, "Accept": "application/vnd.github+json",
+            headers = {"Accept": "application/vnd.github+json",
                        "X-GitHub-Api-Version": "2022-11-28"}
             if token:
                 headers["Authorization"] = f"Bearer {token}"
             url = f"https://api.github.com/repos/{name}/dependency-graph/sbom"
-            req = urllib.request.Request(url, headers=headers)
-            data = json.loads(urllib.request.urlopen(req, timeout=15).read())
+            data = get_json(url, headers, timeout=15)
             deps = []
             for pkg in data.get("sbom", {}).get("packages", [])[1:]:
                 pname = pkg.get("name", "")
@@ -2257,7 +2299,7 @@ def _fetch_dep_tree(package, ecosystem, max_depth, max_packages):
                     deps.append(pname)
             return name, deps
         except Exception:
-            return name, []
+            return name, None
 
     fetchers = {
         "npm": fetch_npm, "pypi": fetch_pypi, "cargo": fetch_cargo,
@@ -2266,25 +2308,81 @@ def _fetch_dep_tree(package, ecosystem, max_depth, max_packages):
     }
     fetcher = fetchers[ecosystem]
 
-    while to_fetch and len(adj) < max_packages:
-        batch = {n: d for n, d in to_fetch.items() if n not in adj}
-        if not batch:
-            break
+    cache_scope = None
+    if use_cache:
+        try:
+            from ossuary.db.session import init_db, session_scope
+            from ossuary.services.cache import ManifestCache
+            init_db()
+            cache_scope = session_scope
+        except Exception:
+            pass
 
-        new_to_fetch = {}
-        with ThreadPoolExecutor(max_workers=10) as pool:
-            futures = {pool.submit(fetcher, name): (name, depth) for name, depth in batch.items()}
-            for future in as_completed(futures):
-                name, depth = futures[future]
-                pkg_name, deps = future.result()
-                adj[pkg_name] = deps
-                console.print(f"  [{len(adj):3d}] {pkg_name} ({len(deps)} deps)", highlight=False)
-                if depth < max_depth:
-                    for dep in deps:
-                        if dep not in adj and dep not in new_to_fetch:
-                            new_to_fetch[dep] = depth + 1
-
-        to_fetch = new_to_fetch
+    def cached_manifests(names):
+        try:
+            with cache_scope() as session:
+                return ManifestCache(session).get_fresh(ecosystem, names)
+        except Exception:
+            return {}
+
+    def store_manifests(manifests):
+        try:
+            with cache_scope() as session:
+                ManifestCache(session).store(ecosystem, manifests)
+        except Exception:
+            pass
+
+    def record(pkg_name, deps, depth, new_to_fetch):
+        adj[pkg_name] = deps
+        console.print(f"  [{len(adj):3d}] {pkg_name} ({len(deps)} deps)", highlight=False)
+        if depth < max_depth:
+            for dep in deps:
+                if dep not in adj and dep not in new_to_fetch:
+                    new_to_fetch[dep] = depth + 1
+
+    with client:
+        while to_fetch and len(adj) < max_packages:
+            # Only as many packages as the cap still allows, in discovery
+            # order, so a wide frontier doesn't overshoot max_packages.
+            budget = max_packages - len(adj)
+            batch = {}
+            for n, d in to_fetch.items():
+                if n not in adj:
+                    batch[n] = d
+                    if len(batch) == budget:
+                        break
+            if not batch:
+                break
+
+            cached = cached_manifests(list(batch)) if cache_scope else {}
+            fetched = {}
+            failed = set()
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                futures = [
+                    pool.submit(fetcher, name) for name in batch if name not in cached
+                ]
+                for future in as_completed(futures):
+                    pkg_name, deps = future.result()
+                    if deps is None:
+                        failed.add(pkg_name)
+                    else:
+                        fetched[pkg_name] = deps
+
+            # Record in batch order, not completion order, so the next
+            # frontier (and what the budget trim keeps) doesn't depend
+            # on network latency.
+            new_to_fetch = {}
+            for name, depth in batch.items():
+                if name in cached:
+                    record(name, cached[name], depth, new_to_fetch)
+                elif name not in failed:
+                    record(name, fetched[name], depth, new_to_fetch)
+                else:
+                    record(name, [], depth, new_to_fetch)
+
+            if cache_scope and fetched:
+                store_manifests(fetched)
+            to_fetch = new_to_fetch
 
     return adj
 
@@ -2514,6 +2612,83 @@ def _generate_tree_svg(adj, root, ecosystem, output, title, max_width):
         f.write('\n'.join(svg))
 
 
+def _structural_threat(concentration, contributors, commits, lifetime_commits, n_dependents):
+    """Structural threat of one tower block; the arrow points at the maximum.
+
+    fragility × irreplaceability × tree impact, scaled by 100.
+    """
+    import math
+
+    # Fragility: concentration adjusted by contributor depth
+    # 1 contrib → full concentration risk
+    # 4 contribs → halved, 16 contribs → quartered
+    fragility = (concentration / 100) / math.sqrt(max(contributors, 1))
+    # Low recent activity amplifies fragility
+    if commits <= 1:
+        fragility = min(1.0, fragility * 1.5)
+    elif commits <= 5:
+        fragility = min(1.0, fragility * 1.2)
+
+    # Irreplaceability: accumulated code complexity (log-scale)
+    # log2(10)/12≈0.28, log2(300)/12≈0.69, log2(2000)/12≈0.92
+    irreplaceability = min(1.0, math.log2(max(lifetime_commits, 10)) / 12)
+
+    # Tree impact: how much breaks if it fails
+    tree_impact = 1 + n_dependents
+
+    return fragility * irreplaceability * tree_impact * 100
+
+
+def _longest_path_layers(adj, root):
+    """Layer of each package reachable from ``root``: its longest path length.
+
+    Works in O(V + E): a topological pass over the reachable subgraph
+    settles every package once, where re-walking a shared subtree for
+    each longer path found is exponential on stacked diamonds. Keys
+    come out in depth-first discovery order, which the tower uses to
+    order blocks within a row. Returns ``None`` if the reachable graph
+    has a cycle.
+    """
+    if root not in adj:
+        return {root: 0}
+    order = [root]
+    indegree = {root: 0}
+    stack = [iter(adj[root])]
+    while stack:
+        for dep in stack[-1]:
+            if dep not in adj:
+                continue
+            if dep in indegree:
+                indegree[dep] += 1
+                continue
+            indegree[dep] = 1
+            order.append(dep)
+            stack.append(iter(adj[dep]))
+            break
+        else:
+            stack.pop()
+    if indegree[root]:
+        return None
+
+    depth = dict.fromkeys(order, 0)
+    ready = [root]
+    settled = 0
+    while ready:
+        name = ready.pop()
+        settled += 1
+        for dep in adj[name]:
+            if dep not in adj:
+                continue
+            if depth[name] + 1 > depth[dep]:
+                depth[dep] = depth[name] + 1
+            indegree[dep] -= 1
+            if indegree[dep] == 0:
+                ready.append(dep)
+    if settled < len(order):
+        return None
+    return depth
+
+
 def _generate_tower_from_tree(adj, root, ecosystem, output, title, max_width):
     """Generate wide Jenga tower from real dependency graph.
 
@@ -2527,21 +2702,26 @@ def _generate_tower_from_tree(adj, root, ecosystem, output, title, max_width):
     from collections import deque
 
     # --- 1. Assign layers (shared packages pushed to deepest layer) ---
-    layer_map = {}
-
-    def assign_layers(name, depth, stack):
-        if name in stack:
-            return
-        if name in layer_map and layer_map[name] >= depth:
-            return
-        layer_map[name] = depth
-        stack.add(name)
-        for dep in adj.get(name, []):
-            if dep in adj:
-                assign_layers(dep, depth + 1, stack)
-        stack.discard(name)
-
-    assign_layers(root, 0, set())
+    layer_map = _longest_path_layers(adj, root)
+
+    if layer_map is None:
+        # Cyclic graph: fall back to the depth-first relaxation, which
+        # breaks cycles along the current path.
+        layer_map = {}
+
+        def assign_layers(name, depth, stack):
+            if name in stack:
+                return
+            if name in layer_map and layer_map[name] >= depth:
+                return
+            layer_map[name] = depth
+            stack.add(name)
+            for dep in adj.get(name, []):
+                if dep in adj:
+                    assign_layers(dep, depth + 1, stack)
+            stack.discard(name)
+
+        assign_layers(root, 0, set())
     if not layer_map:
         return
 
@@ -2647,9 +2827,11 @@ def _generate_tower_from_tree(adj, root, ecosystem, output, title, max_width):
         default=1,
     )
 
+    sqrt_max_contribs = math.sqrt(max(max_contribs, 1))
+
     def raw_width(name):
         c = scores_db.get(name, {}).get("contributors", 1)
-        ratio = math.sqrt(c) / math.sqrt(max(max_contribs, 1))
+        ratio = math.sqrt(c) / sqrt_max_contribs
         return max(38, int(150 * (0.1 + 0.9 * ratio)))
 
     # --- 6. Position blocks: each block sits under its parents ---
@@ -2838,24 +3020,7 @@ def _generate_tower_from_tree(adj, root, ecosystem, output, title, max_width):
                 commits = info.get("commits", 0)
                 lt_commits = info.get("lifetime_commits", 0)
 
-                # Fragility: concentration adjusted by contributor depth
-                # 1 contrib → full concentration risk
-                # 4 contribs → halved, 16 contribs → quartered
-                fragility = (conc / 100) / math.sqrt(max(contribs, 1))
-                # Low recent activity amplifies fragility
-                if commits <= 1:
-                    fragility = min(1.0, fragility * 1.5)
-                elif commits <= 5:
-                    fragility = min(1.0, fragility * 1.2)
-
-                # Irreplaceability: accumulated code complexity (log-scale)
-                # log2(10)/12≈0.28, log2(300)/12≈0.69, log2(2000)/12≈0.92
-                irreplaceability = min(1.0, math.log2(max(lt_commits, 10)) / 12)
-
-                # Tree impact: how much breaks if it fails
-                tree_impact = 1 + n_dep
-
-                threat = fragility * irreplaceability * tree_impact * 100
+                threat = _structural_threat(conc, contribs, commits, lt_commits, n_dep)
                 if threat > worst_threat:
                     worst_threat = threat
                     worst_block = {
@@ -2916,6 +3081,12 @@ def _generate_tower_from_tree(adj, root, ecosystem, output, title, max_width):
         f.write('\n'.join(svg))
 
 
+def _read_json_report(path: str):
+    """Load a scan report written by ``scan -o``."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
 @app.command()
 def diff(
     before: str = typer.Argument(..., help="Baseline scan report (JSON from 'ossuary scan -o')"),
@@ -2929,10 +3100,8 @@ def diff(
             raise typer.Exit(1)
 
     try:
-        with open(before) as f:
-            before_data = json.load(f)
-        with open(after) as f:
-            after_data = json.load(f)
+        before_data = _read_json_report(before)
+        after_data = _read_json_report(after)
     except (json.JSONDecodeError, KeyError) as e:
         console.print(f"[red]Invalid JSON report: {e}[/red]")
         raise typer.Exit(1)
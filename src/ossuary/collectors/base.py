@@ -1,7 +1,87 @@
 """Base collector interface."""
 
+import contextlib
+import urllib.request
 from abc import ABC, abstractmethod
-from typing import Any
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+# Connection pool shared by every HTTP collector created inside
+# ``shared_http_pool()``. Collectors are built and closed per package,
+# so without it each one opens (and TLS-handshakes) its own connections.
+_SHARED_TRANSPORT: ContextVar[Optional[httpx.AsyncBaseTransport]] = ContextVar(
+    "ossuary_shared_transport", default=None
+)
+# Response cache living for the same scope, for collectors that memoise
+# slow-moving metadata (``GitHubCollector`` user and repo lookups).
+_SHARED_RESPONSES: ContextVar[Optional[dict]] = ContextVar(
+    "ossuary_shared_responses", default=None
+)
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Forward requests to the shared pool without owning it.
+
+    ``AsyncClient.aclose()`` closes its transport; collectors close their
+    client when done, which must not tear down the pool other collectors
+    are still using.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def shared_transport() -> Optional[httpx.AsyncBaseTransport]:
+    """Transport for a new collector client.
+
+    Inside ``shared_http_pool()`` this borrows the shared pool; outside
+    it returns ``None`` so ``httpx.AsyncClient`` builds its own, as
+    before.
+    """
+    transport = _SHARED_TRANSPORT.get()
+    return _BorrowedTransport(transport) if transport is not None else None
+
+
+def shared_response_cache() -> Optional[dict]:
+    """Response cache of the enclosing ``shared_http_pool()``, or ``None``.
+
+    Keys and values are up to the collector using it; entries live until
+    the outermost pool exits.
+    """
+    return _SHARED_RESPONSES.get()
+
+
+@contextlib.asynccontextmanager
+async def shared_http_pool() -> AsyncIterator[None]:
+    """Share one HTTP connection pool across the collectors created inside.
+
+    Also installs the ``shared_response_cache()`` for the same scope.
+    Nested uses reuse the outermost pool and cache. When proxy
+    environment variables are set the connection pool is not installed:
+    ``httpx`` only honours them for clients that build their own
+    transport.
+    """
+    if _SHARED_RESPONSES.get() is not None:
+        yield
+        return
+    transport = None if urllib.request.getproxies() else httpx.AsyncHTTPTransport()
+    transport_token = _SHARED_TRANSPORT.set(transport)
+    responses_token = _SHARED_RESPONSES.set({})
+    try:
+        yield
+    finally:
+        _SHARED_RESPONSES.reset(responses_token)
+        _SHARED_TRANSPORT.reset(transport_token)
+        if transport is not None:
+            await transport.aclose()
 
 
 class BaseCollector(ABC):
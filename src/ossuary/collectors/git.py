@@ -1,12 +1,15 @@
 """Git repository collector - extracts commit history and metadata."""
 
+import functools
 import hashlib
+import io
 import logging
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -34,6 +37,19 @@ _GENERIC_EMAIL_DOMAINS = {
     "yandex.ru", "qq.com", "163.com",
 }
 
+# Per-checkout locks for ``clone_or_update``. Scoring runs the clone in
+# a worker thread, so two packages that share a repository can reach the
+# same checkout concurrently; the fetch / re-clone must not interleave.
+_REPO_LOCKS: dict[Path, threading.Lock] = {}
+_REPO_LOCKS_GUARD = threading.Lock()
+
+
+def _repo_lock(repo_path: Path) -> threading.Lock:
+    """Return the lock guarding the checkout at ``repo_path``."""
+    with _REPO_LOCKS_GUARD:
+        return _REPO_LOCKS.setdefault(repo_path, threading.Lock())
+
+
 # Country-code second-level domains (for org key extraction)
 _COUNTRY_CODE_SLDS = {"co.uk", "co.jp", "com.au", "co.nz", "com.br", "co.kr", "co.in"}
 
@@ -57,6 +73,7 @@ def _domain_org_key(domain: str) -> str:
     return parts[-2]
 
 
+@functools.lru_cache(maxsize=65536)
 def _normalize_email(email: str) -> str:
     """Normalize an email address to a canonical identity key.
 
@@ -80,7 +97,7 @@ def _normalize_email(email: str) -> str:
     return email
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommitData:
     """Extracted commit data."""
 
@@ -166,9 +183,16 @@ class GitCollector(BaseCollector):
 
         Returns:
             Path to the local repository
+
+        Safe to call from several threads at once: calls for the same
+        checkout are serialised.
         """
         repo_path = self._get_repo_path(repo_url)
+        with _repo_lock(repo_path.resolve()):
+            return self._clone_or_update(repo_url, repo_path)
 
+    def _clone_or_update(self, repo_url: str, repo_path: Path) -> Path:
+        """Body of :meth:`clone_or_update`; caller holds the checkout lock."""
         if repo_path.exists():
             try:
                 logger.info(f"Updating existing repository: {repo_path}")
@@ -234,26 +258,35 @@ class GitCollector(BaseCollector):
             logger.warning(f"git log failed: {result.stderr[:200]}")
             return []
 
-        # Decode with replacement for non-UTF8 author names (e.g. Latin-1)
-        output = result.stdout.decode("utf-8", errors="replace")
-
+        # Parse line by line rather than decoding and splitting the whole
+        # output, which held two more copies of it alongside the commits.
+        # Names and emails repeat on almost every commit, so each distinct
+        # string is stored once.
+        strings: dict[str, str] = {}
         commits = []
-        for line in output.split("\n"):
+        for raw in io.BytesIO(result.stdout):
+            # Decode with replacement for non-UTF8 author names (e.g. Latin-1)
+            line = raw.rstrip(b"\n").decode("utf-8", errors="replace")
             if not line:
                 continue
             parts = line.split("\x00")
             if len(parts) < 8:
                 continue
             try:
+                authored = datetime.fromtimestamp(int(parts[3]))
+                committed = (
+                    authored if parts[6] == parts[3]
+                    else datetime.fromtimestamp(int(parts[6]))
+                )
                 commits.append(
                     CommitData(
                         sha=parts[0],
-                        author_name=parts[1],
-                        author_email=parts[2],
-                        authored_date=datetime.fromtimestamp(int(parts[3])),
-                        committer_name=parts[4],
-                        committer_email=parts[5],
-                        committed_date=datetime.fromtimestamp(int(parts[6])),
+                        author_name=strings.setdefault(parts[1], parts[1]),
+                        author_email=strings.setdefault(parts[2], parts[2]),
+                        authored_date=authored,
+                        committer_name=strings.setdefault(parts[4], parts[4]),
+                        committer_email=strings.setdefault(parts[5], parts[5]),
+                        committed_date=committed,
                         message=parts[7],
                     )
                 )
@@ -282,10 +315,8 @@ class GitCollector(BaseCollector):
 
         cutoff = cutoff_date or datetime.now()
 
-        # Sort commits by date (needed for first/last and historical analysis)
-        sorted_commits = sorted(commits, key=lambda c: c.authored_date)
-        first_commit_date = sorted_commits[0].authored_date
-        last_commit_date = sorted_commits[-1].authored_date
+        first_commit_date = min(c.authored_date for c in commits)
+        last_commit_date = max(c.authored_date for c in commits)
 
         # --- Lifetime stats (all commits) ---
         # Use normalized email to merge identities (e.g. user@suse.de + user@suse.com)
@@ -434,13 +465,32 @@ class GitCollector(BaseCollector):
             historical_commits = [c for c in commits if c.authored_date < taper_start]
             hist_total = len(historical_commits)
 
-            # Historical share per contributor (using normalized identities)
+            # Historical share per contributor (using normalized identities),
+            # plus each identity's first/last historical commit date for
+            # the tenure guard below.
             hist_counts: dict[str, int] = defaultdict(int)
             hist_names: dict[str, str] = {}
+            hist_span: dict[str, tuple[datetime, datetime]] = {}
             for c in historical_commits:
                 email = _normalize_email(c.author_email)
                 hist_counts[email] += 1
                 hist_names[email] = c.author_name
+                span = hist_span.get(email)
+                if span is None:
+                    hist_span[email] = (c.authored_date, c.authored_date)
+                elif c.authored_date < span[0]:
+                    hist_span[email] = (c.authored_date, span[1])
+                elif c.authored_date > span[1]:
+                    hist_span[email] = (span[0], c.authored_date)
+
+            # Historical commits per org key (non-generic domains only),
+            # for the org-continuity check below.
+            hist_org_counts: dict[str, int] = defaultdict(int)
+            for email, count in hist_counts.items():
+                if "@" in email:
+                    domain = email.split("@")[1]
+                    if domain not in _GENERIC_EMAIL_DOMAINS:
+                        hist_org_counts[_domain_org_key(domain)] += count
 
             # Build name→emails map for identity merging (same person,
             # different emails: e.g. tqdm@cdcl.ml + casper.dcl@physics.org)
@@ -485,16 +535,10 @@ class GitCollector(BaseCollector):
                 # where a contributor switches domains mid-history.
                 hist_abs = hist_counts.get(identity, 0)
                 if hist_abs >= 100:
-                    contributor_commits = sorted(
-                        [c for c in historical_commits
-                         if _normalize_email(c.author_email) == identity],
-                        key=lambda c: c.authored_date,
-                    )
-                    if contributor_commits:
-                        tenure_years = (contributor_commits[-1].authored_date
-                                        - contributor_commits[0].authored_date).days / 365.25
-                        if tenure_years >= 4:
-                            continue
+                    first_date, last_date = hist_span[identity]
+                    tenure_years = (last_date - first_date).days / 365.25
+                    if tenure_years >= 4:
+                        continue
 
                 # Org-continuity check: if the suspect's org had significant
                 # historical presence, this is an internal handoff (e.g. new
@@ -505,12 +549,7 @@ class GitCollector(BaseCollector):
                     suspect_domain = identity.split("@")[1]
                     if suspect_domain not in _GENERIC_EMAIL_DOMAINS:
                         suspect_org = _domain_org_key(suspect_domain)
-                        domain_hist_commits = sum(
-                            count for email, count in hist_counts.items()
-                            if "@" in email
-                            and email.split("@")[1] not in _GENERIC_EMAIL_DOMAINS
-                            and _domain_org_key(email.split("@")[1]) == suspect_org
-                        )
+                        domain_hist_commits = hist_org_counts.get(suspect_org, 0)
                         domain_hist_pct = (domain_hist_commits / hist_total * 100) if hist_total > 0 else 0
                         if domain_hist_pct >= 30:
                             continue  # Same org continuity
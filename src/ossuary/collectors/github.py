@@ -11,7 +11,7 @@ from typing import Any, Optional
 
 import httpx
 
-from ossuary.collectors.base import BaseCollector
+from ossuary.collectors.base import BaseCollector, shared_response_cache, shared_transport
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,14 @@ def _url_path(url: str) -> str:
         return url
 
 
+# ``owner/repo`` from an https or ssh GitHub URL, with an optional
+# ``.git`` suffix and anything after the repo (trailing slash,
+# ``/tree/main/...``) ignored.
+_REPO_URL_RE = re.compile(
+    r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$", re.DOTALL,
+)
+
+
 @dataclass
 class IssueData:
     """Extracted issue/PR data."""
@@ -111,6 +119,8 @@ class GitHubCollector(BaseCollector):
     REQUEST_DELAY = 0.1
     REQUEST_DELAY_UNAUTHENTICATED = 1.0
     RATE_LIMIT_PAUSE = 60
+    # How long a shared_http_pool() keeps user / repo metadata (seconds)
+    RESPONSE_CACHE_TTL = 3600
 
     # Tier-1 thresholds
     TIER1_REPOS = 500
@@ -127,7 +137,9 @@ class GitHubCollector(BaseCollector):
         self.tokens = self._collect_tokens(token)
         self.token_index = 0
         self.token = self.tokens[0] if self.tokens else None
-        self.client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        self.client = httpx.AsyncClient(
+            timeout=30.0, follow_redirects=True, transport=shared_transport(),
+        )
 
         if self.token:
             self.client.headers["Authorization"] = f"Bearer {self.token}"
@@ -140,6 +152,10 @@ class GitHubCollector(BaseCollector):
         # return signature unchanged; ``collect()`` reads this between
         # calls to classify each failure as essential or provisional.
         self.last_error: Optional[str] = None
+        # ``last_repo_info`` keeps the ``/repos/{owner}/{repo}`` payload
+        # fetched by the most recent ``collect()`` (``None`` if it failed)
+        # so callers needing stars / ``pushed_at`` don't request it twice.
+        self.last_repo_info: Optional[dict] = None
 
     @staticmethod
     def _collect_tokens(explicit_token: Optional[str] = None) -> list[str]:
@@ -178,16 +194,9 @@ class GitHubCollector(BaseCollector):
         Returns:
             Tuple of (owner, repo) or (None, None) if parsing fails
         """
-        patterns = [
-            r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$",
-            r"github\.com[:/]([^/]+)/([^/]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, repo_url)
-            if match:
-                return match.group(1), match.group(2).replace(".git", "")
-
+        match = _REPO_URL_RE.search(repo_url)
+        if match:
+            return match.group(1), match.group(2).replace(".git", "")
         return None, None
 
     async def _request(self, method: str, url: str, _rotated: bool = False, **kwargs) -> Optional[dict]:
@@ -246,6 +255,29 @@ class GitHubCollector(BaseCollector):
         url = f"{self.API_BASE}{endpoint}" if not endpoint.startswith("http") else endpoint
         return await self._request("GET", url, params=params)
 
+    async def _get_cached(self, endpoint: str, params: Optional[dict] = None) -> Optional[Any]:
+        """``_get`` memoised in the enclosing ``shared_http_pool()``.
+
+        For slow-moving user and repo metadata that a batch asks for
+        again and again (one maintainer owns many packages). Only
+        successful responses are kept, for ``RESPONSE_CACHE_TTL``
+        seconds; a hit clears ``last_error`` like a successful call.
+        Outside a pool this is plain ``_get``.
+        """
+        cache = shared_response_cache()
+        if cache is None:
+            return await self._get(endpoint, params)
+        key = ("github", endpoint, tuple(sorted(params.items())) if params else ())
+        hit = cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < self.RESPONSE_CACHE_TTL:
+            self.last_error = None
+            return hit[1]
+        data = await self._get(endpoint, params)
+        if data is not None:
+            cache[key] = (now, data)
+        return data
+
     async def _graphql(self, query: str, variables: Optional[dict] = None,
                        _rotated: bool = False) -> Optional[dict]:
         """Execute GraphQL query.
@@ -297,7 +329,7 @@ class GitHubCollector(BaseCollector):
 
     async def get_user(self, username: str) -> Optional[dict]:
         """Get GitHub user profile."""
-        return await self._get(f"/users/{username}")
+        return await self._get_cached(f"/users/{username}")
 
     async def get_user_repos(self, username: str, max_pages: int = 3) -> list[dict]:
         """Get all public repos for a user."""
@@ -305,7 +337,7 @@ class GitHubCollector(BaseCollector):
         page = 1
 
         while page <= max_pages:
-            data = await self._get(
+            data = await self._get_cached(
                 f"/users/{username}/repos",
                 params={"per_page": 100, "page": page, "type": "owner"},
             )
@@ -381,7 +413,7 @@ class GitHubCollector(BaseCollector):
 
     async def get_user_orgs(self, username: str) -> list[str]:
         """Get list of organizations a user belongs to."""
-        orgs_data = await self._get(f"/users/{username}/orgs")
+        orgs_data = await self._get_cached(f"/users/{username}/orgs")
         if not orgs_data or not isinstance(orgs_data, list):
             return []
         return [org.get("login", "") for org in orgs_data if org.get("login")]
@@ -430,7 +462,7 @@ class GitHubCollector(BaseCollector):
 
     async def get_repo_info(self, owner: str, repo: str) -> Optional[dict]:
         """Get repository information."""
-        return await self._get(f"/repos/{owner}/{repo}")
+        return await self._get_cached(f"/repos/{owner}/{repo}")
 
     @staticmethod
     async def probe_pushed_at(repo_url: str) -> Optional[str]:
@@ -453,7 +485,8 @@ class GitHubCollector(BaseCollector):
             return None
         collector = GitHubCollector()
         try:
-            info = await collector.get_repo_info(owner, repo)
+            # Uncached on purpose: a memoised payload would hide a push.
+            info = await collector._get(f"/repos/{owner}/{repo}")
         finally:
             await collector.close()
         if not info:
@@ -806,6 +839,7 @@ class GitHubCollector(BaseCollector):
         Returns:
             GitHubData with all collected information
         """
+        self.last_repo_info = None
         owner, repo = self.parse_repo_url(repo_url)
         if not owner or not repo:
             logger.error(f"Could not parse repository URL: {repo_url}")
@@ -815,6 +849,7 @@ class GitHubCollector(BaseCollector):
 
         # Family 1: repo metadata. Resolves canonical owner/repo + owner type.
         owner, repo, repo_info = await self.collect_repo_meta(owner, repo, data)
+        self.last_repo_info = repo_info
 
         # Family 2a: maintainer identity. Depends on family 1 (owner_type).
         maintainer = await self.resolve_maintainer(
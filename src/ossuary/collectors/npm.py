@@ -7,7 +7,7 @@ from typing import Optional
 
 import httpx
 
-from ossuary.collectors.base import BaseCollector
+from ossuary.collectors.base import BaseCollector, shared_transport
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +59,7 @@ class NpmCollector(BaseCollector):
 
     def __init__(self):
         """Initialize npm collector."""
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=30.0, transport=shared_transport())
 
     def is_available(self) -> bool:
         """npm collector is always available."""
@@ -2,15 +2,21 @@
 
 import asyncio
 import logging
+import re
 from dataclasses import dataclass, field
 from typing import Optional
 
 import httpx
 
-from ossuary.collectors.base import BaseCollector
+from ossuary.collectors.base import BaseCollector, shared_transport
 
 logger = logging.getLogger(__name__)
 
+# Known sub-pages of a repo URL (``/issues``, ``/tree/main/src``, ...).
+_REPO_SUBPATH_RE = re.compile(
+    r"/(issues|pulls|tree|blob|wiki|releases|actions|discussions)(/.*)?$"
+)
+
 
 @dataclass
 class PyPIData:
@@ -61,7 +67,7 @@ class PyPICollector(BaseCollector):
 
     def __init__(self):
         """Initialize PyPI collector."""
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=30.0, transport=shared_transport())
 
     def is_available(self) -> bool:
         """PyPI collector is always available."""
@@ -193,13 +199,11 @@ class PyPICollector(BaseCollector):
 
     def _clean_repo_url(self, url: str) -> str:
         """Strip trailing paths like /issues, /tree/..., /blob/... from repo URLs."""
-        import re
-
-        # Remove fragments and query strings
-        url = url.split("#")[0].split("?")[0].rstrip("/")
+        # Remove fragments and query strings; most URLs have neither
+        if "#" in url or "?" in url or url.endswith("/"):
+            url = url.split("#")[0].split("?")[0].rstrip("/")
         # Strip known subpaths to get the base repo URL
-        url = re.sub(r"/(issues|pulls|tree|blob|wiki|releases|actions|discussions)(/.*)?$", "", url)
-        return url
+        return _REPO_SUBPATH_RE.sub("", url)
 
     def _extract_repo_url(self, info: dict) -> str:
         """Extract repository URL from package info."""
@@ -27,7 +27,7 @@ from typing import Optional
 
 import httpx
 
-from ossuary.collectors.base import BaseCollector
+from ossuary.collectors.base import BaseCollector, shared_transport
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +132,7 @@ class CratesCollector(BaseCollector):
         self.client = httpx.AsyncClient(
             timeout=30.0,
             headers={"User-Agent": "ossuary-risk (https://github.com/anicka-net/ossuary-risk)"},
+            transport=shared_transport(),
         )
 
     def is_available(self) -> bool:
@@ -190,7 +191,7 @@ class RubyGemsCollector(BaseCollector):
     API_URL = "https://rubygems.org/api/v1"
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=30.0, transport=shared_transport())
 
     def is_available(self) -> bool:
         return True
@@ -249,7 +250,7 @@ class PackagistCollector(BaseCollector):
     API_URL = "https://packagist.org"
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=30.0, transport=shared_transport())
 
     def is_available(self) -> bool:
         return True
@@ -349,7 +350,7 @@ class NuGetCollector(BaseCollector):
     SEARCH_URL = "https://azuresearch-usnc.nuget.org/query"
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=30.0, transport=shared_transport())
 
     def is_available(self) -> bool:
         return True
@@ -436,7 +437,9 @@ class GoProxyCollector(BaseCollector):
     PKG_URL = "https://pkg.go.dev"
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
+        self.client = httpx.AsyncClient(
+            timeout=30.0, follow_redirects=True, transport=shared_transport(),
+        )
 
     def is_available(self) -> bool:
         return True
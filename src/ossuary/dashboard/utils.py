@@ -328,22 +328,24 @@ def _run_score_targets(targets: list[dict], *, force: bool, use_cache: bool) ->
     Returns ``{"success": int, "errors": list[(name, error)]}``. Runs in
     the Streamlit request thread; suitable for small N (typically <50).
     """
+    from ossuary.collectors.base import shared_http_pool
     from ossuary.services.scorer import score_package
 
     async def _run():
         success = 0
         errors: list[tuple[str, str]] = []
-        for t in targets:
-            r = await score_package(
-                t["name"], t["ecosystem"],
-                repo_url=t.get("repo_url"),
-                force=force,
-                use_cache=use_cache,
-            )
-            if r.success:
-                success += 1
-            else:
-                errors.append((t["name"], r.error or "unknown"))
+        async with shared_http_pool():
+            for t in targets:
+                r = await score_package(
+                    t["name"], t["ecosystem"],
+                    repo_url=t.get("repo_url"),
+                    force=force,
+                    use_cache=use_cache,
+                )
+                if r.success:
+                    success += 1
+                else:
+                    errors.append((t["name"], r.error or "unknown"))
         return {"success": success, "errors": errors}
 
     return run_async(_run())
@@ -313,3 +313,27 @@ class SentimentRecord(Base):
         UniqueConstraint("package_id", "text_hash", name="uq_sentiment_package_hash"),
         Index("ix_sentiment_source_type", "source_type"),
     )
+
+
+class DependencyManifest(Base):
+    """Cached direct dependencies of a registry package.
+
+    Written by the dependency-tree commands (``deps``, ``score-deps``,
+    ``xkcd-tree``) so that re-running them over the same tree skips the
+    registry round trips. One row per ``(ecosystem, name)``, overwritten
+    on refresh; readers ignore rows older than their TTL. Only
+    successful fetches are stored — a failed fetch must not be served
+    back as "no dependencies".
+    """
+
+    __tablename__ = "dependency_manifests"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ecosystem: Mapped[str] = mapped_column(String(50), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    dependencies: Mapped[list] = mapped_column(JSON)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow_naive)
+
+    __table_args__ = (
+        UniqueConstraint("ecosystem", "name", name="uq_dependency_manifest_ecosystem_name"),
+    )
@@ -8,6 +8,7 @@ from typing import Generator
 from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 
+from ossuary import _json as json_codec
 from ossuary.db.models import Base
 
 logger = logging.getLogger(__name__)
@@ -17,9 +18,18 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ossuary.db")
 
 # Handle SQLite URL format for SQLAlchemy
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        json_serializer=json_codec.dumps,
+        json_deserializer=json_codec.loads,
+    )
 else:
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(
+        DATABASE_URL,
+        json_serializer=json_codec.dumps,
+        json_deserializer=json_codec.loads,
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
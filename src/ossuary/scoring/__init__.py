@@ -1,7 +1,7 @@
 """Risk scoring engine."""
 
 from ossuary.scoring.engine import PackageMetrics, RiskScorer
-from ossuary.scoring.factors import ProtectiveFactors, RiskBreakdown, RiskLevel
+from ossuary.scoring.factors import CIIBadge, ProtectiveFactors, RiskBreakdown, RiskLevel
 from ossuary.scoring.methodology import (
     FRUSTRATION_WEIGHT,
     IN_SCOPE_TIERS,
@@ -15,6 +15,7 @@ from ossuary.scoring.methodology import (
 from ossuary.scoring.reputation import ReputationBreakdown, ReputationScorer, ReputationTier
 
 __all__ = [
+    "CIIBadge",
     "FRUSTRATION_WEIGHT",
     "IN_SCOPE_TIERS",
     "METHODOLOGY_VERSION",
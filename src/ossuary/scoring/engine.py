@@ -1,10 +1,10 @@
 """Risk scoring engine implementation."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 
-from ossuary.scoring.factors import ProtectiveFactors, RiskBreakdown, RiskLevel
+from ossuary.scoring.factors import CIIBadge, ProtectiveFactors, RiskBreakdown, RiskLevel
 from ossuary.scoring.methodology import FRUSTRATION_WEIGHT
 from ossuary.scoring.reputation import ReputationBreakdown, ReputationScorer
 
@@ -33,10 +33,10 @@ class PackageMetrics:
 
     # Reputation data (for composite scoring)
     maintainer_account_created: Optional[datetime] = None
-    maintainer_repos: list[dict] = None  # Full repo data
+    maintainer_repos: list[dict] = field(default_factory=list)  # Full repo data
     maintainer_sponsor_count: int = 0
-    maintainer_orgs: list[str] = None
-    packages_maintained: list[str] = None  # Packages by this maintainer
+    maintainer_orgs: list[str] = field(default_factory=list)
+    packages_maintained: list[str] = field(default_factory=list)  # Packages by this maintainer
 
     # Computed reputation
     reputation: Optional[ReputationBreakdown] = None
@@ -63,9 +63,11 @@ class PackageMetrics:
     # Sentiment analysis results
     average_sentiment: float = 0.0
     frustration_detected: bool = False
-    frustration_evidence: list[str] = None
+    frustration_evidence: list[str] = field(default_factory=list)
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
+        # Callers building metrics from partial collector output may pass
+        # an explicit None for the list fields; normalise to empty lists.
         if self.frustration_evidence is None:
             self.frustration_evidence = []
         if self.maintainer_repos is None:
@@ -184,6 +186,18 @@ class RiskScorer:
         """
         pf = ProtectiveFactors()
 
+        # Snapshot the metrics and thresholds read below once; this method
+        # runs for every scored package and cutoff.
+        downloads = metrics.weekly_downloads
+        stars = metrics.repo_stargazers
+        concentration = metrics.maintainer_concentration
+        commits_last_year = metrics.commits_last_year
+        unique_contributors = metrics.unique_contributors
+        massive_downloads = self.MASSIVE_VISIBILITY_THRESHOLD
+        high_downloads = self.HIGH_VISIBILITY_THRESHOLD
+        massive_stars = self.MASSIVE_STARS_THRESHOLD
+        high_stars = self.HIGH_STARS_THRESHOLD
+
         # Factor 1: Maintainer Reputation (composite score)
         if metrics.reputation:
             # Use pre-calculated reputation
@@ -216,28 +230,28 @@ class RiskScorer:
 
         # Factor 4: Visibility (-10 to -20)
         # Use download counts when available (npm/pypi), fall back to GitHub stars
-        if metrics.weekly_downloads > self.MASSIVE_VISIBILITY_THRESHOLD:
+        if downloads > massive_downloads:
             pf.visibility_score = -20
-        elif metrics.weekly_downloads > self.HIGH_VISIBILITY_THRESHOLD:
+        elif downloads > high_downloads:
             pf.visibility_score = -10
-        elif metrics.weekly_downloads == 0 and metrics.repo_stargazers > 0:
+        elif downloads == 0 and stars > 0:
             # Stars-based proxy for repos without download data
-            if metrics.repo_stargazers > self.MASSIVE_STARS_THRESHOLD:
+            if stars > massive_stars:
                 pf.visibility_score = -20
-            elif metrics.repo_stargazers > self.HIGH_STARS_THRESHOLD:
+            elif stars > high_stars:
                 pf.visibility_score = -10
 
         # Factor 5: Distributed Governance (-10)
         # Require enough commits to draw meaningful conclusions about distribution
-        if metrics.maintainer_concentration < 40 and metrics.commits_last_year >= 10:
+        if concentration < 40 and commits_last_year >= 10:
             pf.distributed_score = -10
 
         # Factor 6: Active Community (-10)
-        if metrics.unique_contributors > 20:
+        if unique_contributors > 20:
             pf.community_score = -10
 
         # Factor 7: CII Best Practices (-10)
-        if metrics.cii_badge_level in ("gold", "silver", "passing"):
+        if CIIBadge.from_level(metrics.cii_badge_level) >= CIIBadge.PASSING:
             pf.cii_score = -10
 
         # Factor 8: Economic Frustration (+FRUSTRATION_WEIGHT)
@@ -258,51 +272,59 @@ class RiskScorer:
         # Field retained on ProtectiveFactors as structurally 0 to keep
         # cached-score deserialization stable.
 
+        # Factors 10 and 11 only apply to mature projects; the common
+        # non-mature case stops here.
+        if not metrics.is_mature:
+            return pf
+
         # Factor 10: Project Maturity — evidence only, not a score contribution.
         # maturity_score is structurally 0 (see ProtectiveFactors docstring);
         # the actual maturity mechanism is in calculate(): activity-penalty
         # suppression and lifetime-concentration fallback. We populate evidence
         # here so the explanation / dashboard can surface that a project was
         # treated as mature without pretending a protective-factor score fired.
-        if metrics.is_mature:
-            pf.maturity_evidence = (
-                f"Stable project: {metrics.total_commits} commits over "
-                f"{metrics.repo_age_years:.0f} years, "
-                f"{metrics.lifetime_contributors} lifetime contributors"
-            )
+        pf.maturity_evidence = (
+            f"Stable project: {metrics.total_commits} commits over "
+            f"{metrics.repo_age_years:.0f} years, "
+            f"{metrics.lifetime_contributors} lifetime contributors"
+        )
 
         # Factor 11: Takeover Risk (+20) — xz-utils proportion shift detection
         # Flags when a minor historical contributor suddenly dominates recent commits.
         # Threshold: >30% shift AND >40% of recent commits from that contributor.
-        if (
-            metrics.is_mature
-            and metrics.takeover_shift > 30
-        ):
+        takeover_shift = metrics.takeover_shift
+        if takeover_shift > 30:
             pf.takeover_risk_score = 20
             suspect = metrics.takeover_suspect_name or metrics.takeover_suspect
             pf.takeover_risk_evidence = (
-                f"{suspect}: {metrics.takeover_shift:+.0f}pp shift in commit share "
+                f"{suspect}: {takeover_shift:+.0f}pp shift in commit share "
                 f"on mature project (xz-utils pattern)"
             )
 
         return pf
 
-    def generate_explanation(self, breakdown: RiskBreakdown, metrics: PackageMetrics = None) -> str:
+    def generate_explanation(
+        self, breakdown: RiskBreakdown, metrics: Optional[PackageMetrics] = None
+    ) -> str:
         """Generate human-readable explanation of the score."""
         parts = []
+        pf = breakdown.protective_factors
+        risk_level = breakdown.risk_level
+        # Bound only for mature projects, so the checks below narrow it.
+        mature = metrics if metrics is not None and metrics.is_mature else None
 
         # Maturity context (comes first if applicable)
-        if metrics and metrics.is_mature:
+        if mature is not None:
             parts.append(
-                f"Mature project ({metrics.repo_age_years:.0f} years, "
-                f"{metrics.lifetime_contributors} lifetime contributors)"
+                f"Mature project ({mature.repo_age_years:.0f} years, "
+                f"{mature.lifetime_contributors} lifetime contributors)"
             )
 
         # Concentration explanation
         conc = breakdown.maintainer_concentration
-        if metrics and metrics.is_mature:
+        if mature is not None:
             # For mature projects, explain we're using lifetime concentration
-            lt_conc = metrics.lifetime_concentration
+            lt_conc = mature.lifetime_concentration
             if lt_conc >= 90:
                 parts.append(f"Single-maintainer lifetime ({lt_conc:.0f}% lifetime concentration)")
             elif lt_conc >= 50:
@@ -320,20 +342,21 @@ class RiskScorer:
                 parts.append(f"Distributed commits ({conc:.0f}%): healthy contributor diversity")
 
         # Activity explanation
-        if breakdown.activity_modifier == 20:
+        activity = breakdown.activity_modifier
+        if activity == 20:
             parts.append("Project appears abandoned (<4 commits/year)")
-        elif breakdown.activity_modifier == -30:
+        elif activity == -30:
             parts.append("Actively maintained (>50 commits/year)")
-        elif breakdown.activity_modifier == -15:
+        elif activity == -15:
             parts.append("Moderately active (12-50 commits/year)")
-        elif breakdown.activity_modifier == 0:
-            if metrics and metrics.is_mature and metrics.commits_last_year < 4:
+        elif activity == 0:
+            if mature is not None and mature.commits_last_year < 4:
                 parts.append("Low recent activity (expected for mature project)")
             else:
                 parts.append("Low activity (4-11 commits/year)")
 
         # Protective factors summary
-        pf_total = breakdown.protective_factors.total
+        pf_total = pf.total
         if pf_total < -30:
             parts.append(f"Strong protective factors ({pf_total:+d} points)")
         elif pf_total < 0:
@@ -342,56 +365,87 @@ class RiskScorer:
             parts.append(f"Warning signals present ({pf_total:+d} points)")
 
         # Frustration alert
-        if breakdown.protective_factors.frustration_score > 0:
+        if pf.frustration_score > 0:
             parts.append("ALERT: Economic frustration signals detected")
 
         # Takeover alert
-        if breakdown.protective_factors.takeover_risk_score > 0:
+        if pf.takeover_risk_score > 0:
             parts.append("ALERT: Newcomer takeover pattern detected on mature project")
 
-        return f"{breakdown.risk_level.semaphore} {breakdown.risk_level.value} ({breakdown.final_score}). " + ". ".join(
+        return f"{risk_level.semaphore} {risk_level.value} ({breakdown.final_score}). " + ". ".join(
             parts
         )
 
     def generate_recommendations(self, breakdown: RiskBreakdown) -> list[str]:
         """Generate actionable recommendations based on the score."""
         recs = []
+        pf = breakdown.protective_factors
+        final_score = breakdown.final_score
 
-        if breakdown.final_score >= 80:
+        if final_score >= 80:
             recs.append("IMMEDIATE: Identify alternative packages or prepare to fork")
             recs.append("Do not accept new versions without manual code review")
             recs.append("Monitor for maintainer changes or ownership transfers")
-        elif breakdown.final_score >= 60:
+        elif final_score >= 60:
             recs.append("Review new releases carefully before updating")
             recs.append("Consider contributing to reduce maintainer concentration")
             recs.append("Monitor project health metrics monthly")
-        elif breakdown.final_score >= 40:
+        elif final_score >= 40:
             recs.append("Standard monitoring recommended")
             recs.append("Keep dependencies updated")
         else:
             recs.append("Low risk - standard dependency management practices apply")
 
-        # Specific recommendations
-        if breakdown.protective_factors.frustration_score > 0:
-            recs.insert(0, "URGENT: Maintainer frustration detected - elevated sabotage risk")
+        # Specific recommendations. Each later check outranks the earlier
+        # ones, so they are collected in ascending priority and reversed
+        # onto the front of the list once at the end.
+        priority = []
+        if pf.frustration_score > 0:
+            priority.append("URGENT: Maintainer frustration detected - elevated sabotage risk")
 
         if breakdown.maintainer_concentration > 90 and breakdown.commits_last_year < 10:
-            recs.insert(0, "HIGH PRIORITY: Single maintainer + low activity = prime takeover target")
+            priority.append("HIGH PRIORITY: Single maintainer + low activity = prime takeover target")
 
         # Takeover-specific recommendations
-        if breakdown.protective_factors.takeover_risk_score > 0:
-            recs.insert(0, "ALERT: New contributor dominates recent commits on mature project — review carefully (xz-utils pattern)")
+        if pf.takeover_risk_score > 0:
+            priority.append("ALERT: New contributor dominates recent commits on mature project — review carefully (xz-utils pattern)")
 
         # Mature project recommendation — triggered by the evidence string,
         # not by a (structurally zero) maturity_score.
         if (
-            breakdown.protective_factors.maturity_evidence
-            and breakdown.final_score is not None
-            and breakdown.final_score < 40
+            pf.maturity_evidence
+            and final_score is not None
+            and final_score < 40
         ):
             recs.append("Stable mature project — standard monitoring sufficient")
 
-        return recs
+        return priority[::-1] + recs
+
+    def _mature_components(self, metrics: PackageMetrics) -> tuple[int, int]:
+        """Return ``(base_risk, activity_modifier)`` for a mature project.
+
+        Mature projects with some activity (1-3 commits/yr): suppress
+        activity penalty, fall back to lifetime concentration (recent
+        data from 1-3 commits is unreliable).
+        Mature projects with ZERO activity: truly abandoned — apply
+        full penalty and use default 100% concentration (no recent data).
+        """
+        commits_last_year = metrics.commits_last_year
+        if commits_last_year == 0:
+            # Zero activity = abandoned, even if historically mature.
+            # Don't reward a project nobody's home for.
+            return (
+                self.calculate_base_risk(metrics.maintainer_concentration, metrics.bus_factor),
+                self.calculate_activity_modifier(0),
+            )
+        if commits_last_year < 4:
+            concentration = metrics.lifetime_concentration
+        else:
+            concentration = metrics.maintainer_concentration
+        return (
+            self.calculate_base_risk(concentration, metrics.bus_factor),
+            min(0, self.calculate_activity_modifier(commits_last_year)),
+        )
 
     def calculate(
         self,
@@ -429,37 +483,25 @@ class RiskScorer:
 
         # Calculate components — two-track scoring for mature projects
         if metrics.is_mature:
-            # Mature projects with some activity (1-3 commits/yr): suppress
-            # activity penalty, fall back to lifetime concentration (recent
-            # data from 1-3 commits is unreliable).
-            # Mature projects with ZERO activity: truly abandoned — apply
-            # full penalty and use default 100% concentration (no recent data).
-            if metrics.commits_last_year == 0:
-                # Zero activity = abandoned, even if historically mature.
-                # Don't reward a project nobody's home for.
-                breakdown.base_risk = self.calculate_base_risk(metrics.maintainer_concentration, metrics.bus_factor)
-                breakdown.activity_modifier = self.calculate_activity_modifier(0)
-            elif metrics.commits_last_year < 4:
-                breakdown.base_risk = self.calculate_base_risk(metrics.lifetime_concentration, metrics.bus_factor)
-                raw_activity = self.calculate_activity_modifier(metrics.commits_last_year)
-                breakdown.activity_modifier = min(0, raw_activity)
-            else:
-                breakdown.base_risk = self.calculate_base_risk(metrics.maintainer_concentration, metrics.bus_factor)
-                raw_activity = self.calculate_activity_modifier(metrics.commits_last_year)
-                breakdown.activity_modifier = min(0, raw_activity)
+            breakdown.base_risk, breakdown.activity_modifier = self._mature_components(metrics)
         else:
-            breakdown.base_risk = self.calculate_base_risk(metrics.maintainer_concentration, metrics.bus_factor)
-            breakdown.activity_modifier = self.calculate_activity_modifier(metrics.commits_last_year)
+            breakdown.base_risk = self.calculate_base_risk(
+                metrics.maintainer_concentration, metrics.bus_factor
+            )
+            breakdown.activity_modifier = self.calculate_activity_modifier(
+                metrics.commits_last_year
+            )
 
-        breakdown.protective_factors = self.calculate_protective_factors(metrics, ecosystem)
+        pf = self.calculate_protective_factors(metrics, ecosystem)
+        breakdown.protective_factors = pf
 
         # When a takeover pattern is detected, high commit activity is part of
         # the attack — don't let the activity bonus cancel the takeover signal.
-        if breakdown.protective_factors.takeover_risk_score > 0 and breakdown.activity_modifier < 0:
+        if pf.takeover_risk_score > 0 and breakdown.activity_modifier < 0:
             breakdown.activity_modifier = 0
 
         # Calculate final score (clamped to 0-100)
-        raw_score = breakdown.base_risk + breakdown.activity_modifier + breakdown.protective_factors.total
+        raw_score = breakdown.base_risk + breakdown.activity_modifier + pf.total
         breakdown.final_score = max(0, min(100, raw_score))
 
         # Determine risk level
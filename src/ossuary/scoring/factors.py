@@ -1,10 +1,10 @@
 """Risk scoring factors and data structures."""
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Optional
 
-from ossuary.scoring.methodology import RISK_THRESHOLDS
+from ossuary.scoring.methodology import RISK_THRESHOLDS, label_for_score
 
 
 class RiskLevel(str, Enum):
@@ -25,7 +25,12 @@ class RiskLevel(str, Enum):
     def from_score(cls, score: int) -> "RiskLevel":
         """Get risk level from numeric score, derived from
         ``methodology.RISK_THRESHOLDS`` so the bucket boundaries have a
-        single source of truth."""
+        single source of truth.
+
+        Integer scores in the clamped 0-100 range are served from a table
+        precomputed at import; anything else walks the thresholds."""
+        if type(score) is int and 0 <= score <= 100:
+            return _SCORE_TO_LEVEL[score]
         for threshold, label in RISK_THRESHOLDS:
             if score >= threshold:
                 return cls(label)
@@ -56,7 +61,40 @@ class RiskLevel(str, Enum):
         }[self]
 
 
-@dataclass
+_SCORE_TO_LEVEL: tuple[RiskLevel, ...] = tuple(
+    RiskLevel(label_for_score(score)) for score in range(101)
+)
+"""``RiskLevel`` for every final score 0-100, indexed by score."""
+
+
+class CIIBadge(IntEnum):
+    """OpenSSF Best Practices (CII) badge level, ordered by strictness.
+
+    Collectors and cached snapshots carry the level as a lowercase string
+    (``"none"``, ``"passing"``, ...); ``from_level`` maps it onto this
+    ordering so the scoring check is a single integer comparison.
+    """
+
+    NONE = 0
+    PASSING = 1
+    SILVER = 2
+    GOLD = 3
+
+    @classmethod
+    def from_level(cls, level: Optional[str]) -> "CIIBadge":
+        """Parse a collector badge string; unknown values map to ``NONE``."""
+        return _CII_BADGE_BY_LEVEL.get(level or "", cls.NONE)
+
+    @property
+    def label(self) -> str:
+        """Lowercase string form used by collectors and JSON output."""
+        return self.name.lower()
+
+
+_CII_BADGE_BY_LEVEL = {badge.name.lower(): badge for badge in CIIBadge}
+
+
+@dataclass(slots=True)
 class ProtectiveFactors:
     """Breakdown of protective factors that reduce risk."""
 
@@ -146,7 +184,7 @@ class ProtectiveFactors:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskBreakdown:
     """Complete risk assessment result."""
 
@@ -29,15 +29,18 @@ class ReputationTier(str, Enum):
     @property
     def risk_reduction(self) -> int:
         """Get risk reduction points for this tier."""
-        return {
-            ReputationTier.TIER_1: -25,
-            ReputationTier.TIER_2: -10,
-            ReputationTier.UNKNOWN: 0,
-        }[self]
+        return _TIER_RISK_REDUCTION[self]
+
+
+_TIER_RISK_REDUCTION: dict[ReputationTier, int] = {
+    ReputationTier.TIER_1: -25,
+    ReputationTier.TIER_2: -10,
+    ReputationTier.UNKNOWN: 0,
+}
 
 
 # Recognized organizations that confer institutional backing
-RECOGNIZED_ORGS = {
+RECOGNIZED_ORGS: frozenset[str] = frozenset({
     # JavaScript/Node
     "nodejs",
     "openjs-foundation",
@@ -68,7 +71,7 @@ RECOGNIZED_ORGS = {
     "kubernetes",
     "docker",
     "hashicorp",
-}
+})
 
 # Top packages by ecosystem.
 #
@@ -81,44 +84,46 @@ RECOGNIZED_ORGS = {
 # community; see CONTRIBUTING.md (lists are supportive, not core).
 #
 # Names are stored lowercase for case-insensitive matching against the
-# packages a maintainer publishes (the lookup uses ``.lower()``).
+# packages a maintainer publishes (the lookup uses ``.lower()``). Both
+# tables are frozensets: they are read-only module state shared by every
+# scorer.
 # Namespaces follow each ecosystem's canonical form (e.g. PHP composer
 # uses ``vendor/package``; Go modules use the full module path).
-TOP_PACKAGES = {
-    "npm": {
+TOP_PACKAGES: dict[str, frozenset[str]] = {
+    "npm": frozenset({
         "lodash", "chalk", "express", "react", "vue", "axios", "moment",
         "webpack", "babel", "eslint", "typescript", "next", "prettier",
         "jest", "mocha", "commander", "debug", "async", "request",
         "underscore", "uuid", "minimist", "glob", "yargs", "semver",
         "fs-extra", "bluebird", "rxjs", "socket.io", "mongoose",
-    },
-    "pypi": {
+    }),
+    "pypi": frozenset({
         "requests", "numpy", "pandas", "django", "flask", "pytest",
         "boto3", "urllib3", "setuptools", "pip", "certifi", "pyyaml",
         "cryptography", "pillow", "sqlalchemy", "jinja2", "click", "scipy",
         "matplotlib", "tensorflow", "pytorch", "fastapi", "pydantic",
         "httpx", "aiohttp", "redis", "celery", "scrapy", "beautifulsoup4",
         "lxml",
-    },
+    }),
     # Cargo: top crates by downloads on crates.io.
-    "cargo": {
+    "cargo": frozenset({
         "serde", "serde_json", "tokio", "syn", "quote", "proc-macro2",
         "log", "anyhow", "thiserror", "clap", "regex", "chrono", "rand",
         "futures", "hyper", "reqwest", "tracing", "bytes", "uuid",
         "lazy_static", "once_cell", "itertools", "rayon", "parking_lot",
         "axum", "tower", "diesel", "sqlx", "indexmap", "base64",
-    },
+    }),
     # RubyGems: top gems by download count on rubygems.org.
-    "rubygems": {
+    "rubygems": frozenset({
         "rails", "activerecord", "actionpack", "activesupport", "rake",
         "bundler", "rspec", "rspec-rails", "minitest", "rubocop", "puma",
         "sidekiq", "devise", "nokogiri", "jekyll", "sass", "json",
         "faraday", "rack", "rack-test", "tzinfo", "concurrent-ruby",
         "i18n", "loofah", "ffi", "thor", "rest-client", "httparty",
         "kaminari", "pundit",
-    },
+    }),
     # Packagist (PHP composer): top vendor/package by installs.
-    "packagist": {
+    "packagist": frozenset({
         "symfony/console", "symfony/http-foundation", "symfony/framework-bundle",
         "symfony/finder", "symfony/process", "symfony/yaml",
         "monolog/monolog", "phpunit/phpunit", "guzzlehttp/guzzle",
@@ -130,11 +135,11 @@ TOP_PACKAGES = {
         "league/flysystem", "predis/predis", "swiftmailer/swiftmailer",
         "phpoffice/phpspreadsheet", "phpmailer/phpmailer",
         "symfony/event-dispatcher",
-    },
+    }),
     # NuGet: top .NET packages by download count on nuget.org. Match
     # is case-insensitive via .lower(), so canonical PascalCase here
     # is fine — the lookup normalises both sides.
-    "nuget": {
+    "nuget": frozenset({
         "newtonsoft.json", "microsoft.aspnetcore.app",
         "microsoft.extensions.logging", "microsoft.extensions.dependencyinjection",
         "microsoft.extensions.configuration", "microsoft.extensions.options",
@@ -145,10 +150,10 @@ TOP_PACKAGES = {
         "dapper", "mediatr", "refit", "azure.identity", "azure.storage.blobs",
         "stackexchange.redis", "rabbitmq.client", "grpc.net.client",
         "system.linq.async",
-    },
+    }),
     # Go: canonical module paths (lowercase). Top modules by Go module
     # graph reverse-dependency counts and broad ecosystem use.
-    "go": {
+    "go": frozenset({
         "github.com/spf13/cobra", "github.com/spf13/viper",
         "github.com/sirupsen/logrus", "github.com/stretchr/testify",
         "github.com/gin-gonic/gin", "github.com/gorilla/mux",
@@ -163,11 +168,11 @@ TOP_PACKAGES = {
         "github.com/julienschmidt/httprouter", "github.com/spf13/pflag",
         "github.com/hashicorp/go-multierror", "github.com/golang-jwt/jwt",
         "github.com/dgrijalva/jwt-go", "go.mongodb.org/mongo-driver",
-    },
+    }),
     # GitHub: top repositories used as direct pkg:github/<owner>/<repo>
     # references. Stored as lowercase "owner/repo" to match the canonical
     # form emitted by the PURL parser (see services/sbom.py).
-    "github": {
+    "github": frozenset({
         "torvalds/linux", "kubernetes/kubernetes", "moby/moby",
         "git/git", "ansible/ansible", "kubernetes/kubectl",
         "helm/helm", "containerd/containerd", "etcd-io/etcd",
@@ -178,11 +183,21 @@ TOP_PACKAGES = {
         "pytorch/pytorch", "huggingface/transformers", "rust-lang/rust",
         "golang/go", "nodejs/node", "python/cpython", "openssl/openssl",
         "curl/curl", "git-for-windows/git",
-    },
+    }),
 }
 
 
-@dataclass
+def _portfolio_stats(repos: list[dict], min_stars: int) -> tuple[int, int]:
+    """Return ``(total_stars, repos_with_min_stars)`` over non-fork repos.
+
+    Star counts are extracted once into a flat list so both reductions
+    run over plain ints instead of re-reading each repo dict.
+    """
+    stars = [repo.get("stargazers_count", 0) for repo in repos if not repo.get("fork", False)]
+    return sum(stars), sum(1 for count in stars if count >= min_stars)
+
+
+@dataclass(slots=True)
 class ReputationBreakdown:
     """Detailed breakdown of reputation score."""
 
@@ -328,14 +343,9 @@ class ReputationScorer:
                 breakdown.tenure_score = 15
 
         # Signal 2: Portfolio - original repos with stars (+15)
-        original_repos_with_stars = 0
-        total_stars = 0
-        for repo in repos:
-            if not repo.get("fork", False):
-                stars = repo.get("stargazers_count", 0)
-                total_stars += stars
-                if stars >= self.MIN_STARS_PER_REPO:
-                    original_repos_with_stars += 1
+        total_stars, original_repos_with_stars = _portfolio_stats(
+            repos, self.MIN_STARS_PER_REPO
+        )
 
         breakdown.original_repos_with_stars = original_repos_with_stars
         breakdown.total_stars = total_stars
@@ -358,7 +368,7 @@ class ReputationScorer:
             breakdown.packages_score = 10
 
         # Signal 6: Top package maintainer (+15)
-        top_packages = TOP_PACKAGES.get(ecosystem, set())
+        top_packages = TOP_PACKAGES.get(ecosystem, frozenset())
         maintained_top = [p for p in packages_maintained if p.lower() in top_packages]
         breakdown.top_packages_maintained = maintained_top
         if maintained_top:
@@ -370,6 +380,7 @@ class ReputationScorer:
         if recognized:
             breakdown.org_membership_score = 15
 
-        logger.info("Reputation for %s", breakdown.summary())
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Reputation for %s", breakdown.summary())
 
         return breakdown
@@ -41,7 +41,9 @@ to words like "support" and "opportunity". The rule layer is the
 backstop that keeps the obvious frustration cases visible.
 """
 
+import functools
 import hashlib
+import heapq
 import logging
 import re
 from dataclasses import dataclass, field
@@ -57,8 +59,8 @@ logger = logging.getLogger(__name__)
 # Each rule is ``(label, regex_pattern)``. Templates come first because
 # they capture broader paraphrases; literal multi-word phrases follow
 # as fallbacks for the cases where templates over- or under-match.
-# Patterns are matched case-insensitively against ``text.lower()`` so
-# the patterns themselves can stay lowercase.
+# Patterns are matched against ``text.lower()`` and compiled without
+# ``re.IGNORECASE``, so they must stay lowercase.
 #
 # When changing this list, run the corpus tests in
 # tests/test_sentiment.py — paraphrases of Marak Squires' Nov 2020
@@ -269,7 +271,13 @@ FRUSTRATION_RULES: list[tuple[str, str]] = [
 FRUSTRATION_KEYWORDS: list[str] = [label for label, _ in FRUSTRATION_RULES]
 
 
-@dataclass
+_EMPTY_TEXT_HASH = hashlib.sha256(b"").hexdigest()
+
+VADER_CACHE_SIZE = 50_000
+"""Maximum number of distinct texts whose analysis an analyzer keeps."""
+
+
+@dataclass(slots=True)
 class SentimentResult:
     """Result of sentiment analysis for a single text."""
 
@@ -312,6 +320,37 @@ def _is_bot_login(login: Optional[str]) -> bool:
     return "[bot]" in lowered or lowered.endswith("-bot")
 
 
+@functools.cache
+def _shared_vader() -> SentimentIntensityAnalyzer:
+    """Return the process-wide VADER analyzer.
+
+    Building one parses the whole lexicon from disk; scoring is
+    read-only, so every ``SentimentAnalyzer`` shares a single instance.
+    """
+    return SentimentIntensityAnalyzer()
+
+
+@functools.cache
+def _compiled_frustration_rules() -> tuple[tuple[tuple[str, re.Pattern], ...], re.Pattern]:
+    """Compile ``FRUSTRATION_RULES`` once per process.
+
+    Returns ``(rules, gate)``. ``gate`` is the alternation of every
+    rule: a ``search`` on it matches iff at least one individual rule
+    matches, so it can reject the common no-frustration text in a
+    single scan before the per-rule pass that collects labels. Each
+    rule is wrapped in a named group ``r<index>`` so a hit also says
+    which rule fired.
+    """
+    rules = tuple((label, re.compile(pattern)) for label, pattern in FRUSTRATION_RULES)
+    gate = re.compile(
+        "|".join(
+            f"(?P<r{index}>{pattern})"
+            for index, (_, pattern) in enumerate(FRUSTRATION_RULES)
+        )
+    )
+    return rules, gate
+
+
 class SentimentAnalyzer:
     """
     Sentiment analyzer for OSS maintainer communications.
@@ -323,15 +362,46 @@ class SentimentAnalyzer:
 
     def __init__(self):
         """Initialize the sentiment analyzer."""
-        self.vader = SentimentIntensityAnalyzer()
-        self.frustration_rules: list[tuple[str, re.Pattern]] = [
-            (label, re.compile(pattern, re.IGNORECASE))
-            for label, pattern in FRUSTRATION_RULES
-        ]
+        self.vader = _shared_vader()
+        # Commit histories repeat messages heavily ("Merge branch ...",
+        # "Bump version") and historical scoring re-analyses the same
+        # messages at every cutoff, so the per-text analysis is memoised
+        # for the lifetime of the analyzer.
+        self._text_scores = functools.lru_cache(maxsize=VADER_CACHE_SIZE)(
+            self._score_text
+        )
+        self.frustration_rules, self.frustration_gate = _compiled_frustration_rules()
+
+    def _score_text(
+        self, text: str
+    ) -> tuple[str, float, float, float, float, bool, tuple[str, ...]]:
+        """Return the hashable analysis of a non-blank ``text``.
+
+        ``(text_hash, compound, pos, neg, neu, frustration_detected,
+        labels)``; ``analyze_text`` turns it into a fresh
+        ``SentimentResult`` because callers mutate those.
+        """
+        scores = self.vader.polarity_scores(text)
+        frustration_detected, labels = self._detect_frustration(text)
+        return (
+            self.text_hash(text),
+            scores["compound"],
+            scores["pos"],
+            scores["neg"],
+            scores["neu"],
+            frustration_detected,
+            tuple(labels),
+        )
 
     @staticmethod
     def text_hash(text: str) -> str:
-        """Generate hash for text deduplication."""
+        """Generate hash for text deduplication.
+
+        SHA-256 hex is what ``SentimentRecord.text_hash`` (64 chars, part
+        of a unique constraint) stores, so the scheme must stay stable.
+        """
+        if not text:
+            return _EMPTY_TEXT_HASH
         return hashlib.sha256(text.encode()).hexdigest()
 
     def _detect_frustration(self, text: str) -> tuple[bool, list[str]]:
@@ -342,14 +412,23 @@ class SentimentAnalyzer:
         """
         if not text:
             return False, []
-        # The patterns themselves carry ``re.IGNORECASE`` already, so
-        # there is no need to lower-case the input — but we keep doing
-        # so for parity with the pre-v6.2 implementation, which means
-        # any non-ASCII case-folding behaviour stays identical.
+        # Case-folding happens once here rather than inside the regex
+        # engine: the patterns are lowercase and compiled without
+        # ``re.IGNORECASE``.
         text_lower = text.lower()
+        gate = self.frustration_gate.search(text_lower)
+        if not gate:
+            return False, []
+        # The gate reports the leftmost position at which any rule
+        # matches, so no rule can match earlier: every per-rule search
+        # starts there (``\b`` and lookbehinds still see the preceding
+        # text). The rule the gate itself matched needs no re-check; if
+        # the gate cannot name it, -1 simply re-checks every rule.
+        start = gate.start()
+        gate_rule = int(gate.lastgroup[1:]) if gate.lastgroup else -1
         found_labels = []
-        for label, pattern in self.frustration_rules:
-            if pattern.search(text_lower):
+        for index, (label, pattern) in enumerate(self.frustration_rules):
+            if index == gate_rule or pattern.search(text_lower, start):
                 found_labels.append(label)
         return bool(found_labels), found_labels
 
@@ -365,27 +444,32 @@ class SentimentAnalyzer:
         """
         if not text or not text.strip():
             return SentimentResult(
-                text_hash=self.text_hash(""),
+                text_hash=_EMPTY_TEXT_HASH,
                 compound_score=0.0,
                 positive_score=0.0,
                 negative_score=0.0,
                 neutral_score=1.0,
             )
 
-        # VADER sentiment scores
-        scores = self.vader.polarity_scores(text)
-
-        # Frustration detection
-        frustration_detected, labels = self._detect_frustration(text)
+        # VADER sentiment scores and frustration detection
+        (
+            text_hash,
+            compound,
+            positive,
+            negative,
+            neutral,
+            frustration_detected,
+            labels,
+        ) = self._text_scores(text)
 
         return SentimentResult(
-            text_hash=self.text_hash(text),
-            compound_score=scores["compound"],
-            positive_score=scores["pos"],
-            negative_score=scores["neg"],
-            neutral_score=scores["neu"],
+            text_hash=text_hash,
+            compound_score=compound,
+            positive_score=positive,
+            negative_score=negative,
+            neutral_score=neutral,
             frustration_detected=frustration_detected,
-            frustration_keywords=labels,
+            frustration_keywords=list(labels),
         )
 
     def analyze_texts(
@@ -451,7 +535,13 @@ class SentimentAnalyzer:
 
         results = []
         frustration_evidence = []
-        negative_texts = []
+        # Min-heap keyed on (-score, -position): its root is the least
+        # negative of the five most negative texts seen so far, and on
+        # equal scores the later text is evicted first, matching the
+        # stable sort-and-slice this replaces.
+        negative_heap: list[tuple[float, int, str]] = []
+        compound_total = positive_total = negative_total = 0.0
+        frustration_count = 0
 
         for author_login, text in authored_texts:
             if not text or not text.strip():
@@ -459,6 +549,9 @@ class SentimentAnalyzer:
 
             result = self.analyze_text(text)
             results.append(result)
+            compound_total += result.compound_score
+            positive_total += result.positive_score
+            negative_total += result.negative_score
 
             # Decide whether this text is allowed to *contribute* to
             # the frustration count. We always exclude bot-authored
@@ -474,10 +567,12 @@ class SentimentAnalyzer:
                 count_frustration = False
 
             if count_frustration and result.frustration_detected:
-                frustration_evidence.append(
-                    f"[{source_type}] {author_login or 'unknown'}: "
-                    f"matched rules {result.frustration_keywords}"
-                )
+                frustration_count += 1
+                if len(frustration_evidence) < 10:
+                    frustration_evidence.append(
+                        f"[{source_type}] {author_login or 'unknown'}: "
+                        f"matched rules {result.frustration_keywords}"
+                    )
             elif not count_frustration and result.frustration_detected:
                 # Drop the per-result frustration flag so downstream
                 # consumers don't accidentally re-count this hit (it
@@ -489,27 +584,28 @@ class SentimentAnalyzer:
                 result.frustration_keywords = []
 
             if result.compound_score < -0.3:
-                preview = text[:100] + "..." if len(text) > 100 else text
-                negative_texts.append((preview, result.compound_score))
+                entry = (-result.compound_score, -len(results), text)
+                if len(negative_heap) < 5:
+                    heapq.heappush(negative_heap, entry)
+                elif entry > negative_heap[0]:
+                    heapq.heapreplace(negative_heap, entry)
 
         if not results:
             return AggregatedSentiment()
 
-        avg_compound = sum(r.compound_score for r in results) / len(results)
-        avg_positive = sum(r.positive_score for r in results) / len(results)
-        avg_negative = sum(r.negative_score for r in results) / len(results)
-        frustration_count = sum(1 for r in results if r.frustration_detected)
-
-        negative_texts.sort(key=lambda x: x[1])
+        total = len(results)
 
         return AggregatedSentiment(
-            total_analyzed=len(results),
-            average_compound=avg_compound,
-            average_positive=avg_positive,
-            average_negative=avg_negative,
+            total_analyzed=total,
+            average_compound=compound_total / total,
+            average_positive=positive_total / total,
+            average_negative=negative_total / total,
             frustration_count=frustration_count,
-            frustration_evidence=frustration_evidence[:10],
-            most_negative_texts=negative_texts[:5],
+            frustration_evidence=frustration_evidence,
+            most_negative_texts=[
+                (text[:100] + "..." if len(text) > 100 else text, -neg_score)
+                for neg_score, _, text in sorted(negative_heap, reverse=True)
+            ],
         )
 
     def analyze_commits(
@@ -558,15 +654,26 @@ class SentimentAnalyzer:
             if body:
                 authored_texts.append((issue_author, body))
 
-            for comment in issue.get("comments", []):
-                if isinstance(comment, dict):
-                    comment_author = comment.get("author") or comment.get("author_login")
-                    comment_body = comment.get("body", "")
-                else:
-                    comment_author = None
-                    comment_body = str(comment)
-                if comment_body:
-                    authored_texts.append((comment_author, comment_body))
+            comments = issue.get("comments", [])
+            try:
+                # Collectors always hand over comment dicts, so take the
+                # dict-only path and only fall back to the per-comment
+                # type check when some comment is a bare string.
+                authored_texts.extend([
+                    (c.get("author") or c.get("author_login"), c["body"])
+                    for c in comments
+                    if c.get("body")
+                ])
+            except AttributeError:
+                for comment in comments:
+                    if isinstance(comment, dict):
+                        comment_author = comment.get("author") or comment.get("author_login")
+                        comment_body = comment.get("body", "")
+                    else:
+                        comment_author = None
+                        comment_body = str(comment)
+                    if comment_body:
+                        authored_texts.append((comment_author, comment_body))
 
         return self.analyze_authored_texts(
             authored_texts,
@@ -5,23 +5,28 @@ with concurrency control, resume support, and progress tracking.
 """
 
 import asyncio
-import json
 import logging
 import re
+import tomllib
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
 
 from ossuary._compat import utcnow_naive
-from ossuary.services.cache import ScoreCache
+from ossuary._json import loads as json_loads
+from ossuary.collectors.base import shared_http_pool
+from ossuary.services.cache import ScoreCache, normalize_package_name
 from ossuary.services.scorer import score_package, ScoringResult
+from ossuary.db.models import Package
 from ossuary.db.session import session_scope
 
 logger = logging.getLogger(__name__)
 
+_Unit = TypeVar("_Unit")
 
-@dataclass
+
+@dataclass(slots=True)
 class BatchResult:
     """Summary of a batch scoring run."""
 
@@ -65,7 +70,7 @@ class _RepoPlan:
     unplanable: list["PackageEntry"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageEntry:
     """A package entry for batch scoring."""
 
@@ -78,26 +83,44 @@ class PackageEntry:
     ecosystem: str = "github"  # "github", "npm", "pypi"
 
 
+def _iter_json_array(f) -> Iterator[dict]:
+    """Yield the elements of a top-level JSON array from a binary file.
+
+    Streams with ``ijson`` when it is installed (the ``batch`` extra), so
+    a large discovery file is never materialised as one dict tree next
+    to the entries built from it; otherwise the whole file is decoded
+    at once.
+    """
+    try:
+        import ijson
+    except ImportError:
+        yield from json_loads(f.read())
+        return
+    yield from ijson.items(f, "item")
+
+
 def load_discovery_file(path: str) -> list[PackageEntry]:
     """Load packages from a discovery JSON file."""
-    with open(path) as f:
-        data = json.load(f)
-
-    return [
-        PackageEntry(
-            obs_package=item["obs_package"],
-            github_owner=item["github_owner"],
-            github_repo=item["github_repo"],
-            repo_url=item["repo_url"],
-            source=item["source"],
-            obs_project=item.get("obs_project", ""),
-        )
-        for item in data
-    ]
+    with open(path, "rb") as f:
+        return [
+            PackageEntry(
+                obs_package=item["obs_package"],
+                github_owner=item["github_owner"],
+                github_repo=item["github_repo"],
+                repo_url=item["repo_url"],
+                source=item["source"],
+                obs_project=item.get("obs_project", ""),
+            )
+            for item in _iter_json_array(f)
+        ]
 
 
 _GITHUB_URL_RE = re.compile(r"^https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$")
 
+_SEED_ECOSYSTEMS: frozenset[str] = frozenset({
+    "github", "npm", "pypi", "cargo", "rubygems", "packagist", "nuget", "go",
+})
+
 
 def load_custom_seed(path: str) -> list[PackageEntry]:
     """Load packages from a custom YAML seed file.
@@ -117,8 +140,10 @@ def load_custom_seed(path: str) -> list[PackageEntry]:
     """
     import yaml
 
+    # libyaml's C loader when PyYAML was built with it; same safe subset.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=loader)
 
     if not isinstance(data, dict) or "packages" not in data:
         raise ValueError(f"Invalid seed file: expected top-level 'packages' key in {path}")
@@ -154,8 +179,7 @@ def load_custom_seed(path: str) -> list[PackageEntry]:
                     f"Entry {i + 1} ({name}): non-GitHub repo URL requires explicit 'ecosystem'"
                 )
 
-        supported = {"github", "npm", "pypi", "cargo", "rubygems", "packagist", "nuget", "go"}
-        if ecosystem not in supported:
+        if ecosystem not in _SEED_ECOSYSTEMS:
             raise ValueError(f"Entry {i + 1} ({name}): unsupported ecosystem '{ecosystem}'")
 
         # GitHub entries need a valid repo URL
@@ -198,13 +222,20 @@ def load_custom_seed(path: str) -> list[PackageEntry]:
 # Dependency file parsers for `ossuary scan`
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedPackage:
     """A package extracted from a dependency file."""
     name: str
     is_dev: bool = False
 
 
+# Characters that end the distribution name in a requirement line. PEP 508
+# strings in pyproject.toml may also separate the name with a space
+# ("foo (>=1)").
+_REQUIREMENT_NAME_END_RE = re.compile(r"[><=!~;@\[]")
+_PYPROJECT_NAME_END_RE = re.compile(r"[><=!~;\[@ ]")
+
+
 def _parse_requirements_txt(path: str) -> list[ParsedPackage]:
     """Parse requirements.txt / constraints.txt."""
     packages = []
@@ -214,7 +245,7 @@ def _parse_requirements_txt(path: str) -> list[ParsedPackage]:
             if not line or line.startswith("#") or line.startswith("-"):
                 continue
             # Strip version specifiers: requests>=2.28,<3 → requests
-            name = re.split(r"[><=!~;@\[]", line)[0].strip()
+            name = _REQUIREMENT_NAME_END_RE.split(line, maxsplit=1)[0].strip()
             if name:
                 packages.append(ParsedPackage(name=name))
     return packages
@@ -222,8 +253,8 @@ def _parse_requirements_txt(path: str) -> list[ParsedPackage]:
 
 def _parse_package_json(path: str) -> list[ParsedPackage]:
     """Parse package.json for npm dependencies."""
-    with open(path) as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = json_loads(f.read())
     packages = []
     for name in data.get("dependencies", {}):
         packages.append(ParsedPackage(name=name, is_dev=False))
@@ -234,10 +265,6 @@ def _parse_package_json(path: str) -> list[ParsedPackage]:
 
 def _parse_cargo_toml(path: str) -> list[ParsedPackage]:
     """Parse Cargo.toml for Rust crate dependencies."""
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib  # type: ignore[no-redef]
     with open(path, "rb") as f:
         data = tomllib.load(f)
     packages = []
@@ -250,55 +277,66 @@ def _parse_cargo_toml(path: str) -> list[ParsedPackage]:
     return packages
 
 
+# A ``require ( ... )`` block (body in group 1, closed by a line holding
+# only ``)``, or end of file) or a single-line ``require <module> <version>``
+# (module in group 2).
+_GO_REQUIRE_RE = re.compile(
+    r"^[ \t]*require \([^\n]*\n(.*?)(?:^[ \t]*\)[ \t]*$|\Z)"
+    r"|^[ \t]*require[ \t]+([^\s(]\S*)",
+    re.MULTILINE | re.DOTALL,
+)
+# First token of each non-comment line inside a require block.
+_GO_BLOCK_MODULE_RE = re.compile(r"^[ \t]*(?!//)(\S+)", re.MULTILINE)
+
+
 def _parse_go_mod(path: str) -> list[ParsedPackage]:
     """Parse go.mod for Go module dependencies."""
-    packages = []
-    in_require = False
     with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("require ("):
-                in_require = True
-                continue
-            if in_require and line == ")":
-                in_require = False
-                continue
-            if in_require:
-                # e.g. "github.com/gin-gonic/gin v1.9.1"
-                parts = line.split()
-                if parts and not parts[0].startswith("//"):
-                    packages.append(ParsedPackage(name=parts[0]))
-            elif line.startswith("require "):
-                # Single-line require: "require github.com/foo/bar v1.0.0"
-                parts = line.split()
-                if len(parts) >= 2:
-                    packages.append(ParsedPackage(name=parts[1]))
+        text = f.read()
+    packages = []
+    for m in _GO_REQUIRE_RE.finditer(text):
+        block, single = m.groups()
+        if single is not None:
+            # Single-line require: "require github.com/foo/bar v1.0.0"
+            packages.append(ParsedPackage(name=single))
+        else:
+            # e.g. "github.com/gin-gonic/gin v1.9.1"
+            packages.extend(
+                ParsedPackage(name=name)
+                for name in _GO_BLOCK_MODULE_RE.findall(block)
+            )
     return packages
 
 
+_GEM_RE = re.compile(r"""gem\s+['"]([^'"]+)['"]""")
+_GEM_DEV_GROUP_RE = re.compile(r"""group\s+.*:(?:development|test)""")
+
+
 def _parse_gemfile(path: str) -> list[ParsedPackage]:
     """Parse Gemfile for Ruby gem dependencies."""
     packages = []
-    gem_re = re.compile(r"""^\s*gem\s+['"]([^'"]+)['"]""")
     # Dev groups
     in_dev_group = False
-    group_re = re.compile(r"""^\s*group\s+.*:(?:development|test)""")
     with open(path) as f:
         for line in f:
-            if group_re.search(line):
+            # Both patterns only apply from the first non-blank character,
+            # so a prefix check skips the regex on every other line.
+            stripped = line.lstrip()
+            if stripped.startswith("group") and _GEM_DEV_GROUP_RE.match(stripped):
                 in_dev_group = True
-            elif line.strip() == "end":
+            elif stripped.rstrip() == "end":
                 in_dev_group = False
-            m = gem_re.match(line)
-            if m:
-                packages.append(ParsedPackage(name=m.group(1), is_dev=in_dev_group))
+            if stripped.startswith("gem"):
+                m = _GEM_RE.match(stripped)
+                if m:
+                    packages.append(ParsedPackage(name=m.group(1), is_dev=in_dev_group))
     return packages
 
 
 def _parse_composer_json(path: str) -> list[ParsedPackage]:
     """Parse composer.json for PHP Packagist dependencies."""
-    with open(path) as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = json_loads(f.read())
     packages = []
     for name in data.get("require", {}):
         # Skip PHP itself and extensions
@@ -315,12 +353,18 @@ def _parse_composer_json(path: str) -> list[ParsedPackage]:
 def _parse_csproj(path: str) -> list[ParsedPackage]:
     """Parse .csproj or packages.config for NuGet dependencies."""
     import xml.etree.ElementTree as ET
-    tree = ET.parse(path)
-    root = tree.getroot()
     packages = []
-    # .csproj format: <PackageReference Include="Newtonsoft.Json" Version="13.0.1" />
-    for elem in root.iter():
-        tag = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+    # Stream the document: each element is inspected when it closes and
+    # then detached from its parent, so the tree never grows past the
+    # currently open elements.
+    open_elems = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            open_elems.append(elem)
+            continue
+        open_elems.pop()
+        tag = elem.tag.rpartition("}")[2]
+        # .csproj format: <PackageReference Include="Newtonsoft.Json" Version="13.0.1" />
         if tag == "PackageReference":
             name = elem.get("Include")
             if name:
@@ -330,32 +374,42 @@ def _parse_csproj(path: str) -> list[ParsedPackage]:
             name = elem.get("id")
             if name:
                 packages.append(ParsedPackage(name=name))
+        if open_elems:
+            # A closed element is always its parent's last child.
+            del open_elems[-1][-1]
     return packages
 
 
 def _parse_pyproject_toml(path: str) -> list[ParsedPackage]:
     """Parse pyproject.toml for Python dependencies."""
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib  # type: ignore[no-redef]
     with open(path, "rb") as f:
         data = tomllib.load(f)
     packages = []
     project = data.get("project", {})
     for dep in project.get("dependencies", []):
-        name = re.split(r"[><=!~;\[@ ]", dep)[0].strip()
+        name = _PYPROJECT_NAME_END_RE.split(dep, maxsplit=1)[0].strip()
         if name:
             packages.append(ParsedPackage(name=name, is_dev=False))
     for group_deps in project.get("optional-dependencies", {}).values():
         for dep in group_deps:
-            name = re.split(r"[><=!~;\[@ ]", dep)[0].strip()
+            name = _PYPROJECT_NAME_END_RE.split(dep, maxsplit=1)[0].strip()
             if name:
                 packages.append(ParsedPackage(name=name, is_dev=True))
     return packages
 
 
 # Map filename patterns to (ecosystem, parser)
+_ECOSYSTEM_PARSERS: dict[str, callable] = {
+    "pypi": _parse_requirements_txt,
+    "npm": _parse_package_json,
+    "cargo": _parse_cargo_toml,
+    "go": _parse_go_mod,
+    "rubygems": _parse_gemfile,
+    "packagist": _parse_composer_json,
+    "nuget": _parse_csproj,
+}
+
+# Exact (lowercased) filenames.
 _FILE_PARSERS: dict[str, tuple[str, callable]] = {
     "requirements.txt": ("pypi", _parse_requirements_txt),
     "constraints.txt": ("pypi", _parse_requirements_txt),
@@ -365,8 +419,30 @@ _FILE_PARSERS: dict[str, tuple[str, callable]] = {
     "go.mod": ("go", _parse_go_mod),
     "gemfile": ("rubygems", _parse_gemfile),
     "composer.json": ("packagist", _parse_composer_json),
+    "packages.config": ("nuget", _parse_csproj),
 }
 
+# Fallbacks for variant filenames, tried in order when there is no
+# exact match: ``(suffix, required_substring, ecosystem)``.
+_FILE_SUFFIX_RULES: tuple[tuple[str, str, str], ...] = (
+    (".txt", "requirements", "pypi"),
+    (".txt", "constraints", "pypi"),
+    ("package.json", "", "npm"),
+    ("composer.json", "", "packagist"),
+    (".csproj", "", "nuget"),
+)
+
+
+def _detect_parser(filename: str) -> Optional[tuple[str, callable]]:
+    """Return ``(ecosystem, parser)`` for a lowercased filename, if known."""
+    detected = _FILE_PARSERS.get(filename)
+    if detected is not None:
+        return detected
+    for suffix, needle, ecosystem in _FILE_SUFFIX_RULES:
+        if filename.endswith(suffix) and needle in filename:
+            return ecosystem, _ECOSYSTEM_PARSERS[ecosystem]
+    return None
+
 
 def parse_dependency_file(
     path: str,
@@ -381,90 +457,116 @@ def parse_dependency_file(
     filename = Path(path).name.lower()
 
     # Detect parser
-    parser_fn = None
     ecosystem = ecosystem_override
 
     if ecosystem_override:
         # Use override ecosystem with matching parser
-        eco_to_parser = {
-            "pypi": _parse_requirements_txt,
-            "npm": _parse_package_json,
-            "cargo": _parse_cargo_toml,
-            "go": _parse_go_mod,
-            "rubygems": _parse_gemfile,
-            "packagist": _parse_composer_json,
-            "nuget": _parse_csproj,
-        }
-        parser_fn = eco_to_parser.get(ecosystem_override)
+        parser_fn = _ECOSYSTEM_PARSERS.get(ecosystem_override)
         if not parser_fn:
             raise ValueError(f"No parser for ecosystem '{ecosystem_override}'")
     else:
         # Auto-detect from filename
-        if filename in _FILE_PARSERS:
-            ecosystem, parser_fn = _FILE_PARSERS[filename]
-        elif filename.endswith(".txt") and "requirements" in filename:
-            ecosystem, parser_fn = "pypi", _parse_requirements_txt
-        elif filename.endswith(".txt") and "constraints" in filename:
-            ecosystem, parser_fn = "pypi", _parse_requirements_txt
-        elif filename.endswith("package.json"):
-            ecosystem, parser_fn = "npm", _parse_package_json
-        elif filename.endswith("composer.json"):
-            ecosystem, parser_fn = "packagist", _parse_composer_json
-        elif filename.endswith(".csproj") or filename == "packages.config":
-            ecosystem, parser_fn = "nuget", _parse_csproj
-        else:
+        detected = _detect_parser(filename)
+        if detected is None:
             raise ValueError(
                 f"Cannot detect ecosystem from '{filename}'. "
                 f"Use -e/--ecosystem to specify (pypi, npm, cargo, go, rubygems, packagist, nuget)."
             )
+        ecosystem, parser_fn = detected
 
     parsed = parser_fn(path)
 
     if not include_dev:
         parsed = [p for p in parsed if not p.is_dev]
 
-    # Deduplicate
-    seen = set()
-    entries = []
+    # Deduplicate case-insensitively; the first spelling seen wins.
+    names: dict[str, str] = {}
     for p in parsed:
-        key = p.name.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        entries.append(
-            PackageEntry(
-                obs_package=p.name,
-                github_owner="",
-                github_repo="",
-                repo_url="",
-                source="scan",
-                ecosystem=ecosystem,
-            )
-        )
+        names.setdefault(p.name.lower(), p.name)
 
+    entries = [
+        PackageEntry(
+            obs_package=name,
+            github_owner="",
+            github_repo="",
+            repo_url="",
+            source="scan",
+            ecosystem=ecosystem,
+        )
+        for name in names.values()
+    ]
     return ecosystem, entries
 
 
-def is_fresh(package_name: str, ecosystem: str, max_age_days: int = 7) -> bool:
-    """Check if a package has been scored recently enough to skip."""
+FRESHNESS_QUERY_CHUNK = 1000
+"""Maximum names per ``IN (...)`` clause in :func:`load_last_analyzed`;
+keeps each query under SQLite's bound-parameter limit."""
+
+
+def load_last_analyzed(
+    packages: Iterable[tuple[str, str]],
+    since: Optional[datetime] = None,
+) -> dict[tuple[str, str], datetime]:
+    """Bulk-fetch ``last_analyzed`` for ``(package_name, ecosystem)`` pairs.
+
+    Issues one query per ecosystem per :data:`FRESHNESS_QUERY_CHUNK`
+    names instead of one per package. Keys of the returned dict are the
+    caller's pairs (names are canonicalised for the lookup only); pairs
+    with no row or no ``last_analyzed`` are absent, as are pairs last
+    analyzed at or before ``since`` when it is given. Any DB error
+    yields an empty dict, i.e. nothing is treated as fresh.
+    """
+    # ecosystem -> canonical name -> caller keys mapping to it
+    wanted: dict[str, dict[str, list[tuple[str, str]]]] = {}
+    for name, ecosystem in packages:
+        canonical = normalize_package_name(name, ecosystem)
+        wanted.setdefault(ecosystem, {}).setdefault(canonical, []).append((name, ecosystem))
+
+    found: dict[tuple[str, str], datetime] = {}
     try:
-        from ossuary.db.models import Package
-        from ossuary.services.cache import normalize_package_name
-        canonical = normalize_package_name(package_name, ecosystem)
         with session_scope() as session:
-            pkg = (
-                session.query(Package)
-                .filter(Package.name == canonical, Package.ecosystem == ecosystem)
-                .first()
-            )
-            if pkg is None:
-                return False
-            if pkg.last_analyzed is None:
-                return False
-            age = (utcnow_naive() - pkg.last_analyzed).days
-            return age < max_age_days
+            for ecosystem, by_canonical in wanted.items():
+                names = list(by_canonical)
+                for start in range(0, len(names), FRESHNESS_QUERY_CHUNK):
+                    query = session.query(Package.name, Package.last_analyzed).filter(
+                        Package.ecosystem == ecosystem,
+                        Package.name.in_(names[start:start + FRESHNESS_QUERY_CHUNK]),
+                    )
+                    if since is not None:
+                        query = query.filter(Package.last_analyzed > since)
+                    rows = query.all()
+                    for canonical, last_analyzed in rows:
+                        if last_analyzed is None:
+                            continue
+                        for key in by_canonical.get(canonical, ()):
+                            found[key] = last_analyzed
     except Exception:
-        return False
+        return {}
+    return found
+
+
+def _fresh_cutoff(max_age_days: int) -> datetime:
+    """Return the ``last_analyzed`` instant a score must be newer than to be fresh.
+
+    ``last_analyzed > now - max_age_days`` is the same test as the
+    whole-day ``(now - last_analyzed).days < max_age_days``, but it can
+    be evaluated in SQL.
+    """
+    return utcnow_naive() - timedelta(days=max_age_days)
+
+
+def is_fresh(package_name: str, ecosystem: str, max_age_days: int = 7) -> bool:
+    """Check if a package has been scored recently enough to skip."""
+    return (package_name, ecosystem) in load_last_analyzed(
+        [(package_name, ecosystem)], since=_fresh_cutoff(max_age_days)
+    )
+
+
+def _entry_package_name(entry: "PackageEntry") -> str:
+    """Name under which an entry is scored and cached."""
+    if entry.ecosystem == "github":
+        return f"{entry.github_owner}/{entry.github_repo}"
+    return entry.obs_package
 
 
 def _entry_repo_url(entry: "PackageEntry") -> Optional[str]:
@@ -561,6 +663,33 @@ def _build_repo_plan(packages: list["PackageEntry"]) -> _RepoPlan:
     return plan
 
 
+async def _run_worker_pool(
+    units: list[_Unit],
+    workers: int,
+    handle: Callable[[_Unit], Awaitable[None]],
+) -> None:
+    """Run ``handle`` over ``units`` with at most ``workers`` in flight.
+
+    A fixed pool of workers pulls from a shared queue, so only
+    ``workers`` coroutines exist at any time regardless of batch size,
+    and each completion is handled as soon as it lands. An exception
+    raised by ``handle`` propagates to the caller.
+    """
+    queue: asyncio.Queue[_Unit] = asyncio.Queue()
+    for unit in units:
+        queue.put_nowait(unit)
+
+    async def worker() -> None:
+        while True:
+            try:
+                unit = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await handle(unit)
+
+    await asyncio.gather(*(worker() for _ in range(min(max(workers, 1), len(units)))))
+
+
 async def batch_score(
     packages: list[PackageEntry],
     max_concurrent: int = 3,
@@ -620,9 +749,18 @@ async def batch_score(
         packages = packages[:max_packages]
 
     result = BatchResult(total=len(packages))
-    semaphore = asyncio.Semaphore(max_concurrent)
     completed = 0
 
+    # Freshness gate: one bulk lookup up front instead of a DB round-trip
+    # per entry inside score_one. The age cutoff is applied in SQL, so
+    # every returned pair is fresh.
+    fresh: set[tuple[str, str]] = set()
+    if skip_fresh:
+        fresh = set(load_last_analyzed(
+            ((_entry_package_name(entry), entry.ecosystem) for entry in packages),
+            since=_fresh_cutoff(fresh_days),
+        ))
+
     # Per-entry RegistryData captured by the probe pre-pass (when
     # ``probe_registries=True``). Threaded into ``score_package`` so
     # ``cached_collect`` reuses it instead of doing its own probe call —
@@ -632,116 +770,38 @@ async def batch_score(
 
     async def score_one(entry: PackageEntry) -> tuple[str, str]:
         """Score a single package, returning (pkg_name, status)."""
-        nonlocal completed
-
         eco = entry.ecosystem
-        if eco == "github":
-            pkg_name = f"{entry.github_owner}/{entry.github_repo}"
-        else:
-            pkg_name = entry.obs_package
+        pkg_name = _entry_package_name(entry)
 
         # Check freshness
-        if skip_fresh and is_fresh(pkg_name, eco, fresh_days):
-            completed += 1
+        if (pkg_name, eco) in fresh:
             return pkg_name, "skipped"
 
-        async with semaphore:
-            try:
-                kwargs = {}
-                if entry.repo_url:
-                    kwargs["repo_url"] = entry.repo_url
-                prefetched = prefetched_per_entry.get(id(entry))
-                if prefetched is not None:
-                    kwargs["prefetched_registry"] = prefetched
-                scoring_result = await score_package(
-                    pkg_name,
-                    eco,
-                    force=not skip_fresh,
-                    **kwargs,
-                )
-                completed += 1
-
-                if scoring_result.success:
-                    return pkg_name, "scored"
-                else:
-                    return pkg_name, f"error: {scoring_result.error}"
-            except Exception as e:
-                completed += 1
-                return pkg_name, f"error: {e}"
-
-    # Process all packages.
-    if repo_aware:
-        # Optional pre-pass: probe registries for entries that have no
-        # knowable URL yet. Mutates entry.repo_url in place so the
-        # subsequent _build_repo_plan call can group them, AND stashes
-        # the full RegistryData in prefetched_per_entry so score_one
-        # can plumb it through to cached_collect — that way the probe
-        # call done here REPLACES the one cached_collect would
-        # otherwise make, instead of duplicating it.
-        if probe_registries:
-            probe_targets = [e for e in packages if not _entry_repo_url(e)]
-            result.probed = len(probe_targets)
-            if probe_targets:
-                probed = await _probe_registry_urls(
-                    probe_targets, max_concurrent,
-                )
-                for entry in probe_targets:
-                    registry = probed.get(id(entry))
-                    if registry is not None and registry.repo_url:
-                        entry.repo_url = registry.repo_url
-                        prefetched_per_entry[id(entry)] = registry
-                        result.probe_resolved += 1
-
-        # Group by canonical repo URL up front; entries inside a group
-        # process sequentially (first warms the cache, subsequent hit
-        # it). Across groups, run with the standard semaphore. Entries
-        # we can't pre-group go through the standard parallel path.
-        plan = _build_repo_plan(packages)
-        result.unique_repos = len(plan.groups)
-        result.shared_repo_packages = sum(
-            len(g) for g in plan.groups.values() if len(g) > 1
-        )
-        result.unplanable = len(plan.unplanable)
-
-        async def process_group(entries: list[PackageEntry]) -> list[tuple[str, str]]:
-            """Score every entry in a group, sequentially. The first
-            call does the upstream fetch and writes the snapshot; the
-            rest hit the per-package or repo-keyed cache."""
-            outcomes: list[tuple[str, str]] = []
-            for entry in entries:
-                outcomes.append(await score_one(entry))
-            return outcomes
-
-        # One asyncio task per group + one per unplanable entry. The
-        # semaphore inside score_one bounds concurrency for the actual
-        # upstream calls; group serialisation here is purely for
-        # cache-warm sequencing and doesn't fight with the semaphore
-        # (a group's only one outstanding call at any moment).
-        group_tasks = [process_group(g) for g in plan.groups.values()]
-        unplanable_tasks = [process_group([e]) for e in plan.unplanable]
-        all_tasks = group_tasks + unplanable_tasks
-
-        for coro in asyncio.as_completed(all_tasks):
-            outcomes = await coro
-            for pkg_name, status in outcomes:
-                if status == "scored":
-                    result.scored += 1
-                elif status == "skipped":
-                    result.skipped += 1
-                else:
-                    result.errors += 1
-                    result.error_details.append(f"{pkg_name}: {status}")
-                if progress_callback:
-                    progress_callback(completed, result.total, pkg_name, status)
-
-        return result
-
-    # Default (non-repo-aware) parallel path — preserves prior behaviour.
-    tasks = [score_one(entry) for entry in packages]
+        try:
+            kwargs = {}
+            if entry.repo_url:
+                kwargs["repo_url"] = entry.repo_url
+            prefetched = prefetched_per_entry.get(id(entry))
+            if prefetched is not None:
+                kwargs["prefetched_registry"] = prefetched
+            scoring_result = await score_package(
+                pkg_name,
+                eco,
+                force=not skip_fresh,
+                **kwargs,
+            )
 
-    for coro in asyncio.as_completed(tasks):
-        pkg_name, status = await coro
+            if scoring_result.success:
+                return pkg_name, "scored"
+            else:
+                return pkg_name, f"error: {scoring_result.error}"
+        except Exception as e:
+            return pkg_name, f"error: {e}"
 
+    def record(pkg_name: str, status: str) -> None:
+        """Fold one outcome into ``result`` and report progress."""
+        nonlocal completed
+        completed += 1
         if status == "scored":
             result.scored += 1
         elif status == "skipped":
@@ -749,8 +809,64 @@ async def batch_score(
         else:
             result.errors += 1
             result.error_details.append(f"{pkg_name}: {status}")
-
         if progress_callback:
             progress_callback(completed, result.total, pkg_name, status)
 
-    return result
+    # Process all packages; their collectors share one HTTP connection
+    # pool for the whole run.
+    async with shared_http_pool():
+        if repo_aware:
+            # Optional pre-pass: probe registries for entries that have no
+            # knowable URL yet. Mutates entry.repo_url in place so the
+            # subsequent _build_repo_plan call can group them, AND stashes
+            # the full RegistryData in prefetched_per_entry so score_one
+            # can plumb it through to cached_collect — that way the probe
+            # call done here REPLACES the one cached_collect would
+            # otherwise make, instead of duplicating it.
+            if probe_registries:
+                probe_targets = [e for e in packages if not _entry_repo_url(e)]
+                result.probed = len(probe_targets)
+                if probe_targets:
+                    probed = await _probe_registry_urls(
+                        probe_targets, max_concurrent,
+                    )
+                    for entry in probe_targets:
+                        registry = probed.get(id(entry))
+                        if registry is not None and registry.repo_url:
+                            entry.repo_url = registry.repo_url
+                            prefetched_per_entry[id(entry)] = registry
+                            result.probe_resolved += 1
+
+            # Group by canonical repo URL up front; entries inside a group
+            # process sequentially (first warms the cache, subsequent hit
+            # it). Across groups, run with the standard worker pool. Entries
+            # we can't pre-group go through the standard parallel path.
+            plan = _build_repo_plan(packages)
+            result.unique_repos = len(plan.groups)
+            result.shared_repo_packages = sum(
+                len(g) for g in plan.groups.values() if len(g) > 1
+            )
+            result.unplanable = len(plan.unplanable)
+
+            async def process_group(entries: list[PackageEntry]) -> None:
+                """Score every entry in a group, sequentially. The first
+                call does the upstream fetch and writes the snapshot; the
+                rest hit the per-package or repo-keyed cache."""
+                for entry in entries:
+                    record(*await score_one(entry))
+
+            # One work unit per group + one per unplanable entry, drained by
+            # ``max_concurrent`` workers. The pool bounds concurrency for the
+            # actual upstream calls; group serialisation here is purely for
+            # cache-warm sequencing (a group has only one outstanding call at
+            # any moment).
+            units = list(plan.groups.values()) + [[e] for e in plan.unplanable]
+            await _run_worker_pool(units, max_concurrent, process_group)
+            return result
+
+        # Default (non-repo-aware) parallel path — preserves prior behaviour.
+        async def process_entry(entry: PackageEntry) -> None:
+            record(*await score_one(entry))
+
+        await _run_worker_pool(packages, max_concurrent, process_entry)
+        return result
@@ -8,12 +8,19 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from ossuary._compat import utcnow_naive
-from ossuary.db.models import Package, Score
+from ossuary.db.models import DependencyManifest, Package, Score
 
 
 # Default freshness threshold: 7 days
 CACHE_FRESHNESS_DAYS = int(os.getenv("OSSUARY_CACHE_DAYS", "7"))
 
+# Dependency manifests track a package's *latest* release, so they go
+# stale much faster than scores: 1 hour by default.
+MANIFEST_FRESHNESS_MINUTES = int(os.getenv("OSSUARY_MANIFEST_CACHE_MINUTES", "60"))
+
+# Names per ``IN (...)`` query, under SQLite's bound-parameter limit.
+_MANIFEST_QUERY_CHUNK = 500
+
 
 _PYPI_NORMALIZE_RE = re.compile(r"[-_.]+")
 
@@ -111,6 +118,25 @@ class ScoreCache:
             .first()
         )
 
+    def get_scores_for_cutoffs(
+        self, package: Package, cutoff_dates: list[datetime]
+    ) -> dict[datetime, Score]:
+        """Get cached scores for a set of exact cutoff dates.
+
+        One query for the whole set; when a cutoff has several rows the
+        most recently calculated one wins, as in :meth:`get_score_for_cutoff`.
+        Cutoffs without a row are absent from the result.
+        """
+        if not cutoff_dates:
+            return {}
+        rows = (
+            self.session.query(Score)
+            .filter(Score.package_id == package.id, Score.cutoff_date.in_(cutoff_dates))
+            .order_by(Score.calculated_at.asc())
+            .all()
+        )
+        return {row.cutoff_date: row for row in rows}
+
     def get_current_score(self, package: Package) -> Optional[Score]:
         """Get most recent current score for a package.
 
@@ -207,3 +233,58 @@ class ScoreCache:
             .delete()
         )
         return count
+
+
+class ManifestCache:
+    """Persists registry dependency lists for the dependency-tree commands."""
+
+    def __init__(
+        self, session: Session, freshness_minutes: int = MANIFEST_FRESHNESS_MINUTES
+    ):
+        self.session = session
+        self.freshness_threshold = timedelta(minutes=freshness_minutes)
+
+    def get_fresh(self, ecosystem: str, names: list[str]) -> dict[str, list[str]]:
+        """Return cached dependency lists for ``names`` still within the TTL.
+
+        Names without a fresh row are absent from the result.
+        """
+        fresh_after = utcnow_naive() - self.freshness_threshold
+        found: dict[str, list[str]] = {}
+        for i in range(0, len(names), _MANIFEST_QUERY_CHUNK):
+            rows = (
+                self.session.query(DependencyManifest)
+                .filter(
+                    DependencyManifest.ecosystem == ecosystem,
+                    DependencyManifest.name.in_(names[i:i + _MANIFEST_QUERY_CHUNK]),
+                    DependencyManifest.fetched_at >= fresh_after,
+                )
+                .all()
+            )
+            found.update((row.name, list(row.dependencies)) for row in rows)
+        return found
+
+    def store(self, ecosystem: str, manifests: dict[str, list[str]]) -> None:
+        """Insert or refresh the dependency lists in ``manifests``."""
+        names = list(manifests)
+        existing: dict[str, DependencyManifest] = {}
+        for i in range(0, len(names), _MANIFEST_QUERY_CHUNK):
+            rows = (
+                self.session.query(DependencyManifest)
+                .filter(
+                    DependencyManifest.ecosystem == ecosystem,
+                    DependencyManifest.name.in_(names[i:i + _MANIFEST_QUERY_CHUNK]),
+                )
+                .all()
+            )
+            existing.update((row.name, row) for row in rows)
+        now = utcnow_naive()
+        for name, deps in manifests.items():
+            row = existing.get(name)
+            if row is None:
+                self.session.add(DependencyManifest(
+                    ecosystem=ecosystem, name=name, dependencies=list(deps), fetched_at=now,
+                ))
+            else:
+                row.dependencies = list(deps)
+                row.fetched_at = now
@@ -1,25 +1,29 @@
 """Reusable scoring functions for ossuary."""
 
+import asyncio
+import functools
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 
 from dateutil.relativedelta import relativedelta
 
+from ossuary.collectors.base import shared_http_pool
 from ossuary.collectors.git import CommitData, GitCollector, GitMetrics
 from ossuary.collectors.github import GitHubCollector, GitHubData, IssueData
 from ossuary.collectors.npm import NpmCollector
 from ossuary.collectors.pypi import PyPICollector
 from ossuary.collectors.registries import REGISTRY_COLLECTORS
+from ossuary.db.models import Score
 from ossuary.db.session import session_scope
 from ossuary.scoring.engine import PackageMetrics, RiskBreakdown, RiskScorer
-from ossuary.scoring.factors import RiskLevel
+from ossuary.scoring.factors import ProtectiveFactors, RiskLevel
 from ossuary.scoring.reputation import ReputationScorer
 from ossuary.sentiment.analyzer import SentimentAnalyzer
 from ossuary.services.cache import ScoreCache
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectedData:
     """All collected data for a package (cached for historical calculations).
 
@@ -64,7 +68,7 @@ class CollectedData:
     provisional_reasons: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringResult:
     """Result of a scoring operation."""
 
@@ -78,7 +82,7 @@ class ScoringResult:
             self.warnings = []
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HistoricalScore:
     """A single historical score data point."""
 
@@ -623,6 +627,12 @@ async def cached_collect(
     return data, warnings
 
 
+def _clone_and_extract(git_collector: GitCollector, repo_url: str) -> list[CommitData]:
+    """Clone (or update) ``repo_url`` and return every commit. Blocking."""
+    repo_path = git_collector.clone_or_update(repo_url)
+    return git_collector.extract_commits(repo_path)
+
+
 async def collect_package_data(
     package_name: str,
     ecosystem: str,
@@ -663,11 +673,12 @@ async def collect_package_data(
     if not repo_url:
         return None, [f"Package '{package_name}' not found on {ecosystem} (no repository URL)"]
 
-    # 2. Collect ALL git commits (not filtered by date)
+    # 2. Collect ALL git commits (not filtered by date). Clone and
+    #    ``git log`` block for seconds, so they run in a worker thread
+    #    to keep the event loop free for other packages' HTTP calls.
     git_collector = GitCollector()
     try:
-        repo_path = git_collector.clone_or_update(repo_url)
-        all_commits = git_collector.extract_commits(repo_path)
+        all_commits = await asyncio.to_thread(_clone_and_extract, git_collector, repo_url)
     except Exception as e:
         err_str = str(e)
         is_not_found = (
@@ -685,8 +696,9 @@ async def collect_package_data(
                 f"registry homepage fallback ({fallback})."
             )
             try:
-                repo_path = git_collector.clone_or_update(fallback)
-                all_commits = git_collector.extract_commits(repo_path)
+                all_commits = await asyncio.to_thread(
+                    _clone_and_extract, git_collector, fallback
+                )
                 repo_url = fallback
             except Exception as e2:
                 err_str2 = str(e2)
@@ -734,12 +746,16 @@ async def collect_package_data(
         # Pull through the per-call classification recorded inside
         # GitHubCollector.collect (essential vs non-essential).
         fetch_errors.extend(github_data.fetch_errors)
-        # Get repo stargazers for visibility proxy. This is the only
-        # other call after collect() — treat its failure as provisional
-        # since stars are only used as a fallback when downloads = 0.
+        # Get repo stargazers for visibility proxy. collect() already
+        # fetched the repo payload; only if that failed is it requested
+        # again — treat that failure as provisional since stars are only
+        # used as a fallback when downloads = 0.
         owner, repo = GitHubCollector.parse_repo_url(repo_url)
         if owner and repo:
-            repo_info = await github_collector.get_repo_info(owner, repo)
+            repo_info = (
+                github_collector.last_repo_info
+                or await github_collector.get_repo_info(owner, repo)
+            )
             if repo_info:
                 repo_stargazers = repo_info.get("stargazers_count", 0)
                 # Capture pushed_at for the snapshot-cache freshness
@@ -846,15 +862,31 @@ def _filter_issues_for_cutoff(issues: list[IssueData], cutoff_date: datetime) ->
     return filtered
 
 
+@functools.cache
+def _metrics_git_collector() -> GitCollector:
+    """Return the process-wide ``GitCollector`` used for metrics only.
+
+    ``calculate_metrics`` works on the commits it is given and never
+    touches the checkout directory, but constructing a collector creates
+    that directory — once per cutoff in historical scoring.
+    """
+    return GitCollector()
+
+
 def calculate_score_for_date(
     package_name: str,
     ecosystem: str,
     collected_data: CollectedData,
     cutoff_date: datetime,
+    sentiment_analyzer: Optional[SentimentAnalyzer] = None,
 ) -> RiskBreakdown:
     """
     Calculate risk score for a specific cutoff date using pre-collected data.
 
+    ``sentiment_analyzer`` may be shared across calls on the same data
+    (as ``get_historical_scores`` does) so texts already analysed for an
+    earlier cutoff are not re-scored.
+
     Honours the data-completeness contract: if ``collected_data.fetch_errors``
     is non-empty, no numeric score is computed. The result is a
     ``RiskBreakdown`` with ``risk_level == INSUFFICIENT_DATA``,
@@ -882,11 +914,9 @@ def calculate_score_for_date(
     # breakdown even though the score is computed normally below.
     provisional_reasons = list(collected_data.provisional_reasons)
 
-    git_collector = GitCollector()
-
     # Filter commits up to cutoff date and calculate metrics
     filtered_commits = [c for c in collected_data.all_commits if c.authored_date <= cutoff_date]
-    git_metrics = git_collector.calculate_metrics(filtered_commits, cutoff_date)
+    git_metrics = _metrics_git_collector().calculate_metrics(filtered_commits, cutoff_date)
 
     github_data = collected_data.github_data
     # A scoring run is "historical" when the cutoff is meaningfully in the past
@@ -965,7 +995,8 @@ def calculate_score_for_date(
     # from +20 in v6.2.1); commits already imply maintainer
     # authorship. See ``ossuary.sentiment.analyzer`` module docstring
     # for the v6.2 author-attribution design.
-    sentiment_analyzer = SentimentAnalyzer()
+    if sentiment_analyzer is None:
+        sentiment_analyzer = SentimentAnalyzer()
     commit_sentiment = sentiment_analyzer.analyze_commits([c.message for c in git_metrics.commits])
     maintainer_logins = (
         {github_data.maintainer_username}
@@ -1054,11 +1085,35 @@ def calculate_score_for_date(
     return breakdown
 
 
+# ``ProtectiveFactors`` field -> key under ``score.components.protective_factors``
+# in ``RiskBreakdown.to_dict()``, for ``_rebuild_breakdown``.
+_PROTECTIVE_SCORE_KEYS: tuple[tuple[str, str], ...] = (
+    ("reputation_score", "reputation"),
+    ("funding_score", "funding"),
+    ("org_score", "organization"),
+    ("visibility_score", "visibility"),
+    ("distributed_score", "distributed_governance"),
+    ("community_score", "community"),
+    ("cii_score", "cii_badge"),
+    ("frustration_score", "frustration"),
+    ("sentiment_score", "sentiment"),
+    ("maturity_score", "maturity"),
+    ("takeover_risk_score", "takeover_risk"),
+)
+_PROTECTIVE_EVIDENCE_KEYS: tuple[tuple[str, str, bool], ...] = (
+    # (field, key, defaults to an empty list rather than None)
+    ("reputation_evidence", "reputation", False),
+    ("funding_evidence", "funding", False),
+    ("frustration_evidence", "frustration", True),
+    ("sentiment_evidence", "sentiment", True),
+    ("maturity_evidence", "maturity", False),
+    ("takeover_risk_evidence", "takeover_risk", False),
+)
+
+
 def _rebuild_breakdown(cached_score, package_name: str, ecosystem: str) -> Optional[RiskBreakdown]:
     """Reconstruct a RiskBreakdown from cached Score data."""
     try:
-        from ossuary.scoring.factors import ProtectiveFactors
-
         d = cached_score.breakdown
         pkg = d.get("package", {})
         metrics = d.get("metrics", {})
@@ -1067,25 +1122,16 @@ def _rebuild_breakdown(cached_score, package_name: str, ecosystem: str) -> Optio
         components = score_data.get("components", {})
         pf = components.get("protective_factors", {})
 
-        protective = ProtectiveFactors(
-            reputation_score=pf.get("reputation", {}).get("score", 0),
-            funding_score=pf.get("funding", {}).get("score", 0),
-            org_score=pf.get("organization", {}).get("score", 0),
-            visibility_score=pf.get("visibility", {}).get("score", 0),
-            distributed_score=pf.get("distributed_governance", {}).get("score", 0),
-            community_score=pf.get("community", {}).get("score", 0),
-            cii_score=pf.get("cii_badge", {}).get("score", 0),
-            frustration_score=pf.get("frustration", {}).get("score", 0),
-            sentiment_score=pf.get("sentiment", {}).get("score", 0),
-            maturity_score=pf.get("maturity", {}).get("score", 0),
-            takeover_risk_score=pf.get("takeover_risk", {}).get("score", 0),
-            reputation_evidence=pf.get("reputation", {}).get("evidence"),
-            funding_evidence=pf.get("funding", {}).get("evidence"),
-            frustration_evidence=pf.get("frustration", {}).get("evidence", []),
-            sentiment_evidence=pf.get("sentiment", {}).get("evidence", []),
-            maturity_evidence=pf.get("maturity", {}).get("evidence"),
-            takeover_risk_evidence=pf.get("takeover_risk", {}).get("evidence"),
-        )
+        factor_kwargs = {
+            name: pf.get(key, {}).get("score", 0)
+            for name, key in _PROTECTIVE_SCORE_KEYS
+        }
+        for name, key, is_list in _PROTECTIVE_EVIDENCE_KEYS:
+            factor = pf.get(key, {})
+            factor_kwargs[name] = (
+                factor.get("evidence", []) if is_list else factor.get("evidence")
+            )
+        protective = ProtectiveFactors(**factor_kwargs)
 
         risk_level = RiskLevel(cached_score.risk_level)
 
@@ -1173,12 +1219,13 @@ async def score_package(
     # ``snapshot.collected_at >= cutoff`` constraint that ``datetime.now()``
     # would impose. See ``docs/data_reuse_design.md`` and
     # ``services/repo_cache.py::get_snapshot_for_cutoff`` for the dispatch.
-    collected_data, warnings = await cached_collect(
-        package_name, ecosystem, repo_url,
-        cutoff_date=cutoff_date,  # original Optional, NOT the derived `cutoff`
-        use_cache=use_cache,
-        prefetched_registry=prefetched_registry,
-    )
+    async with shared_http_pool():
+        collected_data, warnings = await cached_collect(
+            package_name, ecosystem, repo_url,
+            cutoff_date=cutoff_date,  # original Optional, NOT the derived `cutoff`
+            use_cache=use_cache,
+            prefetched_registry=prefetched_registry,
+        )
     if collected_data is None:
         return ScoringResult(success=False, error=warnings[0] if warnings else "Unknown error")
 
@@ -1233,6 +1280,18 @@ async def score_package(
     return ScoringResult(success=True, breakdown=breakdown, warnings=warnings)
 
 
+def _historical_from_row(row: Score) -> HistoricalScore:
+    """Build a ``HistoricalScore`` from a cached ``Score`` row."""
+    return HistoricalScore(
+        date=row.cutoff_date,
+        score=row.final_score,
+        risk_level=row.risk_level,
+        concentration=row.maintainer_concentration,
+        commits_year=row.commits_last_year,
+        contributors=row.unique_contributors,
+    )
+
+
 async def get_historical_scores(
     package_name: str,
     ecosystem: str,
@@ -1266,19 +1325,22 @@ async def get_historical_scores(
             cached_scores = cache.get_historical_scores(package, months) if package else []
             if len(cached_scores) >= months:
                 return [
-                    HistoricalScore(
-                        date=s.cutoff_date,
-                        score=s.final_score,
-                        risk_level=s.risk_level,
-                        concentration=s.maintainer_concentration,
-                        commits_year=s.commits_last_year,
-                        contributors=s.unique_contributors,
-                    )
+                    _historical_from_row(s)
                     for s in sorted(cached_scores, key=lambda x: x.cutoff_date)
                 ], []
 
-    # Collect all data once
-    collected_data, collect_warnings = await collect_package_data(package_name, ecosystem, repo_url)
+    # Collect all data once. With the cache on this goes through the
+    # snapshot cache like ``score_package`` does, so re-running a
+    # partially cached series doesn't re-clone and re-fetch GitHub data.
+    async with shared_http_pool():
+        if use_cache:
+            collected_data, collect_warnings = await cached_collect(
+                package_name, ecosystem, repo_url,
+            )
+        else:
+            collected_data, collect_warnings = await collect_package_data(
+                package_name, ecosystem, repo_url
+            )
     warnings.extend(collect_warnings)
 
     if collected_data is None:
@@ -1302,15 +1364,38 @@ async def get_historical_scores(
     # Sort chronologically (oldest first)
     cutoff_dates.sort()
 
-    # Calculate score for each month
+    # Reuse cached rows for cutoffs already scored and compute only the
+    # missing months. When most of the series is missing the cached rows
+    # are left over from an older run (the reference date moved on), so
+    # the whole series is recomputed for consistency.
+    cached_by_cutoff: dict[datetime, HistoricalScore] = {}
+    if use_cache:
+        with session_scope() as session:
+            cache = ScoreCache(session)
+            package = cache.get_package(package_name, ecosystem)
+            if package:
+                rows = cache.get_scores_for_cutoffs(package, cutoff_dates)
+                if months - len(rows) < months / 2:
+                    cached_by_cutoff = {
+                        cutoff: _historical_from_row(row) for cutoff, row in rows.items()
+                    }
+    missing_cutoffs = [c for c in cutoff_dates if c not in cached_by_cutoff]
+
+    # Calculate score for each missing month. The breakdowns are kept for
+    # the cache write below so each cutoff is scored exactly once, and one
+    # analyzer is shared so each commit message / issue text is
+    # sentiment-scored once rather than once per cutoff.
     historical_scores = []
-    for i, cutoff in enumerate(cutoff_dates):
+    breakdowns: list[RiskBreakdown] = []
+    sentiment_analyzer = SentimentAnalyzer()
+    for i, cutoff in enumerate(missing_cutoffs):
         if progress_callback:
-            progress_callback(i + 1, len(cutoff_dates))
+            progress_callback(i + 1, len(missing_cutoffs))
 
         try:
             breakdown = calculate_score_for_date(
-                package_name, ecosystem, collected_data, cutoff
+                package_name, ecosystem, collected_data, cutoff,
+                sentiment_analyzer=sentiment_analyzer,
             )
             historical_scores.append(HistoricalScore(
                 date=cutoff,
@@ -1320,6 +1405,7 @@ async def get_historical_scores(
                 commits_year=breakdown.commits_last_year,
                 contributors=breakdown.unique_contributors,
             ))
+            breakdowns.append(breakdown)
         except Exception as e:
             warnings.append(f"Failed to calculate score for {cutoff.date()}: {e}")
             # Continue with other dates
@@ -1334,10 +1420,7 @@ async def get_historical_scores(
             cache.clear_scores_for_cutoffs(package, [hs.date for hs in historical_scores])
 
             # Store new scores
-            for hs, cutoff in zip(historical_scores, cutoff_dates):
-                breakdown = calculate_score_for_date(
-                    package_name, ecosystem, collected_data, cutoff
-                )
+            for hs, breakdown in zip(historical_scores, breakdowns):
                 cache.store_score(
                     package=package,
                     cutoff_date=hs.date,
@@ -1354,4 +1437,8 @@ async def get_historical_scores(
                     is_provisional=breakdown.is_provisional,
                 )
 
+    if cached_by_cutoff:
+        historical_scores = sorted(
+            historical_scores + list(cached_by_cutoff.values()), key=lambda hs: hs.date,
+        )
     return historical_scores, warnings
@@ -0,0 +1,50 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from ossuary import _json
+from ossuary.db.models import Base
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run the test once per ``ossuary._json`` backend."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def memory_db(monkeypatch):
+    """Patch a ``session_scope`` onto a fresh in-memory SQLite DB.
+
+    Call it with the dotted path to patch, e.g.
+    ``memory_db("ossuary.services.batch.session_scope")``; it returns
+    the replacement scope so tests can seed rows through it.
+    """
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    make_session = sessionmaker(bind=engine)
+
+    @contextmanager
+    def scope():
+        sess = make_session()
+        try:
+            yield sess
+            sess.commit()
+        finally:
+            sess.close()
+
+    def use(target: str):
+        monkeypatch.setattr(target, scope)
+        return scope
+
+    return use
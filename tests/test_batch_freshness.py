@@ -0,0 +1,113 @@
+"""Bulk freshness gate for ``batch_score``.
+
+``batch_score(skip_fresh=True)`` used to open a session and issue one
+``SELECT`` per entry via ``is_fresh``. It now prefetches every entry's
+``last_analyzed`` up front through ``load_last_analyzed``. These tests
+pin that the bulk lookup returns the same answers the per-package path
+did (canonical PyPI names, missing rows, NULL timestamps, the age
+cutoff now applied in SQL) and that ``batch_score`` skips exactly the
+fresh entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from ossuary._compat import utcnow_naive
+from ossuary.db.models import Package
+from ossuary.services import batch
+from ossuary.services.batch import (
+    PackageEntry,
+    batch_score,
+    is_fresh,
+    load_last_analyzed,
+)
+
+
+@pytest.fixture
+def db(memory_db):
+    """Point ``batch.session_scope`` at a fresh in-memory SQLite DB."""
+    return memory_db("ossuary.services.batch.session_scope")
+
+
+def _add(scope, name: str, ecosystem: str, age_days) -> None:
+    last_analyzed = None if age_days is None else utcnow_naive() - timedelta(days=age_days)
+    with scope() as sess:
+        sess.add(Package(name=name, ecosystem=ecosystem, last_analyzed=last_analyzed))
+
+
+def _entry(name: str, eco: str) -> PackageEntry:
+    return PackageEntry(
+        obs_package=name,
+        github_owner="",
+        github_repo="",
+        repo_url="",
+        source="custom",
+        ecosystem=eco,
+    )
+
+
+class TestLoadLastAnalyzed:
+    def test_returns_caller_keys_for_canonical_pypi_rows(self, db):
+        _add(db, "pyyaml", "pypi", 1)
+        found = load_last_analyzed([("PyYAML", "pypi")])
+        assert set(found) == {("PyYAML", "pypi")}
+
+    def test_missing_and_never_analyzed_rows_are_absent(self, db):
+        _add(db, "never", "npm", None)
+        found = load_last_analyzed([("never", "npm"), ("absent", "npm")])
+        assert found == {}
+
+    def test_ecosystems_do_not_cross_match(self, db):
+        _add(db, "shared-name", "npm", 1)
+        found = load_last_analyzed([("shared-name", "pypi")])
+        assert found == {}
+
+    def test_chunks_large_name_lists(self, db, monkeypatch):
+        monkeypatch.setattr(batch, "FRESHNESS_QUERY_CHUNK", 2)
+        for i in range(5):
+            _add(db, f"pkg-{i}", "npm", 1)
+        found = load_last_analyzed([(f"pkg-{i}", "npm") for i in range(5)])
+        assert len(found) == 5
+
+    def test_since_filters_in_query(self, db):
+        _add(db, "recent", "npm", 1)
+        _add(db, "stale", "npm", 30)
+        found = load_last_analyzed(
+            [("recent", "npm"), ("stale", "npm")],
+            since=utcnow_naive() - timedelta(days=7),
+        )
+        assert set(found) == {("recent", "npm")}
+
+    def test_is_fresh_uses_age_threshold(self, db):
+        _add(db, "recent", "npm", 1)
+        _add(db, "stale", "npm", 30)
+        assert is_fresh("recent", "npm", max_age_days=7)
+        assert not is_fresh("stale", "npm", max_age_days=7)
+
+
+class TestBatchScoreFreshness:
+    def test_only_stale_entries_are_scored(self, db):
+        from ossuary.services.scorer import ScoringResult
+
+        _add(db, "recent", "npm", 1)
+        _add(db, "stale", "npm", 30)
+        scored = []
+
+        async def fake_score_package(name, eco, force=False, **kwargs):
+            scored.append(name)
+            return ScoringResult(success=True, breakdown=None)
+
+        with patch("ossuary.services.batch.score_package", side_effect=fake_score_package):
+            result = asyncio.run(batch_score(
+                [_entry("recent", "npm"), _entry("stale", "npm"), _entry("new", "npm")],
+                fresh_days=7,
+            ))
+
+        assert sorted(scored) == ["new", "stale"]
+        assert result.skipped == 1
+        assert result.scored == 2
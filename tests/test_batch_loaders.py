@@ -0,0 +1,304 @@
+"""Input loaders for batch scoring and ``ossuary scan``."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+
+import pytest
+
+from ossuary import _json
+from ossuary.services.batch import (
+    _detect_parser,
+    load_custom_seed,
+    load_discovery_file,
+    parse_dependency_file,
+)
+
+
+class TestLoadDiscoveryFile:
+    def test_builds_entries_from_top_level_array(self, tmp_path):
+        path = tmp_path / "discovery.json"
+        path.write_text(json.dumps([
+            {
+                "obs_package": "python-requests",
+                "github_owner": "psf",
+                "github_repo": "requests",
+                "repo_url": "https://github.com/psf/requests",
+                "source": "spec",
+                "obs_project": "devel:languages:python",
+            },
+            {
+                "obs_package": "zlib",
+                "github_owner": "madler",
+                "github_repo": "zlib",
+                "repo_url": "https://github.com/madler/zlib",
+                "source": "service",
+            },
+        ]))
+
+        entries = load_discovery_file(str(path))
+
+        assert [e.obs_package for e in entries] == ["python-requests", "zlib"]
+        assert entries[0].obs_project == "devel:languages:python"
+        assert entries[1].obs_project == ""
+        assert all(e.ecosystem == "github" for e in entries)
+
+    def test_empty_array(self, tmp_path):
+        path = tmp_path / "discovery.json"
+        path.write_text("[]")
+        assert load_discovery_file(str(path)) == []
+
+
+class TestDetectParser:
+    @pytest.mark.parametrize("filename, ecosystem", [
+        ("requirements.txt", "pypi"),
+        ("requirements-dev.txt", "pypi"),
+        ("dev-constraints.txt", "pypi"),
+        ("pyproject.toml", "pypi"),
+        ("frontend-package.json", "npm"),
+        ("composer.json", "packagist"),
+        ("app.csproj", "nuget"),
+        ("packages.config", "nuget"),
+        ("gemfile", "rubygems"),
+        ("go.mod", "go"),
+        ("cargo.toml", "cargo"),
+    ])
+    def test_detects_ecosystem(self, filename, ecosystem):
+        assert _detect_parser(filename)[0] == ecosystem
+
+    @pytest.mark.parametrize("filename", ["deps.txt", "requirements.in", "setup.py"])
+    def test_unknown_filenames(self, filename):
+        assert _detect_parser(filename) is None
+
+    def test_unknown_filename_needs_override(self, tmp_path):
+        path = tmp_path / "deps.txt"
+        path.write_text("requests>=2\n")
+        with pytest.raises(ValueError, match="Cannot detect ecosystem"):
+            parse_dependency_file(str(path))
+        ecosystem, entries = parse_dependency_file(str(path), ecosystem_override="pypi")
+        assert ecosystem == "pypi"
+        assert [e.obs_package for e in entries] == ["requests"]
+
+
+class TestRequirementParsers:
+    def test_requirements_txt_strips_specifiers(self, tmp_path):
+        path = tmp_path / "requirements.txt"
+        path.write_text(
+            "# comment\n"
+            "-r base.txt\n"
+            "requests>=2.28,<3\n"
+            "urllib3[socks]==2.0\n"
+            "pkg @ https://example.com/pkg.whl\n"
+            "tomli; python_version < '3.11'\n"
+            "plain\n"
+        )
+        _, entries = parse_dependency_file(str(path))
+        assert [e.obs_package for e in entries] == [
+            "requests", "urllib3", "pkg", "tomli", "plain",
+        ]
+
+    def test_pyproject_splits_on_space_too(self, tmp_path):
+        path = tmp_path / "pyproject.toml"
+        path.write_text(
+            "[project]\n"
+            'dependencies = ["httpx>=0.24", "rich (>=13)"]\n'
+            "[project.optional-dependencies]\n"
+            'dev = ["pytest[cov]>=7"]\n'
+        )
+        _, entries = parse_dependency_file(str(path))
+        assert [e.obs_package for e in entries] == ["httpx", "rich", "pytest"]
+        _, runtime = parse_dependency_file(str(path), include_dev=False)
+        assert [e.obs_package for e in runtime] == ["httpx", "rich"]
+
+
+class TestNuGetParser:
+    def test_csproj_package_references(self, tmp_path):
+        path = tmp_path / "App.csproj"
+        path.write_text(
+            '<Project Sdk="Microsoft.NET.Sdk">\n'
+            "  <ItemGroup>\n"
+            '    <PackageReference Include="Newtonsoft.Json" Version="13.0.1" />\n'
+            '    <PackageReference Include="Serilog">\n'
+            "      <Version>3.0.0</Version>\n"
+            "    </PackageReference>\n"
+            "  </ItemGroup>\n"
+            "</Project>\n"
+        )
+        ecosystem, entries = parse_dependency_file(str(path))
+        assert ecosystem == "nuget"
+        assert [e.obs_package for e in entries] == ["Newtonsoft.Json", "Serilog"]
+
+    def test_csproj_memory_does_not_grow_with_item_count(self, tmp_path):
+        def peak_bytes(n_items):
+            path = tmp_path / f"Big{n_items}.csproj"
+            path.write_text(
+                "<Project><ItemGroup>\n"
+                + '<Compile Include="src/File.cs" />\n' * n_items
+                + '<PackageReference Include="Serilog" />\n'
+                "</ItemGroup></Project>\n"
+            )
+            tracemalloc.start()
+            try:
+                _, entries = parse_dependency_file(str(path))
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            assert [e.obs_package for e in entries] == ["Serilog"]
+            return peak
+
+        peak_bytes(100)  # warm up parser and import caches
+        small, large = peak_bytes(2_000), peak_bytes(40_000)
+        # Closed elements are detached as they are read, so twenty times
+        # the items must not cost anywhere near twenty times the memory.
+        assert large < 2 * small
+
+    def test_namespaced_packages_config(self, tmp_path):
+        path = tmp_path / "packages.config"
+        path.write_text(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<packages xmlns="urn:example">\n'
+            '  <package id="Dapper" version="2.0.0" />\n'
+            '  <package id="Moq" version="4.18.0" />\n'
+            "</packages>\n"
+        )
+        _, entries = parse_dependency_file(str(path))
+        assert [e.obs_package for e in entries] == ["Dapper", "Moq"]
+
+
+class TestLoadCustomSeed:
+    def test_loads_github_and_registry_entries(self, tmp_path):
+        path = tmp_path / "seed.yaml"
+        path.write_text(
+            "packages:\n"
+            "  - name: requests\n"
+            "    repo: https://github.com/psf/requests\n"
+            "  - name: numpy\n"
+            "    ecosystem: PyPI\n"
+        )
+        entries = load_custom_seed(str(path))
+        assert [(e.obs_package, e.ecosystem) for e in entries] == [
+            ("requests", "github"), ("numpy", "pypi"),
+        ]
+        assert (entries[0].github_owner, entries[0].github_repo) == ("psf", "requests")
+
+    def test_rejects_duplicates(self, tmp_path):
+        path = tmp_path / "seed.yaml"
+        path.write_text(
+            "packages:\n"
+            "  - {name: numpy, ecosystem: pypi}\n"
+            "  - {name: numpy, ecosystem: pypi}\n"
+        )
+        with pytest.raises(ValueError, match="duplicate package numpy"):
+            load_custom_seed(str(path))
+
+    def test_requires_packages_key(self, tmp_path):
+        path = tmp_path / "seed.yaml"
+        path.write_text("other: []\n")
+        with pytest.raises(ValueError, match="top-level 'packages'"):
+            load_custom_seed(str(path))
+
+
+class TestGoModParser:
+    def test_require_blocks_and_single_lines(self, tmp_path):
+        path = tmp_path / "go.mod"
+        path.write_text(
+            "module example.com/m\n\n"
+            "go 1.21\n\n"
+            "require github.com/single/one v1.0.0\n\n"
+            "require (\n"
+            "\tgithub.com/gin-gonic/gin v1.9.1\n"
+            "\t// github.com/commented/out v1.0.0\n"
+            "\tgolang.org/x/net v0.1.0 // indirect\n"
+            ")\n\n"
+            "replace github.com/a/b v1.0.0 => github.com/c/d v1.1.0\n\n"
+            "exclude (\n"
+            "\tgithub.com/bad/mod v0.0.1\n"
+            ")\n"
+        )
+        ecosystem, entries = parse_dependency_file(str(path))
+        assert ecosystem == "go"
+        assert [e.obs_package for e in entries] == [
+            "github.com/single/one",
+            "github.com/gin-gonic/gin",
+            "golang.org/x/net",
+        ]
+
+    def test_unterminated_block_runs_to_end_of_file(self, tmp_path):
+        path = tmp_path / "go.mod"
+        path.write_text("require (\n  example.com/a v1\n  example.com/b v2\n")
+        _, entries = parse_dependency_file(str(path))
+        assert [e.obs_package for e in entries] == ["example.com/a", "example.com/b"]
+
+
+class TestJsonManifests:
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def decoder(self, request, monkeypatch):
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(_json, "orjson", None)
+        return request.param
+
+    def test_package_json(self, tmp_path, decoder):
+        path = tmp_path / "package.json"
+        path.write_text(json.dumps({
+            "name": "app",
+            "dependencies": {"express": "^4", "lodash": "^4"},
+            "devDependencies": {"jest": "^29"},
+        }))
+        _, entries = parse_dependency_file(str(path))
+        assert [e.obs_package for e in entries] == ["express", "lodash", "jest"]
+
+    def test_composer_json_skips_platform_requirements(self, tmp_path, decoder):
+        path = tmp_path / "composer.json"
+        path.write_text(json.dumps({
+            "require": {"php": ">=8.1", "ext-json": "*", "monolog/monolog": "^3"},
+            "require-dev": {"phpunit/phpunit": "^10"},
+        }))
+        _, entries = parse_dependency_file(str(path), include_dev=False)
+        assert [e.obs_package for e in entries] == ["monolog/monolog"]
+
+    def test_non_finite_numbers_still_load(self, tmp_path, decoder):
+        """``NaN`` is accepted by ``json``; the orjson path must not reject it."""
+        path = tmp_path / "package.json"
+        path.write_text('{"dependencies": {"express": "^4"}, "score": NaN}')
+        _, entries = parse_dependency_file(str(path))
+        assert [e.obs_package for e in entries] == ["express"]
+
+    def test_invalid_json_raises_json_decode_error(self, tmp_path, decoder):
+        path = tmp_path / "package.json"
+        path.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            parse_dependency_file(str(path))
+
+
+class TestScanDeduplication:
+    def test_first_spelling_wins_case_insensitively(self, tmp_path):
+        path = tmp_path / "requirements.txt"
+        path.write_text("PyYAML>=6\nrequests\npyyaml==6.0.1\nRequests[socks]\n")
+        _, entries = parse_dependency_file(str(path))
+        assert [e.obs_package for e in entries] == ["PyYAML", "requests"]
+        assert all(e.source == "scan" and e.ecosystem == "pypi" for e in entries)
+
+
+class TestGemfileParser:
+    def test_dev_groups(self, tmp_path):
+        path = tmp_path / "Gemfile"
+        path.write_text(
+            "source 'https://rubygems.org'\n"
+            "gem 'rails', '~> 7.0'\n"
+            "  gem \"puma\"\n"
+            "group :development, :test do\n"
+            "  gem 'rspec-rails'\n"
+            "end\n"
+            "group :production do\n"
+            "  gem 'pg'\n"
+            "end\n"
+            "gemspec\n"
+        )
+        ecosystem, entries = parse_dependency_file(str(path))
+        assert ecosystem == "rubygems"
+        assert [e.obs_package for e in entries] == ["rails", "puma", "rspec-rails", "pg"]
+        _, runtime = parse_dependency_file(str(path), include_dev=False)
+        assert [e.obs_package for e in runtime] == ["rails", "puma", "pg"]
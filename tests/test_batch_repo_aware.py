@@ -215,6 +215,38 @@ class TestRepoAwareBatchScore:
         assert result.unique_repos == 0
         assert result.shared_repo_packages == 0
 
+    def test_default_mode_bounded_by_max_concurrent(self):
+        """The worker pool never has more than ``max_concurrent`` scorings
+        in flight, however many entries the batch holds."""
+        from ossuary.services.scorer import ScoringResult
+
+        entries = [_entry(f"pkg-{i}", "npm") for i in range(12)]
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_score_package(name, eco, force=False, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ScoringResult(success=True, breakdown=None)
+
+        progress = []
+        with patch(
+            "ossuary.services.batch.score_package",
+            side_effect=fake_score_package,
+        ):
+            result = asyncio.run(batch_score(
+                entries, max_concurrent=3, skip_fresh=False,
+                progress_callback=lambda *args: progress.append(args),
+            ))
+
+        assert max_in_flight == 3
+        assert result.scored == 12
+        assert [p[0] for p in progress] == list(range(1, 13))
+
     def test_unplanable_entries_still_get_scored(self):
         """Mixed batch: planable + unplanable. Both are scored in
         repo-aware mode; planable go through groups, unplanable
@@ -240,6 +240,7 @@ class TestCollectPackageDataRetriesOnFallback:
                 async def _gh_get_repo_info(*_a, **_k):
                     return {"stargazers_count": 0}
                 _gh_cls.return_value.get_repo_info = _gh_get_repo_info
+                _gh_cls.return_value.last_repo_info = None
 
                 async def _gh_close():
                     return None
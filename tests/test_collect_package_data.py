@@ -0,0 +1,133 @@
+"""I/O scheduling in ``collect_package_data``.
+
+The git clone and ``git log`` block for seconds on large repos; they run
+in a worker thread so concurrent scoring (``batch_score``) keeps making
+HTTP progress meanwhile. Clones of one checkout are serialised by
+``GitCollector``. The repo payload ``GitHubCollector.collect()`` already
+fetched is reused for stars / ``pushed_at`` instead of being requested a
+second time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from ossuary.collectors.git import CommitData, GitCollector
+from ossuary.collectors.github import GitHubData
+from ossuary.services.scorer import RegistryData, collect_package_data
+
+REPO = "https://github.com/example/proj"
+
+
+def _registry() -> RegistryData:
+    return RegistryData(
+        repo_url=REPO, weekly_downloads=10, fetch_errors=[], warnings=[],
+    )
+
+
+class _FakeGitCollector:
+    threads: list[int] = []
+
+    def clone_or_update(self, url):
+        self.threads.append(threading.get_ident())
+        return "/tmp/fake-repo"
+
+    def extract_commits(self, _path):
+        return [
+            CommitData(
+                sha="0" * 40,
+                author_name="Dev",
+                author_email="dev@example.com",
+                authored_date=datetime(2026, 1, 1),
+                committer_name="Dev",
+                committer_email="dev@example.com",
+                committed_date=datetime(2026, 1, 1),
+                message="init",
+            )
+        ]
+
+    def calculate_metrics(self, commits, as_of):
+        return GitCollector().calculate_metrics(commits, as_of)
+
+
+def _collect(last_repo_info, get_repo_info):
+    async def run():
+        with patch(
+            "ossuary.services.scorer.GitCollector", _FakeGitCollector,
+        ), patch("ossuary.services.scorer.GitHubCollector") as gh_cls:
+            gh_cls.parse_repo_url = lambda url: ("example", "proj")
+            gh = gh_cls.return_value
+            gh.collect = AsyncMock(return_value=GitHubData(owner="example", repo="proj"))
+            gh.last_repo_info = last_repo_info
+            gh.last_error = None
+            gh.get_repo_info = get_repo_info
+            gh.close = AsyncMock()
+            loop_thread = threading.get_ident()
+            data, warnings = await collect_package_data(
+                "proj", "npm", prefetched_registry=_registry(),
+            )
+            return data, warnings, loop_thread
+
+    return asyncio.run(run())
+
+
+class TestCollectPackageData:
+    def test_clone_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("REPOS_PATH", str(tmp_path))
+        _FakeGitCollector.threads = []
+        data, _, loop_thread = _collect({"stargazers_count": 1}, AsyncMock())
+        assert data is not None
+        assert _FakeGitCollector.threads
+        assert loop_thread not in _FakeGitCollector.threads
+
+    def test_repo_info_from_collect_is_reused(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("REPOS_PATH", str(tmp_path))
+        get_repo_info = AsyncMock()
+        data, _, _ = _collect(
+            {"stargazers_count": 42, "pushed_at": "2026-01-02T00:00:00Z"},
+            get_repo_info,
+        )
+        get_repo_info.assert_not_awaited()
+        assert data.repo_stargazers == 42
+        assert data.github_data.pushed_at == "2026-01-02T00:00:00Z"
+
+    def test_repo_info_refetched_when_collect_had_none(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("REPOS_PATH", str(tmp_path))
+        get_repo_info = AsyncMock(return_value={"stargazers_count": 7})
+        data, _, _ = _collect(None, get_repo_info)
+        get_repo_info.assert_awaited_once_with("example", "proj")
+        assert data.repo_stargazers == 7
+
+
+class TestCloneLock:
+    def test_same_checkout_is_serialised(self, tmp_path):
+        collector = GitCollector(repos_path=str(tmp_path))
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def fake_clone(self, repo_url, repo_path):
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with guard:
+                active -= 1
+            return repo_path
+
+        with patch.object(GitCollector, "_clone_or_update", fake_clone):
+            threads = [
+                threading.Thread(target=collector.clone_or_update, args=(REPO,))
+                for _ in range(3)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert peak == 1
@@ -0,0 +1,76 @@
+"""JSON column encoding for the application engine.
+
+``ossuary.db.session`` encodes JSON columns (score breakdowns, snapshot
+blobs) through ``ossuary._json``. Decoding uses ``orjson`` when it is
+installed, encoding always uses ``json``, so what lands in the database
+is the same with or without the ``batch`` extra.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import StatementError
+from sqlalchemy.orm import sessionmaker
+
+from ossuary import _json
+from ossuary.db import session as db_session
+from ossuary.db.models import Base, Package, Score
+
+BREAKDOWN = {
+    "package": {"name": "pkg", "repo_url": "https://github.com/o/pkg"},
+    "metrics": {"maintainer_concentration": 72.5, "commits_last_year": 12},
+    "score": {"components": {"protective_factors": {"reputation": {"score": -25}}}},
+    "warnings": [],
+    "explanation": "Ünïcode — ok",
+}
+
+
+@pytest.fixture
+def make_session():
+    """Sessions on an in-memory DB configured like the application engine."""
+    dialect = db_session.engine.dialect
+    engine = create_engine(
+        "sqlite:///:memory:",
+        json_serializer=dialect._json_serializer,
+        json_deserializer=dialect._json_deserializer,
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _store(make_session, breakdown) -> None:
+    with make_session() as sess:
+        package = Package(name="pkg", ecosystem="npm")
+        sess.add(package)
+        sess.flush()
+        sess.add(Score(
+            package_id=package.id,
+            cutoff_date=datetime(2026, 1, 1),
+            risk_level="LOW",
+            breakdown=breakdown,
+        ))
+        sess.commit()
+
+
+class TestJsonColumns:
+    def test_application_engine_uses_shared_codec(self):
+        assert db_session.engine.dialect._json_serializer is _json.dumps
+        assert db_session.engine.dialect._json_deserializer is _json.loads
+
+    def test_round_trip_through_engine(self, json_backend, make_session):
+        _store(make_session, BREAKDOWN)
+        with make_session() as sess:
+            assert sess.query(Score).one().breakdown == BREAKDOWN
+
+    def test_nan_survives_round_trip(self, json_backend, make_session):
+        _store(make_session, {"ratio": float("nan")})
+        with make_session() as sess:
+            assert math.isnan(sess.query(Score).one().breakdown["ratio"])
+
+    def test_unencodable_value_rejected(self, json_backend, make_session):
+        with pytest.raises(StatementError):
+            _store(make_session, {"when": datetime(2026, 1, 1)})
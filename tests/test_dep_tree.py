@@ -1,47 +1,67 @@
 """Tests for dependency tree fetching."""
 
 import json
-import urllib.error
+import time
+from datetime import timedelta
 from io import BytesIO
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+import httpx
 import pytest
 
+from ossuary._compat import utcnow_naive
 from ossuary.cli import _fetch_dep_tree
+from ossuary.db.models import DependencyManifest
+
+
+class _FakeResp:
+    """Canned response body; ``_serve`` only ever calls ``read()``."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
 
 
 def _mock_response(data):
     """Create a mock HTTP response returning JSON data."""
-    resp = MagicMock()
-    resp.read.return_value = json.dumps(data).encode()
-    resp.__enter__ = lambda s: s
-    resp.__exit__ = MagicMock(return_value=False)
-    return resp
+    return _FakeResp(json.dumps(data).encode())
 
 
 def _mock_text_response(text):
     """Create a mock HTTP response returning plain text."""
-    resp = MagicMock()
-    resp.read.return_value = text.encode()
-    resp.__enter__ = lambda s: s
-    resp.__exit__ = MagicMock(return_value=False)
-    return resp
+    return _FakeResp(text.encode())
+
+
+def _serve(fake_get):
+    """Build a ``_dep_tree_client`` stand-in answering from ``fake_get``.
+
+    ``fake_get(url)`` returns a response with ``read()``; exceptions it
+    raises surface from the client call like a transport error.
+    """
+    def handler(request):
+        resp = fake_get(str(request.url))
+        return httpx.Response(200, content=resp.read())
+
+    return lambda: httpx.Client(transport=httpx.MockTransport(handler))
 
 
 class TestFetchDepTree:
     """Tests for _fetch_dep_tree function."""
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_npm_parses_dependencies(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_npm_parses_dependencies(self, mock_client, mock_console):
         """npm registry JSON dependencies field is parsed into adj dict."""
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/express/" in url:
                 return _mock_response({"dependencies": {"debug": "^4.3", "ms": "^2.1"}})
             return _mock_response({"dependencies": {}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("express", "npm", max_depth=2, max_packages=50)
 
         assert "express" in adj
@@ -50,11 +70,10 @@ class TestFetchDepTree:
         assert adj["ms"] == []
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_pypi_parses_requires_dist(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_pypi_parses_requires_dist(self, mock_client, mock_console):
         """PyPI requires_dist strings are parsed into dependency names."""
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/requests/" in url:
                 return _mock_response({
                     "info": {"requires_dist": [
@@ -64,18 +83,17 @@ class TestFetchDepTree:
                 })
             return _mock_response({"info": {"requires_dist": None}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("requests", "pypi", max_depth=2, max_packages=50)
 
         assert "requests" in adj
         assert set(adj["requests"]) == {"urllib3", "certifi"}
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_pypi_skips_extras(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_pypi_skips_extras(self, mock_client, mock_console):
         """Dependencies with 'extra ==' condition are filtered out."""
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/requests/" in url:
                 return _mock_response({
                     "info": {"requires_dist": [
@@ -86,18 +104,17 @@ class TestFetchDepTree:
                 })
             return _mock_response({"info": {"requires_dist": None}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("requests", "pypi", max_depth=2, max_packages=50)
 
         assert adj["requests"] == ["chardet"]
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_respects_max_depth(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_respects_max_depth(self, mock_client, mock_console):
         """Packages beyond max_depth are not fetched."""
         # Chain: A → B → C → D
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/A/" in url:
                 return _mock_response({"dependencies": {"B": "1.0"}})
             if "/B/" in url:
@@ -108,7 +125,7 @@ class TestFetchDepTree:
                 return _mock_response({"dependencies": {}})
             return _mock_response({"dependencies": {}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("A", "npm", max_depth=2, max_packages=50)
 
         assert "A" in adj
@@ -117,21 +134,20 @@ class TestFetchDepTree:
         assert "D" not in adj  # depth 3, beyond limit
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_respects_max_packages(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_respects_max_packages(self, mock_client, mock_console):
         """Stops fetching when max_packages is reached."""
         # Linear chain: A→B→C→D→E→F→G→H, limit to 4
         # Each BFS round fetches 1 package, so limit kicks in at round boundary
         chain = list("ABCDEFGH")
 
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             for i, name in enumerate(chain[:-1]):
                 if f"/{name}/" in url:
                     return _mock_response({"dependencies": {chain[i + 1]: "1.0"}})
             return _mock_response({"dependencies": {}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("A", "npm", max_depth=20, max_packages=4)
 
         assert len(adj) == 4
@@ -140,20 +156,54 @@ class TestFetchDepTree:
         assert "E" not in adj  # 5th package, beyond limit
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_handles_network_error(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_wide_frontier_stops_at_max_packages(self, mock_client, mock_console):
+        """A frontier wider than the remaining budget is not fetched in full."""
+        requested = []
+
+        def fake_get(url):
+            requested.append(url)
+            if "/root/" in url:
+                return _mock_response({"dependencies": {f"d{i}": "1" for i in range(20)}})
+            return _mock_response({"dependencies": {}})
+
+        mock_client.side_effect = _serve(fake_get)
+        adj = _fetch_dep_tree("root", "npm", max_depth=2, max_packages=5)
+
+        assert set(adj) == {"root", "d0", "d1", "d2", "d3"}
+        assert len(requested) == 5
+
+    @patch("ossuary.cli.console")
+    @patch("ossuary.cli._dep_tree_client")
+    def test_budget_trim_ignores_fetch_latency(self, mock_client, mock_console):
+        """Which packages survive the max_packages cut follows discovery order."""
+        graph = {"root": ["a", "b"], "a": ["a1", "a2"], "b": ["b1", "b2"]}
+
+        def fake_get(url):
+            name = url.split("/")[-2]
+            if name == "a":
+                time.sleep(0.05)  # finishes after "b"
+            return _mock_response({"dependencies": dict.fromkeys(graph.get(name, []), "1")})
+
+        mock_client.side_effect = _serve(fake_get)
+        adj = _fetch_dep_tree("root", "npm", max_depth=3, max_packages=5)
+
+        assert list(adj) == ["root", "a", "b", "a1", "a2"]
+
+    @patch("ossuary.cli.console")
+    @patch("ossuary.cli._dep_tree_client")
+    def test_handles_network_error(self, mock_client, mock_console):
         """Network errors for one package don't break the rest."""
         call_count = {"n": 0}
 
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/root/" in url:
                 return _mock_response({"dependencies": {"good": "1.0", "bad": "1.0"}})
             if "/bad/" in url:
-                raise urllib.error.URLError("connection refused")
+                raise httpx.ConnectError("connection refused")
             return _mock_response({"dependencies": {}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("root", "npm", max_depth=2, max_packages=50)
 
         assert "root" in adj
@@ -162,11 +212,29 @@ class TestFetchDepTree:
         assert adj["bad"] == []  # failed fetch returns empty deps
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_cargo_parses_dependencies(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_http_error_is_leaf_and_client_shared(self, mock_client, mock_console):
+        """A 404 yields no deps; the whole run uses one pooled client."""
+        def handler(request):
+            if "/root/" in str(request.url):
+                return httpx.Response(200, json={"dependencies": {"a": "1", "gone": "1"}})
+            if "/gone/" in str(request.url):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"dependencies": {}})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        mock_client.return_value = client
+        adj = _fetch_dep_tree("root", "npm", max_depth=2, max_packages=50)
+
+        assert adj == {"root": ["a", "gone"], "a": [], "gone": []}
+        assert mock_client.call_count == 1
+        assert client.is_closed
+
+    @patch("ossuary.cli.console")
+    @patch("ossuary.cli._dep_tree_client")
+    def test_cargo_parses_dependencies(self, mock_client, mock_console):
         """Cargo fetcher gets latest version then parses dependency list."""
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/crates/serde" in url and "/dependencies" not in url:
                 return _mock_response({"crate": {"newest_version": "1.0.200"}})
             if "/crates/serde/1.0.200/dependencies" in url:
@@ -177,7 +245,7 @@ class TestFetchDepTree:
             return _mock_response({"crate": {"newest_version": "0.1.0"},
                                    "dependencies": []})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("serde", "cargo", max_depth=1, max_packages=50)
 
         assert "serde" in adj
@@ -185,11 +253,10 @@ class TestFetchDepTree:
         assert "serde_json" not in adj["serde"]  # dev dep filtered out
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_cargo_filters_optional(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_cargo_filters_optional(self, mock_client, mock_console):
         """Cargo fetcher skips optional dependencies."""
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/dependencies" not in url:
                 return _mock_response({"crate": {"newest_version": "1.0.0"}})
             return _mock_response({"dependencies": [
@@ -197,17 +264,16 @@ class TestFetchDepTree:
                 {"crate_id": "feature-dep", "kind": "normal", "optional": True},
             ]})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("mycrate", "cargo", max_depth=1, max_packages=50)
 
         assert adj["mycrate"] == ["core"]
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_rubygems_parses_runtime_deps(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_rubygems_parses_runtime_deps(self, mock_client, mock_console):
         """RubyGems fetcher returns runtime deps, not development deps."""
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/api/v1/gems/" in url:
                 return _mock_response({"version": "7.1.0"})
             if "/api/v2/rubygems/" in url:
@@ -217,15 +283,15 @@ class TestFetchDepTree:
                 }})
             return _mock_response({"version": "0.1", "dependencies": {"runtime": [], "development": []}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("rails", "rubygems", max_depth=1, max_packages=50)
 
         assert "rails" in adj
         assert set(adj["rails"]) == {"activesupport", "actionpack"}
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_go_parses_gomod(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_go_parses_gomod(self, mock_client, mock_console):
         """Go fetcher parses require block from go.mod text."""
         gomod = """module golang.org/x/text
 
@@ -236,23 +302,22 @@ require (
 \tgolang.org/x/net v0.19.0
 )
 """
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/@latest" in url:
                 return _mock_response({"Version": "v0.14.0"})
             if ".mod" in url:
                 return _mock_text_response(gomod)
             return _mock_response({"Version": "v0.1.0"})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("golang.org/x/text", "go", max_depth=1, max_packages=50)
 
         assert "golang.org/x/text" in adj
         assert set(adj["golang.org/x/text"]) == {"golang.org/x/tools", "golang.org/x/net"}
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_go_parses_single_require(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_go_parses_single_require(self, mock_client, mock_console):
         """Go fetcher handles single-line require statement."""
         gomod = """module example.com/foo
 
@@ -260,24 +325,23 @@ go 1.21
 
 require golang.org/x/sys v0.15.0
 """
-        def fake_urlopen(req, timeout=None):
-            url = req.full_url if hasattr(req, "full_url") else str(req)
+        def fake_get(url):
             if "/@latest" in url:
                 return _mock_response({"Version": "v1.0.0"})
             if ".mod" in url:
                 return _mock_text_response(gomod)
             return _mock_response({"Version": "v0.1.0"})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("example.com/foo", "go", max_depth=1, max_packages=50)
 
         assert adj["example.com/foo"] == ["golang.org/x/sys"]
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_packagist_parses_require(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_packagist_parses_require(self, mock_client, mock_console):
         """Packagist fetcher extracts require keys with '/' (real packages only)."""
-        def fake_urlopen(req, timeout=None):
+        def fake_get(url):
             return _mock_response({"packages": {"vendor/pkg": [
                 {"require": {
                     "php": ">=8.1",
@@ -287,17 +351,17 @@ require golang.org/x/sys v0.15.0
                 }},
             ]}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("vendor/pkg", "packagist", max_depth=1, max_packages=50)
 
         assert "vendor/pkg" in adj
         assert set(adj["vendor/pkg"]) == {"vendor/dep-a", "vendor/dep-b"}
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_nuget_parses_dependency_groups(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_nuget_parses_dependency_groups(self, mock_client, mock_console):
         """NuGet fetcher extracts deps from registration index."""
-        def fake_urlopen(req, timeout=None):
+        def fake_get(url):
             return _mock_response({"items": [{"items": [
                 {"catalogEntry": {
                     "version": "13.0.3",
@@ -313,19 +377,20 @@ require golang.org/x/sys v0.15.0
                 }},
             ]}]})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("Newtonsoft.Json", "nuget", max_depth=1, max_packages=50)
 
         assert "Newtonsoft.Json" in adj
-        # Deduplicated across target frameworks
-        assert "Newtonsoft.Json.Bson" in adj["Newtonsoft.Json"]
-        assert "System.ComponentModel.Annotations" in adj["Newtonsoft.Json"]
+        # Deduplicated across target frameworks, in first-seen order
+        assert adj["Newtonsoft.Json"] == [
+            "Newtonsoft.Json.Bson", "System.ComponentModel.Annotations",
+        ]
 
     @patch("ossuary.cli.console")
-    @patch("urllib.request.urlopen")
-    def test_github_sbom_parses_packages(self, mock_urlopen, mock_console):
+    @patch("ossuary.cli._dep_tree_client")
+    def test_github_sbom_parses_packages(self, mock_client, mock_console):
         """GitHub SBOM fetcher strips ecosystem prefixes and skips root."""
-        def fake_urlopen(req, timeout=None):
+        def fake_get(url):
             return _mock_response({"sbom": {"packages": [
                 {"SPDXID": "SPDXRef-DOCUMENT", "name": "owner/repo"},
                 {"SPDXID": "SPDXRef-1", "name": "pip:flask"},
@@ -333,7 +398,7 @@ require golang.org/x/sys v0.15.0
                 {"SPDXID": "SPDXRef-3", "name": "npm:lodash"},
             ]}})
 
-        mock_urlopen.side_effect = fake_urlopen
+        mock_client.side_effect = _serve(fake_get)
         adj = _fetch_dep_tree("owner/repo", "github", max_depth=1, max_packages=50)
 
         assert "owner/repo" in adj
@@ -341,3 +406,61 @@ require golang.org/x/sys v0.15.0
         assert "flask" in deps
         assert "click" in deps
         assert "lodash" in deps
+
+
+@pytest.fixture
+def manifest_db(memory_db):
+    """Point the manifest cache at a fresh in-memory SQLite DB."""
+    scope = memory_db("ossuary.db.session.session_scope")
+    with patch("ossuary.db.session.init_db"):
+        yield scope
+
+
+@patch("ossuary.cli.console")
+class TestManifestCache:
+    """``use_cache=True`` reads recent dependency lists from the DB."""
+
+    @staticmethod
+    def _run(fail=(), use_cache=True):
+        requested = []
+
+        def handler(request):
+            url = str(request.url)
+            requested.append(url)
+            if any(f"/{name}/" in url for name in fail):
+                return httpx.Response(503)
+            if "/root/" in url:
+                return httpx.Response(200, json={"dependencies": {"a": "1", "b": "1"}})
+            return httpx.Response(200, json={"dependencies": {}})
+
+        with patch("ossuary.cli._dep_tree_client", lambda: httpx.Client(
+            transport=httpx.MockTransport(handler),
+        )):
+            adj = _fetch_dep_tree("root", "npm", 2, 50, use_cache=use_cache)
+        return adj, requested
+
+    def test_second_run_served_from_cache(self, mock_console, manifest_db):
+        first, requested = self._run()
+        assert len(requested) == 3
+        second, requested = self._run()
+        assert requested == []
+        assert second == first
+
+    def test_failed_fetch_is_not_cached(self, mock_console, manifest_db):
+        adj, _ = self._run(fail=("b",))
+        assert adj["b"] == []
+        _, requested = self._run()
+        assert requested == ["https://registry.npmjs.org/b/latest"]
+
+    def test_stale_rows_are_refetched(self, mock_console, manifest_db):
+        self._run()
+        with manifest_db() as sess:
+            for row in sess.query(DependencyManifest):
+                row.fetched_at = utcnow_naive() - timedelta(days=1)
+        _, requested = self._run()
+        assert len(requested) == 3
+
+    def test_cache_off_by_default(self, mock_console, manifest_db):
+        self._run(use_cache=False)
+        with manifest_db() as sess:
+            assert sess.query(DependencyManifest).count() == 0
@@ -126,3 +126,15 @@ class TestDiffCommand:
         result = self.runner.invoke(app, ["diff", str(bad), after])
         assert result.exit_code == 1
         assert "Invalid JSON" in result.output
+
+    def test_report_with_nan_values(self, tmp_path):
+        """Reports written by ``json.dump`` may hold NaN; still diffed."""
+        before = self._write_report(tmp_path, "before.json", [
+            self._pkg("lodash", 30, concentration=float("nan")),
+        ])
+        after = self._write_report(tmp_path, "after.json", [
+            self._pkg("lodash", 45, concentration=float("nan")),
+        ])
+        result = self.runner.invoke(app, ["diff", before, after])
+        assert result.exit_code == 0
+        assert "Changed" in result.output
@@ -2,7 +2,7 @@
 
 import pytest
 
-from ossuary.scoring.factors import ProtectiveFactors, RiskBreakdown, RiskLevel
+from ossuary.scoring.factors import CIIBadge, ProtectiveFactors, RiskBreakdown, RiskLevel
 
 
 class TestRiskLevel:
@@ -28,6 +28,17 @@ class TestRiskLevel:
         assert RiskLevel.from_score(0) == RiskLevel.VERY_LOW
         assert RiskLevel.from_score(19) == RiskLevel.VERY_LOW
 
+    def test_lookup_table_matches_thresholds(self):
+        from ossuary.scoring.methodology import label_for_score
+
+        for score in range(101):
+            assert RiskLevel.from_score(score).value == label_for_score(score)
+
+    def test_out_of_range_and_float_scores(self):
+        assert RiskLevel.from_score(150) == RiskLevel.CRITICAL
+        assert RiskLevel.from_score(-5) == RiskLevel.VERY_LOW
+        assert RiskLevel.from_score(59.5) == RiskLevel.MODERATE
+
     def test_semaphore_colors(self):
         assert RiskLevel.CRITICAL.semaphore == "\U0001f534"  # red circle
         assert RiskLevel.VERY_LOW.semaphore == "\U0001f7e2"  # green circle
@@ -37,6 +48,24 @@ class TestRiskLevel:
             assert level.description
 
 
+class TestCIIBadge:
+    """Tests for CIIBadge level parsing."""
+
+    def test_from_level_orders_badges(self):
+        assert CIIBadge.from_level("gold") > CIIBadge.from_level("silver")
+        assert CIIBadge.from_level("silver") > CIIBadge.from_level("passing")
+        assert CIIBadge.from_level("passing") >= CIIBadge.PASSING
+
+    def test_unknown_or_missing_level_is_none(self):
+        assert CIIBadge.from_level("none") == CIIBadge.NONE
+        assert CIIBadge.from_level("bronze") == CIIBadge.NONE
+        assert CIIBadge.from_level(None) == CIIBadge.NONE
+
+    def test_label_round_trips(self):
+        for badge in CIIBadge:
+            assert CIIBadge.from_level(badge.label) is badge
+
+
 class TestProtectiveFactors:
     """Tests for ProtectiveFactors dataclass."""
 
@@ -0,0 +1,133 @@
+"""Commit extraction and takeover detection in ``GitCollector``.
+
+The proportion-shift check flags a historically minor contributor who
+dominates recent commits (the xz pattern), except for long-tenured
+contributors on mega-repos and same-organisation handoffs. Both guards
+are computed from one pass over the historical commits.
+
+``extract_commits`` parses ``git log`` output line by line and shares
+repeated name / email strings between commits.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ossuary.collectors.git import CommitData, GitCollector, _normalize_email
+
+CUTOFF = datetime(2025, 1, 1)
+HISTORY_START = datetime(2015, 1, 1)
+HISTORY_END = datetime(2023, 6, 1)  # before the ~14-month taper window
+
+
+def _commit(email: str, when: datetime, name: str | None = None) -> CommitData:
+    name = name or email.split("@")[0]
+    return CommitData(
+        sha=f"{hash((email, when)) & (2**160 - 1):040x}",
+        author_name=name,
+        author_email=email,
+        authored_date=when,
+        committer_name=name,
+        committer_email=email,
+        committed_date=when,
+        message="change",
+    )
+
+
+def _spread(email: str, count: int, start: datetime, end: datetime) -> list[CommitData]:
+    step = (end - start) / count
+    return [_commit(email, start + step * i) for i in range(count)]
+
+
+def _recent(email: str, count: int) -> list[CommitData]:
+    return _spread(email, count, CUTOFF - timedelta(days=200), CUTOFF - timedelta(days=1))
+
+
+def _metrics(commits: list[CommitData], tmp_path) -> object:
+    return GitCollector(repos_path=str(tmp_path)).calculate_metrics(commits, CUTOFF)
+
+
+class TestTakeoverDetection:
+    def test_new_contributor_taking_over_is_flagged(self, tmp_path):
+        commits = (
+            _spread("alice@gmail.com", 1500, HISTORY_START, HISTORY_END)
+            + _recent("alice@gmail.com", 5)
+            + _recent("eve@evil.example", 20)
+        )
+        metrics = _metrics(commits, tmp_path)
+        assert metrics.takeover_suspect == "eve@evil.example"
+        assert metrics.takeover_shift == 80.0
+
+    def test_long_tenured_minor_contributor_is_not_flagged(self, tmp_path):
+        commits = (
+            _spread("alice@gmail.com", 1500, HISTORY_START, HISTORY_END)
+            + _spread("eve@evil.example", 120, datetime(2017, 1, 1), datetime(2022, 6, 1))
+            + _recent("alice@gmail.com", 5)
+            + _recent("eve@evil.example", 20)
+        )
+        assert _metrics(commits, tmp_path).takeover_suspect == ""
+
+    def test_short_tenure_minor_contributor_is_flagged(self, tmp_path):
+        commits = (
+            _spread("alice@gmail.com", 1500, HISTORY_START, HISTORY_END)
+            + _spread("eve@evil.example", 120, datetime(2021, 6, 1), datetime(2023, 1, 1))
+            + _recent("alice@gmail.com", 5)
+            + _recent("eve@evil.example", 20)
+        )
+        assert _metrics(commits, tmp_path).takeover_suspect == "eve@evil.example"
+
+    def test_same_org_handoff_is_not_flagged(self, tmp_path):
+        commits = (
+            _spread("alice@gmail.com", 600, HISTORY_START, HISTORY_END)
+            + _spread("bob@suse.de", 400, HISTORY_START, HISTORY_END)
+            + _recent("alice@gmail.com", 5)
+            + _recent("carol@suse.com", 20)
+        )
+        assert _metrics(commits, tmp_path).takeover_suspect == ""
+
+
+class TestNormalizeEmail:
+    def test_noreply_prefix_is_stripped(self):
+        assert (
+            _normalize_email("12345+Octo@users.noreply.github.com")
+            == "octo@users.noreply.github.com"
+        )
+
+    def test_plain_email_is_lowercased(self):
+        assert _normalize_email(" Dev@Example.COM ") == "dev@example.com"
+
+
+class TestExtractCommits:
+    def _extract(self, tmp_path, lines: list[str]) -> list[CommitData]:
+        output = "".join(line + "\n" for line in lines).encode()
+        result = SimpleNamespace(returncode=0, stdout=output, stderr=b"")
+        with patch("ossuary.collectors.git.subprocess.run", return_value=result):
+            return GitCollector(repos_path=str(tmp_path)).extract_commits(tmp_path)
+
+    @staticmethod
+    def _line(sha: str, name: str, email: str, at: int, ct: int, msg: str) -> str:
+        return "\x00".join([sha, name, email, str(at), name, email, str(ct), msg])
+
+    def test_parses_and_skips_malformed_lines(self, tmp_path):
+        commits = self._extract(tmp_path, [
+            self._line("a" * 40, "Zoë", "zoe@example.com", 1700000000, 1700000500, "Fix"),
+            "garbage",
+            "\x00".join(["b" * 40, "Zoë", "zoe@example.com", "not-a-time"] + ["x"] * 4),
+            "",
+        ])
+        assert [c.sha for c in commits] == ["a" * 40]
+        assert commits[0].author_name == "Zoë"
+        assert commits[0].authored_date == datetime.fromtimestamp(1700000000)
+        assert commits[0].committed_date == datetime.fromtimestamp(1700000500)
+        assert commits[0].message == "Fix"
+
+    def test_repeated_identities_share_strings(self, tmp_path):
+        commits = self._extract(tmp_path, [
+            self._line(f"{i:040x}", "Dev", "dev@example.com", 1700000000 + i, 1700000000 + i, "m")
+            for i in range(3)
+        ])
+        assert len(commits) == 3
+        assert commits[0].author_email is commits[2].author_email
+        assert commits[0].author_name is commits[1].committer_name
@@ -291,3 +291,106 @@ class TestPerFamilySeams:
             finally:
                 await collector.close()
         asyncio.run(run())
+
+
+class TestResponseCache:
+    """Inside ``shared_http_pool()`` user / repo metadata is fetched once
+    per scope: a batch touches the same maintainers over and over."""
+
+    def test_repeat_lookups_hit_the_pool_cache(self):
+        from ossuary.collectors.base import shared_http_pool
+
+        get = AsyncMock(return_value={"login": "octo", "public_repos": 3})
+
+        async def run():
+            async with shared_http_pool():
+                results = []
+                for _ in range(2):
+                    collector = GitHubCollector(token="test-token")
+                    collector._get = get
+                    results.append(await collector.get_user("octo"))
+                    await collector.close()
+                # A hit reports success like a fresh call would.
+                collector.last_error = "stale"
+                await collector.get_user("octo")
+                assert collector.last_error is None
+                return results
+
+        first, second = asyncio.run(run())
+        assert first == second
+        assert get.await_count == 1
+
+    def test_no_caching_outside_a_pool(self):
+        get = AsyncMock(return_value={"login": "octo"})
+
+        async def run():
+            collector = GitHubCollector(token="test-token")
+            collector._get = get
+            try:
+                await collector.get_user("octo")
+                await collector.get_user("octo")
+            finally:
+                await collector.close()
+
+        asyncio.run(run())
+        assert get.await_count == 2
+
+    def test_failures_are_not_cached(self):
+        from ossuary.collectors.base import shared_http_pool
+
+        get = AsyncMock(side_effect=[None, {"name": "proj"}])
+
+        async def run():
+            async with shared_http_pool():
+                collector = GitHubCollector(token="test-token")
+                collector._get = get
+                try:
+                    assert await collector.get_repo_info("o", "proj") is None
+                    return await collector.get_repo_info("o", "proj")
+                finally:
+                    await collector.close()
+
+        assert asyncio.run(run()) == {"name": "proj"}
+        assert get.await_count == 2
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        from ossuary.collectors.base import shared_http_pool
+
+        monkeypatch.setattr(GitHubCollector, "RESPONSE_CACHE_TTL", 0)
+        get = AsyncMock(return_value=[{"login": "org"}])
+
+        async def run():
+            async with shared_http_pool():
+                collector = GitHubCollector(token="test-token")
+                collector._get = get
+                try:
+                    await collector.get_user_orgs("octo")
+                    await collector.get_user_orgs("octo")
+                finally:
+                    await collector.close()
+
+        asyncio.run(run())
+        assert get.await_count == 2
+
+    def test_pushed_at_probe_bypasses_cache(self, monkeypatch):
+        from ossuary.collectors.base import shared_http_pool
+
+        get = AsyncMock(side_effect=[
+            {"pushed_at": "2026-01-01T00:00:00Z"},
+            {"pushed_at": "2026-02-01T00:00:00Z"},
+            {"pushed_at": "2026-03-01T00:00:00Z"},
+        ])
+        monkeypatch.setattr(GitHubCollector, "_get", get)
+
+        async def run():
+            async with shared_http_pool():
+                collector = GitHubCollector(token="test-token")
+                try:
+                    await collector.get_repo_info("o", "proj")
+                finally:
+                    await collector.close()
+                return await GitHubCollector.probe_pushed_at(
+                    "https://github.com/o/proj"
+                )
+
+        assert asyncio.run(run()) == "2026-02-01T00:00:00Z"
@@ -0,0 +1,141 @@
+"""Historical scoring via ``get_historical_scores``.
+
+Historical mode collects once and then scores ~24 monthly cutoffs
+against the same ``CollectedData``. These tests pin that each cutoff is
+scored exactly once (the cache write reuses the breakdowns from the
+scoring pass) and that what lands in the cache lines up with the
+returned series, even when one cutoff fails, and that one sentiment
+analyzer is shared so each text is scored once across cutoffs. The
+collection step goes through the snapshot cache, so re-running a
+partially cached series does not collect again and only scores the
+missing cutoffs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ossuary.collectors.git import CommitData
+from ossuary.collectors.github import GitHubData
+from ossuary.db.models import Score
+from ossuary.services import scorer
+from ossuary.services.scorer import CollectedData, RegistryData, get_historical_scores
+
+
+@pytest.fixture
+def db(memory_db):
+    """Point ``scorer.session_scope`` at a fresh in-memory SQLite DB."""
+    return memory_db("ossuary.services.scorer.session_scope")
+
+
+def _collected() -> CollectedData:
+    start = datetime(2023, 1, 15)
+    commits = [
+        CommitData(
+            sha=f"{i:040x}",
+            author_name=f"dev{i % 3}",
+            author_email=f"dev{i % 3}@example.com",
+            authored_date=start + timedelta(days=7 * i),
+            committer_name=f"dev{i % 3}",
+            committer_email=f"dev{i % 3}@example.com",
+            committed_date=start + timedelta(days=7 * i),
+            message=f"Fix bug {i}",
+        )
+        for i in range(80)
+    ]
+    return CollectedData(
+        repo_url="https://github.com/example/proj",
+        all_commits=commits,
+        github_data=GitHubData(owner="example", repo="proj"),
+        weekly_downloads=1000,
+        maintainer_account_created=None,
+    )
+
+
+def _registry() -> RegistryData:
+    return RegistryData(
+        repo_url="https://github.com/example/proj", weekly_downloads=1000,
+        fetch_errors=[], warnings=[],
+    )
+
+
+def _run(months: int, collect: AsyncMock | None = None):
+    real = scorer.calculate_score_for_date
+    calls = []
+    collect = collect or AsyncMock(return_value=(_collected(), []))
+
+    def spy(package_name, ecosystem, collected_data, cutoff_date, **kwargs):
+        calls.append((cutoff_date, kwargs.get("sentiment_analyzer")))
+        if len(calls) == 2:
+            raise RuntimeError("boom")
+        return real(package_name, ecosystem, collected_data, cutoff_date, **kwargs)
+
+    with patch.object(
+        scorer, "collect_package_data", collect,
+    ), patch.object(
+        scorer, "_collect_registry_data", AsyncMock(return_value=_registry()),
+    ), patch.object(scorer, "calculate_score_for_date", side_effect=spy):
+        scores, warnings = asyncio.run(get_historical_scores("proj", "npm", months=months))
+    return scores, warnings, calls
+
+
+class TestHistoricalScores:
+    def test_each_cutoff_scored_once(self, db):
+        scores, warnings, calls = _run(months=6)
+        assert len(calls) == 6
+        assert len(scores) == 5
+        assert any("Failed to calculate score" in w for w in warnings)
+
+    def test_cached_rows_match_returned_series(self, db):
+        scores, _, _ = _run(months=6)
+        with db() as sess:
+            rows = sess.query(Score).order_by(Score.cutoff_date).all()
+            stored = [(r.cutoff_date, r.final_score, r.commits_last_year) for r in rows]
+        assert stored == [(s.date, s.score, s.commits_year) for s in scores]
+
+    def test_sentiment_analyzer_shared_across_cutoffs(self, db):
+        _, _, calls = _run(months=6)
+        analyzer = calls[0][1]
+        assert analyzer is not None
+        assert all(a is analyzer for _, a in calls)
+        # 80 distinct messages, each analysed once however many cutoffs
+        # include it.
+        info = analyzer._text_scores.cache_info()
+        assert info.currsize <= 80
+        assert info.hits > 0
+
+    def test_rerun_scores_only_missing_cutoffs(self, db):
+        collect = AsyncMock(return_value=(_collected(), []))
+        first, _, first_calls = _run(months=6, collect=collect)
+        # One cutoff failed, so the cached series is short. The second
+        # run collects from the stored snapshot and scores just that one.
+        scores, warnings, calls = _run(months=6, collect=collect)
+        assert collect.await_count == 1
+        assert [c for c, _ in calls] == [first_calls[1][0]]
+        assert len(scores) == 6
+        assert [s.date for s in scores] == sorted(c for c, _ in first_calls)
+        assert not warnings
+        with db() as sess:
+            assert sess.query(Score).count() == 6
+
+    def test_metrics_collector_built_once(self, db, tmp_path, monkeypatch):
+        monkeypatch.setenv("REPOS_PATH", str(tmp_path / "repos"))
+        scorer._metrics_git_collector.cache_clear()
+        try:
+            with patch.object(
+                scorer, "GitCollector", wraps=scorer.GitCollector,
+            ) as git_cls:
+                _run(months=6)
+            assert git_cls.call_count == 1
+        finally:
+            scorer._metrics_git_collector.cache_clear()
+
+    def test_mostly_missing_series_is_recomputed(self, db):
+        _run(months=2)
+        # Only 1 of the 6 cutoffs is cached; recompute them all.
+        _, _, calls = _run(months=6)
+        assert len(calls) == 6
@@ -0,0 +1,90 @@
+"""Shared HTTP connection pool for collectors.
+
+Collectors are created and closed per package. Inside
+``shared_http_pool()`` their clients borrow one transport, so a batch
+reuses connections instead of opening (and TLS-handshaking) new ones
+for every package. Closing a collector must not close the shared pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from ossuary.collectors import base
+from ossuary.collectors.base import shared_http_pool, shared_transport
+from ossuary.collectors.npm import NpmCollector
+
+
+@pytest.fixture
+def mock_pool(monkeypatch):
+    """Make ``shared_http_pool`` install a recording mock transport."""
+    for var in ("HTTPS_PROXY", "HTTP_PROXY", "ALL_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+        monkeypatch.delenv(var.lower(), raising=False)
+    requests: list[str] = []
+    created: list[httpx.MockTransport] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, json={})
+
+    def factory(**_kwargs):
+        transport = httpx.MockTransport(handler)
+        created.append(transport)
+        return transport
+
+    monkeypatch.setattr(base.httpx, "AsyncHTTPTransport", factory)
+    return requests, created
+
+
+class TestSharedHttpPool:
+    def test_no_shared_transport_outside_pool(self):
+        assert shared_transport() is None
+
+    def test_collectors_share_one_pool_across_close(self, mock_pool):
+        requests, created = mock_pool
+
+        async def run():
+            async with shared_http_pool():
+                for i in range(3):
+                    collector = NpmCollector()
+                    await collector.client.get(f"https://registry.npmjs.org/pkg-{i}")
+                    await collector.close()
+
+        asyncio.run(run())
+        assert len(created) == 1
+        assert len(requests) == 3
+
+    def test_nested_pools_reuse_the_outer_one(self, mock_pool):
+        _, created = mock_pool
+
+        async def run():
+            async with shared_http_pool():
+                async with shared_http_pool():
+                    pass
+                return shared_transport()
+
+        assert asyncio.run(run()) is not None
+        assert len(created) == 1
+
+    def test_pool_uninstalled_on_exit(self, mock_pool):
+        async def run():
+            async with shared_http_pool():
+                pass
+
+        asyncio.run(run())
+        assert shared_transport() is None
+
+    def test_proxy_environment_disables_pool(self, mock_pool, monkeypatch):
+        _, created = mock_pool
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+
+        async def run():
+            async with shared_http_pool():
+                return shared_transport()
+
+        assert asyncio.run(run()) is None
+        assert created == []
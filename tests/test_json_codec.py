@@ -0,0 +1,47 @@
+"""Shared JSON helpers in ``ossuary._json``.
+
+Both backends (``orjson`` when installed, ``json`` otherwise) must give
+the same results: ``loads`` including for documents holding ``NaN``
+that only the standard library accepts, and ``dumps`` byte for byte
+what ``json.dumps`` writes.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+
+from ossuary import _json
+
+DOC = {"name": "pkg", "score": 42, "ratio": 0.5, "tags": ["a", "ü"], "nested": {"x": None}}
+
+
+class TestJsonCodec:
+    def test_round_trip(self, json_backend):
+        assert _json.loads(_json.dumps(DOC)) == DOC
+
+    def test_accepts_bytes_and_str(self, json_backend):
+        raw = json.dumps(DOC)
+        assert _json.loads(raw) == _json.loads(raw.encode()) == DOC
+
+    def test_nan_falls_back_to_stdlib(self, json_backend):
+        value = _json.loads(b'{"ratio": NaN}')
+        assert value["ratio"] != value["ratio"]
+
+    def test_invalid_document_raises_json_error(self, json_backend):
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads(b"{not json")
+
+    @pytest.mark.parametrize("value", [
+        DOC,
+        {"ratio": float("nan"), "big": float("inf")},
+        {1: "int key", None: "null key"},
+    ])
+    def test_dumps_matches_stdlib(self, json_backend, value):
+        assert _json.dumps(value) == json.dumps(value)
+
+    def test_dumps_rejects_what_stdlib_rejects(self, json_backend):
+        with pytest.raises(TypeError):
+            _json.dumps({"when": datetime(2026, 1, 1)})
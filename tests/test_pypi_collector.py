@@ -11,49 +11,25 @@ class TestCleanRepoUrl:
     def setup_method(self):
         self.collector = PyPICollector()
 
-    def test_strips_issues_path(self):
-        url = "https://github.com/pallets/flask/issues"
-        assert self.collector._clean_repo_url(url) == "https://github.com/pallets/flask"
-
-    def test_strips_tree_path(self):
-        url = "https://github.com/psf/requests/tree/main/src"
-        assert self.collector._clean_repo_url(url) == "https://github.com/psf/requests"
-
-    def test_strips_blob_path(self):
-        url = "https://github.com/owner/repo/blob/main/README.md"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_strips_wiki_path(self):
-        url = "https://github.com/owner/repo/wiki"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_strips_pulls_path(self):
-        url = "https://github.com/owner/repo/pulls"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_strips_query_string(self):
-        url = "https://github.com/owner/repo?tab=readme"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_strips_fragment(self):
-        url = "https://github.com/owner/repo#readme"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_strips_trailing_slash(self):
-        url = "https://github.com/owner/repo/"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_preserves_clean_url(self):
-        url = "https://github.com/owner/repo"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_strips_releases_path(self):
-        url = "https://github.com/owner/repo/releases"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
-
-    def test_strips_actions_path(self):
-        url = "https://github.com/owner/repo/actions"
-        assert self.collector._clean_repo_url(url) == "https://github.com/owner/repo"
+    @pytest.mark.parametrize("url,expected", [
+        ("https://github.com/pallets/flask/issues", "https://github.com/pallets/flask"),
+        ("https://github.com/psf/requests/tree/main/src", "https://github.com/psf/requests"),
+        ("https://github.com/owner/repo/blob/main/README.md", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo/wiki", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo/pulls", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo/releases", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo/actions", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo/discussions/42", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo?tab=readme", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo#readme", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo/", "https://github.com/owner/repo"),
+        ("https://github.com/owner/repo", "https://github.com/owner/repo"),
+    ], ids=[
+        "issues", "tree", "blob", "wiki", "pulls", "releases", "actions", "discussions",
+        "query", "fragment", "trailing-slash", "already-clean",
+    ])
+    def test_clean_repo_url(self, url, expected):
+        assert self.collector._clean_repo_url(url) == expected
 
 
 class TestExtractRepoUrl:
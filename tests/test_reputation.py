@@ -7,6 +7,9 @@ import pytest
 
 from ossuary.scoring.reputation import ReputationBreakdown, ReputationScorer, ReputationTier
 
+# Fixed "today" for tenure checks, so results do not drift with the clock.
+NOW = datetime(2025, 1, 1)
+
 
 class TestReputationTier:
     """Tests for ReputationTier enum."""
@@ -75,10 +78,11 @@ class TestReputationScorer:
         self.scorer = ReputationScorer()
 
     def test_tenure_points_for_old_account(self):
-        created = datetime.now() - timedelta(days=365 * 10)
+        created = NOW - timedelta(days=365 * 10)
         result = self.scorer.calculate(
             username="veteran",
             account_created=created,
+            as_of_date=NOW,
             repos=[],
             sponsor_count=0,
             orgs=[],
@@ -87,10 +91,11 @@ class TestReputationScorer:
         assert result.tenure_score == 15
 
     def test_no_tenure_points_for_new_account(self):
-        created = datetime.now() - timedelta(days=365)
+        created = NOW - timedelta(days=365)
         result = self.scorer.calculate(
             username="newbie",
             account_created=created,
+            as_of_date=NOW,
             repos=[],
             sponsor_count=0,
             orgs=[],
@@ -191,11 +196,12 @@ class TestReputationScorer:
 
     def test_tier1_scenario(self):
         """Full tier-1 maintainer should score >= 60."""
-        created = datetime.now() - timedelta(days=365 * 10)
+        created = NOW - timedelta(days=365 * 10)
         repos = [{"stargazers_count": 1000, "fork": False} for _ in range(60)]
         result = self.scorer.calculate(
             username="sindresorhus",
             account_created=created,
+            as_of_date=NOW,
             repos=repos,
             sponsor_count=20,
             orgs=["nodejs"],
@@ -208,7 +214,8 @@ class TestReputationScorer:
         """New user with no signals should be UNKNOWN."""
         result = self.scorer.calculate(
             username="newuser123",
-            account_created=datetime.now() - timedelta(days=30),
+            account_created=NOW - timedelta(days=30),
+            as_of_date=NOW,
             repos=[],
             sponsor_count=0,
             orgs=[],
@@ -218,10 +225,12 @@ class TestReputationScorer:
         assert result.total_score < 30
 
     def test_logger_uses_complete_summary(self):
-        with patch("ossuary.scoring.reputation.logger.info") as mock_info:
+        with patch("ossuary.scoring.reputation.logger.isEnabledFor", return_value=True), \
+                patch("ossuary.scoring.reputation.logger.info") as mock_info:
             self.scorer.calculate(
                 username="maintainer",
-                account_created=datetime.now() - timedelta(days=365 * 10),
+                account_created=NOW - timedelta(days=365 * 10),
+                as_of_date=NOW,
                 repos=[{"stargazers_count": 1000, "fork": False} for _ in range(60)],
                 sponsor_count=20,
                 orgs=["nodejs"],
@@ -232,3 +241,18 @@ class TestReputationScorer:
         assert "packages=10" in logged
         assert "top_packages=15" in logged
         assert "organizations=15" in logged
+
+    def test_summary_not_built_when_info_disabled(self):
+        with patch("ossuary.scoring.reputation.logger.isEnabledFor", return_value=False), \
+                patch.object(ReputationBreakdown, "summary") as mock_summary:
+            self.scorer.calculate(
+                username="maintainer",
+                account_created=NOW - timedelta(days=365 * 10),
+                as_of_date=NOW,
+                repos=[],
+                sponsor_count=0,
+                orgs=[],
+                packages_maintained=["chalk"],
+            )
+
+        mock_summary.assert_not_called()
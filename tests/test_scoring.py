@@ -7,7 +7,7 @@ import pytest
 from ossuary.collectors.github import GitHubData, IssueData
 from ossuary.collectors.git import CommitData
 from ossuary.scoring.engine import PackageMetrics, RiskScorer
-from ossuary.scoring.factors import RiskLevel
+from ossuary.scoring.factors import ProtectiveFactors, RiskBreakdown, RiskLevel
 from ossuary.scoring.reputation import ReputationBreakdown, ReputationTier
 from ossuary.services.scorer import CollectedData, _rebuild_breakdown, calculate_score_for_date
 
@@ -180,6 +180,26 @@ class TestRiskScorer:
         assert high_breakdown.final_score == 100
         assert low_breakdown.final_score == 0
 
+    def test_recommendations_priority_order(self):
+        """Takeover outranks single-maintainer, which outranks frustration."""
+        breakdown = RiskBreakdown(
+            package_name="test",
+            ecosystem="npm",
+            maintainer_concentration=95,
+            commits_last_year=2,
+            final_score=100,
+            protective_factors=ProtectiveFactors(
+                frustration_score=15, takeover_risk_score=20
+            ),
+        )
+
+        recs = self.scorer.generate_recommendations(breakdown)
+
+        assert recs[0].startswith("ALERT:")
+        assert recs[1].startswith("HIGH PRIORITY:")
+        assert recs[2].startswith("URGENT:")
+        assert recs[3].startswith("IMMEDIATE:")
+
 
 class TestHistoricalScoring:
     """Regression tests for historical scoring behavior."""
@@ -396,3 +416,50 @@ class TestCachedBreakdownRebuild:
         assert breakdown.elephant_factor == 1
         assert breakdown.inactive_contributor_ratio == 0.5
         assert breakdown.factor_availability["visibility"] == "registry_downloads"
+
+    def test_rebuild_breakdown_round_trips_protective_factors(self):
+        protective = ProtectiveFactors(
+            reputation_score=-25,
+            funding_score=-15,
+            org_score=-15,
+            visibility_score=-10,
+            distributed_score=-10,
+            community_score=-5,
+            cii_score=-10,
+            frustration_score=15,
+            sentiment_score=5,
+            maturity_score=-15,
+            takeover_risk_score=20,
+            reputation_evidence="tier 1 maintainer",
+            funding_evidence="GitHub Sponsors",
+            frustration_evidence=["free_labor"],
+            sentiment_evidence=["negative tone"],
+            maturity_evidence="mature project",
+            takeover_risk_evidence="new maintainer",
+        )
+        original = RiskBreakdown(
+            package_name="pkg",
+            ecosystem="npm",
+            protective_factors=protective,
+            final_score=40,
+            risk_level=RiskLevel.MODERATE,
+        )
+        cached_score = type(
+            "CachedScore",
+            (),
+            {
+                "breakdown": original.to_dict(),
+                "risk_level": "MODERATE",
+                "base_risk": 60,
+                "activity_modifier": 0,
+                "final_score": 40,
+                "maintainer_concentration": 0,
+                "commits_last_year": 0,
+                "unique_contributors": 0,
+                "weekly_downloads": 0,
+            },
+        )()
+
+        breakdown = _rebuild_breakdown(cached_score, "pkg", "npm")
+
+        assert breakdown.protective_factors == protective
@@ -1,11 +1,12 @@
 """Tests for sentiment analysis."""
 
 import json
+import re
 from pathlib import Path
 
 import pytest
 
-from ossuary.sentiment.analyzer import SentimentAnalyzer
+from ossuary.sentiment.analyzer import FRUSTRATION_RULES, SentimentAnalyzer
 
 
 _CORPUS_PATH = Path(__file__).parent / "fixtures" / "sentiment_corpus.jsonl"
@@ -141,6 +142,21 @@ class TestAggregatedSentiment:
         result = self.analyzer.analyze_issues(issues)
         assert result.total_analyzed > 0
 
+    def test_analyze_issues_accepts_string_comments(self):
+        issues = [
+            {
+                "title": "Issue title",
+                "body": "",
+                "comments": [
+                    {"body": "A dict comment", "author": "alice"},
+                    "A bare string comment",
+                    {"body": ""},
+                ],
+            }
+        ]
+        result = self.analyzer.analyze_issues(issues)
+        assert result.total_analyzed == 3
+
     def test_analyze_issues_empty(self):
         result = self.analyzer.analyze_issues([])
         assert result.total_analyzed == 0
@@ -151,6 +167,46 @@ class TestAggregatedSentiment:
         result = self.analyzer.analyze_commits(messages)
         assert len(result.most_negative_texts) <= 5
 
+    def test_most_negative_texts_match_stable_sort(self):
+        messages = [
+            "This is terrible", "Awful bug", "This is terrible",
+            "Horrible awful terrible failure", "Bad", "Fine release",
+            "Awful bug", "Terrible, awful, horrible, bad", "Bad",
+        ]
+        result = self.analyzer.analyze_commits(messages)
+        scored = [
+            (m, self.analyzer.analyze_text(m).compound_score) for m in messages
+        ]
+        expected = sorted(
+            ((m, c) for m, c in scored if c < -0.3), key=lambda x: x[1]
+        )[:5]
+        assert result.most_negative_texts == expected
+
+    def test_frustration_evidence_keeps_first_ten(self):
+        messages = [f"I am tired of maintaining package {i}" for i in range(15)]
+        result = self.analyzer.analyze_texts(messages, source_type="commit")
+        assert result.frustration_count == 15
+        assert len(result.frustration_evidence) == 10
+
+    def test_most_negative_texts_are_truncated_previews(self):
+        long_text = "This is terrible awful horrible bad. " * 10
+        result = self.analyzer.analyze_commits([long_text, "Awful bug"])
+        previews = dict(result.most_negative_texts)
+        assert long_text[:100] + "..." in previews
+        assert "Awful bug" in previews
+
+    def test_analyzers_share_vader_and_compiled_rules(self):
+        other = SentimentAnalyzer()
+        assert other.vader is self.analyzer.vader
+        assert other.frustration_gate is self.analyzer.frustration_gate
+        assert other.frustration_rules is self.analyzer.frustration_rules
+
+    def test_duplicate_messages_scored_once_but_counted_each_time(self):
+        messages = ["Merge branch 'main'"] * 4 + ["Fix typo in docs"]
+        result = self.analyzer.analyze_commits(messages)
+        assert result.total_analyzed == 5
+        assert self.analyzer._text_scores.cache_info().currsize == 2
+
 
 class TestFrustrationTemplates:
     """v6.2: regex templates should catch paraphrases the v6.1 flat
@@ -497,3 +553,48 @@ class TestGovernanceLifecycleNotFrustration:
         assert result.frustration_detected, (
             f"emotional exit signal lost: {text!r}"
         )
+
+    def test_gate_agrees_with_per_rule_scan(self):
+        # The combined-alternation gate is only a shortcut: it must
+        # accept exactly the texts on which some individual rule fires.
+        for entry in _CORPUS:
+            text_lower = entry["text"].lower()
+            any_rule = any(
+                pattern.search(text_lower)
+                for _, pattern in self.analyzer.frustration_rules
+            )
+            gate = bool(self.analyzer.frustration_gate.search(text_lower))
+            assert gate == any_rule, entry["text"]
+
+    def test_labels_match_unoptimised_per_rule_scan(self):
+        # _detect_frustration starts each rule's search at the gate hit;
+        # the labels must equal a plain full-text scan of every rule.
+        for entry in _CORPUS:
+            text = entry["text"] + " -- and then: " + entry["text"].upper()
+            text_lower = text.lower()
+            expected = [
+                label
+                for label, pattern in self.analyzer.frustration_rules
+                if pattern.search(text_lower)
+            ]
+            detected, labels = self.analyzer._detect_frustration(text)
+            assert labels == expected, text
+            assert detected == bool(expected)
+
+    def test_rules_are_lowercase(self):
+        # Rules are compiled without re.IGNORECASE and matched against
+        # lowered text, so an uppercase literal could never match.
+        # Escapes such as \b, \S and \W are not literals.
+        for label, pattern in FRUSTRATION_RULES:
+            literals = re.sub(r"\\.", "", pattern)
+            assert literals == literals.lower(), label
+
+    def test_case_sensitive_rules_match_ignorecase_rules(self):
+        ignorecase = [
+            (label, re.compile(pattern, re.IGNORECASE))
+            for label, pattern in FRUSTRATION_RULES
+        ]
+        for entry in _CORPUS:
+            text = entry["text"] + " -- and then: " + entry["text"].upper()
+            expected = [label for label, pattern in ignorecase if pattern.search(text)]
+            assert self.analyzer._detect_frustration(text)[1] == expected, text
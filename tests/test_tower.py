@@ -3,27 +3,14 @@
 import math
 import os
 import re
-from unittest.mock import MagicMock, patch
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from ossuary.cli import _generate_tower_from_tree
-
-
-# ---------------------------------------------------------------------------
-# Helper: replicate the structural threat formula from cli.py
-# ---------------------------------------------------------------------------
-
-def compute_threat(concentration, contributors, commits, lifetime_commits, n_dependents):
-    """Replicate the structural threat formula for direct testing."""
-    fragility = (concentration / 100) / math.sqrt(max(contributors, 1))
-    if commits <= 1:
-        fragility = min(1.0, fragility * 1.5)
-    elif commits <= 5:
-        fragility = min(1.0, fragility * 1.2)
-    irreplaceability = min(1.0, math.log2(max(lifetime_commits, 10)) / 12)
-    tree_impact = 1 + n_dependents
-    return fragility * irreplaceability * tree_impact * 100
+from ossuary.cli import _structural_threat as compute_threat
 
 
 # ---------------------------------------------------------------------------
@@ -31,146 +18,83 @@ def compute_threat(concentration, contributors, commits, lifetime_commits, n_dep
 # ---------------------------------------------------------------------------
 
 def _make_score_mock(score, contributors, commits, concentration, lifetime_commits, lifetime_years):
-    """Create a mock Score object with the fields tower generation reads."""
-    mock = MagicMock()
-    mock.final_score = score
-    mock.risk_level = "CRITICAL" if score >= 80 else "HIGH" if score >= 60 else "MODERATE" if score >= 40 else "LOW" if score >= 20 else "VERY_LOW"
-    mock.unique_contributors = contributors
-    mock.commits_last_year = commits
-    mock.maintainer_concentration = concentration
-    mock.breakdown = {
-        "score": {
-            "components": {
-                "base_risk": score,
-                "protective_factors": {
-                    "maturity": {
-                        "evidence": f"Stable project: {lifetime_commits} commits over {lifetime_years} years, 10 lifetime contributors" if lifetime_commits > 0 else None,
+    """Create a stand-in Score object with the fields tower generation reads."""
+    return SimpleNamespace(
+        final_score=score,
+        risk_level="CRITICAL" if score >= 80 else "HIGH" if score >= 60 else "MODERATE" if score >= 40 else "LOW" if score >= 20 else "VERY_LOW",
+        unique_contributors=contributors,
+        commits_last_year=commits,
+        maintainer_concentration=concentration,
+        breakdown={
+            "score": {
+                "components": {
+                    "base_risk": score,
+                    "protective_factors": {
+                        "maturity": {
+                            "evidence": f"Stable project: {lifetime_commits} commits over {lifetime_years} years, 10 lifetime contributors" if lifetime_commits > 0 else None,
+                        }
                     }
                 }
             }
-        }
-    }
-    return mock
+        },
+    )
 
 
-def _mock_db(scores_map):
-    """Return a context-manager patch for session_scope that returns controlled scores.
+class _FakeQuery:
+    """``query(...).filter(...).order_by(...).first()`` answered from ``scores_map``.
 
-    scores_map: {package_name: (score, contributors, commits, concentration, lt_commits, lt_years)}
+    ``filter(Package.name == name, ...)`` yields a package with a fresh
+    id when ``name`` has scores; ``filter(Score.package_id == id)`` then
+    yields that package's score.
     """
-    mock_session = MagicMock()
-    pkg_id_counter = [0]
 
-    def query_side_effect(model):
-        chain = MagicMock()
+    def __init__(self, scores_map, pkg_ids):
+        self._scores_map = scores_map
+        self._pkg_ids = pkg_ids
+        self._result = None
 
-        def filter_side_effect(*args, **kwargs):
-            filter_chain = MagicMock()
+    def filter(self, *args):
+        for arg in args:
+            val = getattr(getattr(arg, "right", None), "value", None)
+            if isinstance(val, str) and val in self._scores_map:
+                pkg_id = len(self._pkg_ids) + 1
+                self._pkg_ids[pkg_id] = val
+                self._result = SimpleNamespace(id=pkg_id)
+                break
+            if isinstance(val, int) and val in self._pkg_ids:
+                self._result = _make_score_mock(*self._scores_map[self._pkg_ids[val]])
+        return self
 
-            # Try to extract the package name from the filter args
-            # The tower code does: Package.name == name
-            # In mock context, we look at the filter call args
-            for arg in args:
-                # SQLAlchemy BinaryExpression - try to get the right side
-                if hasattr(arg, 'right') and hasattr(arg.right, 'value'):
-                    name = arg.right.value
-                    if name in scores_map:
-                        pkg_mock = MagicMock()
-                        pkg_id_counter[0] += 1
-                        pkg_mock.id = pkg_id_counter[0]
-                        filter_chain.first.return_value = pkg_mock
-                        return filter_chain
+    def order_by(self, *args):
+        return self
 
-            # For Score queries - return the score mock
-            # The tower code chains: .filter(Score.package_id == pkg.id).order_by(...).first()
-            order_chain = MagicMock()
+    def first(self):
+        return self._result
 
-            # Find which package this is for by checking the pkg_id
-            def first_for_score():
-                # Get the last created package id
-                for name, data in scores_map.items():
-                    return _make_score_mock(*data)
-                return None
 
-            order_chain.first.return_value = None
-            filter_chain.order_by.return_value = order_chain
-            filter_chain.first.return_value = None
-            return filter_chain
+class _FakeSession:
+    """Session stand-in whose queries read from ``scores_map``."""
 
-        chain.filter.side_effect = filter_side_effect
-        return chain
+    def __init__(self, scores_map):
+        self._scores_map = scores_map
+        self._pkg_ids = {}
 
-    mock_session.query.side_effect = query_side_effect
-
-    return mock_session
+    def query(self, model):
+        return _FakeQuery(self._scores_map, self._pkg_ids)
 
 
 def _generate_tower_with_mock_db(adj, root, scores_map, tmp_path, ecosystem="npm", max_width=1200):
-    """Run _generate_tower_from_tree with mocked DB, return SVG content."""
+    """Run _generate_tower_from_tree with a fake DB, return SVG content.
+
+    scores_map: {package_name: (score, contributors, commits, concentration, lt_commits, lt_years)}
+    """
     output = str(tmp_path / "test_tower.svg")
 
-    # Build mock session that returns the right Score for each package
-    mock_session = MagicMock()
-
-    # Store package name → score data mapping for lookup
-    pkg_ids = {}
-    id_counter = [0]
-
-    def make_query(model):
-        chain = MagicMock()
-
-        def do_filter(*args, **kwargs):
-            result = MagicMock()
-
-            # Detect what we're filtering on
-            # For Package: filter(Package.name == name, Package.ecosystem == eco)
-            # For Score: filter(Score.package_id == pkg.id)
-            name_found = None
-            pkg_id_found = None
-
-            for arg in args:
-                if hasattr(arg, 'right') and hasattr(arg.right, 'value'):
-                    val = arg.right.value
-                    if isinstance(val, str) and val in scores_map:
-                        name_found = val
-                    elif isinstance(val, str) and val in ("npm", "pypi"):
-                        pass  # ecosystem filter, ignore
-                    elif isinstance(val, int):
-                        pkg_id_found = val
-
-            if name_found:
-                # Package query
-                id_counter[0] += 1
-                pkg_mock = MagicMock()
-                pkg_mock.id = id_counter[0]
-                pkg_ids[id_counter[0]] = name_found
-                result.first.return_value = pkg_mock
-            elif pkg_id_found and pkg_id_found in pkg_ids:
-                # Score query
-                name = pkg_ids[pkg_id_found]
-                score_mock = _make_score_mock(*scores_map[name])
-                order_result = MagicMock()
-                order_result.first.return_value = score_mock
-                result.order_by.return_value = order_result
-                result.first.return_value = score_mock
-            else:
-                result.first.return_value = None
-                order_result = MagicMock()
-                order_result.first.return_value = None
-                result.order_by.return_value = order_result
-
-            return result
-
-        chain.filter.side_effect = do_filter
-        return chain
-
-    mock_session.query.side_effect = make_query
-
-    mock_scope = MagicMock()
-    mock_scope.__enter__ = MagicMock(return_value=mock_session)
-    mock_scope.__exit__ = MagicMock(return_value=False)
-
-    with patch("ossuary.db.session.session_scope", return_value=mock_scope):
+    @contextmanager
+    def fake_scope():
+        yield _FakeSession(scores_map)
+
+    with patch("ossuary.db.session.session_scope", fake_scope):
         _generate_tower_from_tree(adj, root, ecosystem, output, root, max_width)
 
     with open(output) as f:
@@ -321,6 +245,18 @@ class TestTowerLayerAssignment:
         # shared text Y should be greater than the second layer Y
         assert shared_y > y_positions[1]
 
+    def test_stacked_diamonds_layered_by_longest_path(self, tmp_path):
+        """Shared subtrees are settled once, not re-walked per path."""
+        adj = {}
+        for i in range(25):
+            adj[f"top{i}"] = [f"left{i}", f"right{i}"]
+            adj[f"left{i}"] = [f"top{i + 1}"]
+            adj[f"right{i}"] = [f"top{i + 1}"]
+        adj["top25"] = []
+        svg = _generate_tower_with_mock_db(adj, "top0", {}, tmp_path)
+        y_positions = set(re.findall(r'<rect[^>]+ y="([^"]+)"', svg))
+        assert len(y_positions) == 51
+
     def test_cycle_no_infinite_loop(self, tmp_path):
         """Cycles in the dependency graph don't cause infinite loops."""
         adj = {"A": ["B"], "B": ["A"]}